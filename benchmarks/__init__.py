@@ -0,0 +1,12 @@
+"""
+Benchmarks de rendimiento. Se ejecutan como módulos desde la raíz del
+proyecto, por ejemplo:
+
+    python -m benchmarks.bench_table_allocation
+"""
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "restaurante.settings")
+django.setup()
@@ -0,0 +1,70 @@
+"""
+Benchmark de la carga de BD por request de un carrito guardado en la
+sesión de la BD frente al carrito en cookie firmada (menu_app.cart).
+Simula visitas que leen el carrito y agregan un producto. Usa una base
+de datos de prueba temporal.
+
+Uso:
+    python -m benchmarks.bench_cart
+"""
+import time
+
+from django.contrib.sessions.backends.db import SessionStore
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext, setup_test_environment
+
+from menu_app.cart import Cart
+
+REQUESTS = 1000
+
+
+def session_cart(factory, session_key):
+    """Un request que lee el carrito de la sesión y lo vuelve a guardar."""
+    session = SessionStore(session_key)
+    lines = session.get("cart", {})
+    lines["1"] = lines.get("1", 0) + 1
+    session["cart"] = lines
+    session.save()
+    return session.session_key
+
+
+def cookie_cart(factory, cookie):
+    """Un request que lee el carrito de la cookie y la vuelve a firmar."""
+    request = factory.get("/")
+    if cookie:
+        request.COOKIES["cart"] = cookie
+    cart = Cart.from_request(request)
+    cart.add(1)
+    response = HttpResponse()
+    cart.save(response)
+    return response.cookies["cart"].value
+
+
+def measure(name, step):
+    factory = RequestFactory()
+    state = None
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            state = step(factory, state)
+        elapsed = time.perf_counter() - started
+    print(
+        f"{name:<16} {len(queries) / REQUESTS:6.1f} consultas/request"
+        f"  {elapsed / REQUESTS * 1e6:8.1f} µs/request"
+    )
+
+
+def main():
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        measure("sesión en BD", session_cart)
+        measure("cookie firmada", cookie_cart)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
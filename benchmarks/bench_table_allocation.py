@@ -0,0 +1,58 @@
+"""
+Benchmark del asignador de mesas para una noche de 500 reservas.
+
+Uso:
+    python -m benchmarks.bench_table_allocation
+"""
+import time
+
+import numpy as np
+
+from menu_app.allocation import TableAllocator
+
+BOOKINGS = 500
+TABLES = 60
+SLOTS = 10
+SLOT_SECONDS = 3600
+
+
+def build(seed=0):
+    rng = np.random.default_rng(seed)
+    sizes = rng.choice([1, 2, 2, 2, 3, 4, 4, 5, 6, 8, 10], size=BOOKINGS)
+    slot_of_booking = rng.integers(0, SLOTS, size=BOOKINGS)
+    times = slot_of_booking * SLOT_SECONDS + 60.0
+    times[rng.random(BOOKINGS) < 0.2] = np.nan  # reservas sin hora
+
+    capacities = rng.choice([2, 2, 4, 4, 4, 6, 8, 10], size=TABLES)
+    table_index = np.tile(np.arange(TABLES), SLOTS)
+    slot_index = np.repeat(np.arange(SLOTS), TABLES)
+    return TableAllocator(
+        booking_ids=np.arange(1, BOOKINGS + 1),
+        sizes=sizes,
+        times=times,
+        resource_ids=np.arange(1, TABLES * SLOTS + 1),
+        capacities=capacities[table_index],
+        slot_ids=slot_index + 1,
+        starts=slot_index * SLOT_SECONDS,
+        ends=(slot_index + 1) * SLOT_SECONDS,
+    )
+
+
+def main():
+    started = time.perf_counter()
+    allocator = build()
+    built = time.perf_counter()
+    covers = allocator.solve()
+    solved = time.perf_counter()
+    allocator.update_booking(1, party_size=10)
+    replanned = time.perf_counter()
+
+    print(f"reservas: {BOOKINGS}, recursos: {TABLES * SLOTS}")
+    print(f"comensales sentados: {covers} de {int(allocator.sizes.sum())}")
+    print(f"armado:      {(built - started) * 1000:8.1f} ms")
+    print(f"solve:       {(solved - built) * 1000:8.1f} ms")
+    print(f"re-plan 1:   {(replanned - solved) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Microbenchmark del tiempo de render de cada página.
+
+Uso (comparar desarrollo y perfil de producción):
+    python -m benchmarks.bench_templates
+    DJANGO_ENV=production DJANGO_ALLOWED_HOSTS=testserver DJANGO_METRICS_DIR=/tmp/bench-metrics \
+        python -m benchmarks.bench_templates
+"""
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+
+from menu_app.models import Product
+
+ITERATIONS = 500
+
+
+def products(count=30):
+    return [
+        Product(
+            pk=i,
+            name=f"Plato {i}",
+            description="Descripción del plato",
+            price=Decimal("100.00") + i,
+            quantity=i % 3,
+            image=f"products/plato_{i}.jpg",
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+PAGES = [
+    ("home", "home.html", "/", lambda: {}),
+    ("menu", "menu_app/menu.html", "/menu/", lambda: {"menu_items": products()}),
+    ("detalle", "menu_app/product_detail.html", "/menu/1/", lambda: {"product": products(1)[0]}),
+]
+
+
+def main():
+    factory = RequestFactory()
+    print(f"perfil: {'producción' if settings.PRODUCTION else 'desarrollo'}, {ITERATIONS} renders por página")
+    for name, template, path, make_context in PAGES:
+        request = factory.get(path)
+        context = make_context()
+
+        started = time.perf_counter()
+        render_to_string(template, context, request=request)
+        first = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(ITERATIONS):
+            render_to_string(template, context, request=request)
+        warm = (time.perf_counter() - started) / ITERATIONS
+
+        print(f"{name:<10} primero: {first * 1000:7.2f} ms   promedio: {warm * 1000:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
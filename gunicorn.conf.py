@@ -0,0 +1,29 @@
+import os
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'restaurante.settings')
+
+from menu_app import metrics  # noqa: E402
+
+
+# -------------------------------------------------------
+# gunicorn.conf.py
+# Configuración de Gunicorn (se lee sola desde el
+# directorio del proyecto). Mantiene METRICS_DIR con un
+# archivo por worker vivo: lo vacía al arrancar, cada worker
+# escribe sus totales al salir y el maestro los pasa al
+# acumulado de los workers que terminaron.
+# -------------------------------------------------------
+
+wsgi_app = 'restaurante.wsgi:application'
+
+
+def on_starting(server):
+    metrics.clear()
+
+
+def worker_exit(server, worker):
+    metrics.flush(force=True)
+
+
+def child_exit(server, worker):
+    metrics.remove_process(worker.pid)
@@ -1,11 +1,54 @@
-from django.contrib import admin
-from .models import Product
+from django.contrib import admin, messages
+from django.template.response import TemplateResponse
+from django.urls import path
+
+from .models import Booking, Product
 
 
 class MenuAdmin(admin.ModelAdmin):
     list_display = ("name", "description", "price", "quantity")
     search_fields = ("name", "price")
     list_filter = ("price", "quantity")
+    change_list_template = "admin/menu_app/product/change_list.html"
+
+    def get_urls(self):
+        urls = [
+            path(
+                "reorder/",
+                self.admin_site.admin_view(self.reorder_view),
+                name="menu_app_product_reorder",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def reorder_view(self, request):
+        # numpy se importa recién cuando se pide el pronóstico.
+        from . import forecasting
+
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": "Sugerencias de reposición",
+            "suggestions": forecasting.reorder_suggestions(),
+        }
+        return TemplateResponse(request, "admin/menu_app/product/reorder.html", context)
+
+
+class BookingAdmin(admin.ModelAdmin):
+    list_display = ("code", "user", "date", "time", "party_size", "approved", "approval_date")
+    list_filter = ("approved", "date")
+    search_fields = ("code", "user__username")
+    actions = ["approve"]
+
+    @admin.action(description="Aprobar y notificar las reservas seleccionadas")
+    def approve(self, request, queryset):
+        approved, skipped = Booking.bulk_approve(queryset)
+        self.message_user(
+            request,
+            f"{approved} reservas aprobadas, {skipped} ya estaban aprobadas.",
+            messages.SUCCESS,
+        )
 
 
 admin.site.register(Product, MenuAdmin)
+admin.site.register(Booking, BookingAdmin)
@@ -0,0 +1,205 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from . import metrics
+from .models import Booking, TableTimeSlot, TimeSlot
+
+
+# -------------------------------------------------------
+# allocation.py
+# Asignación de mesas para una noche completa.
+# Cada reserva ocupa una combinación mesa + intervalo
+# (TableTimeSlot). Se maximiza la cantidad de comensales
+# sentados: como el peso de cada reserva es su party_size,
+# alcanza con el greedy de matroides (reservas de mayor a
+# menor, agregándolas si existe un camino aumentante en el
+# grafo bipartito reserva -> mesa/intervalo).
+# Se asume que los intervalos de una misma mesa no se superponen.
+# -------------------------------------------------------
+
+class TableAllocator:
+    """
+    Asignador de reservas a mesas/intervalos sobre arrays.
+
+    Atributos:
+      - booking_ids, sizes, times: reservas (times en segundos epoch, NaN sin hora)
+      - resource_ids, capacities, slot_ids, starts, ends: combinaciones mesa/intervalo
+      - match_booking: índice de recurso asignado a cada reserva (-1 si no tiene)
+      - match_resource: índice de reserva asignada a cada recurso (-1 si está libre)
+    """
+
+    def __init__(self, booking_ids, sizes, times, resource_ids, capacities, slot_ids, starts, ends):
+        self.booking_ids = np.asarray(booking_ids, dtype=np.int64)
+        self.sizes = np.asarray(sizes, dtype=np.int64)
+        self.times = np.asarray(times, dtype=float)
+        self.resource_ids = np.asarray(resource_ids, dtype=np.int64)
+        self.capacities = np.asarray(capacities, dtype=np.int64)
+        self.slot_ids = np.asarray(slot_ids, dtype=np.int64)
+        self.starts = np.asarray(starts, dtype=float)
+        self.ends = np.asarray(ends, dtype=float)
+
+        # Los candidatos de cada reserva se ordenan por capacidad para
+        # preferir la mesa más chica en la que entra el grupo.
+        self._by_capacity = np.argsort(self.capacities, kind='stable')
+        self._candidates = [self._compute_candidates(b) for b in range(len(self.booking_ids))]
+        self._index = {booking_id: b for b, booking_id in enumerate(self.booking_ids.tolist())}
+        self.match_booking = np.full(len(self.booking_ids), -1, dtype=np.int64)
+        self.match_resource = np.full(len(self.resource_ids), -1, dtype=np.int64)
+
+    @classmethod
+    def for_date(cls, day):
+        """Carga las reservas y las mesas/intervalos de `day` con dos consultas."""
+        bookings = list(
+            Booking.objects.filter(date=day).order_by('pk').values_list('pk', 'party_size', 'time')
+        )
+        tz = timezone.get_current_timezone()
+        # Rango en lugar de start__date para que la consulta use el índice de start.
+        midnight = datetime.combine(day, datetime.min.time(), tzinfo=tz)
+        resources = list(
+            TableTimeSlot.objects.filter(
+                timeslot__start__gte=midnight, timeslot__start__lt=midnight + timedelta(days=1)
+            )
+            .order_by('pk')
+            .values_list('pk', 'table__capacity', 'timeslot_id', 'timeslot__start', 'timeslot__end')
+        )
+        times = [
+            datetime.combine(day, time, tzinfo=tz).timestamp() if time else np.nan
+            for _, _, time in bookings
+        ]
+        return cls(
+            [pk for pk, _, _ in bookings],
+            [size for _, size, _ in bookings],
+            times,
+            [row[0] for row in resources],
+            [row[1] for row in resources],
+            [row[2] for row in resources],
+            [row[3].timestamp() for row in resources],
+            [row[4].timestamp() for row in resources],
+        )
+
+    def _compute_candidates(self, b):
+        order = self._by_capacity
+        fits = self.capacities[order] >= self.sizes[b]
+        if not np.isnan(self.times[b]):
+            fits &= (self.starts[order] <= self.times[b]) & (self.times[b] < self.ends[order])
+        return order[fits]
+
+    def _assign(self, b, r):
+        self.match_booking[b] = r
+        self.match_resource[r] = b
+
+    def _unassign(self, b):
+        r = self.match_booking[b]
+        if r >= 0:
+            self.match_resource[r] = -1
+            self.match_booking[b] = -1
+        return r
+
+    def _place(self, b):
+        """Ubica la reserva `b` en un recurso libre o por un camino aumentante."""
+        candidates = self._candidates[b]
+        free = candidates[self.match_resource[candidates] < 0]
+        if len(free):
+            self._assign(b, free[0])
+            return True
+
+        visited = np.zeros(len(self.resource_ids), dtype=bool)
+        parent = {}
+        queue = [b]
+        while queue:
+            x = queue.pop(0)
+            candidates = self._candidates[x]
+            candidates = candidates[~visited[candidates]]
+            visited[candidates] = True
+            for r in candidates.tolist():
+                parent[r] = x
+                owner = self.match_resource[r]
+                if owner < 0:
+                    # Invertir el camino: cada reserva toma el recurso
+                    # que la descubrió y libera el anterior.
+                    while True:
+                        x = parent[r]
+                        previous = self.match_booking[x]
+                        self._assign(x, r)
+                        if x == b:
+                            return True
+                        r = previous
+                queue.append(owner)
+        return False
+
+    def _fill_unseated(self):
+        for b in np.argsort(-self.sizes, kind='stable').tolist():
+            if self.match_booking[b] < 0:
+                self._place(b)
+
+    def solve(self):
+        """Calcula la asignación completa y devuelve los comensales sentados."""
+        self.match_booking[:] = -1
+        self.match_resource[:] = -1
+        with metrics.allocation_duration.time():
+            for b in np.argsort(-self.sizes, kind='stable').tolist():
+                self._place(b)
+        metrics.bookings_seated.inc(int((self.match_booking >= 0).sum()))
+        return self.seated_covers()
+
+    def update_booking(self, booking_id, party_size=None, time=None):
+        """
+        Vuelve a planificar solo la reserva `booking_id` tras un cambio de
+        tamaño u hora (time en segundos epoch, NaN para quitarla). Si no
+        entra, desplaza a la reserva sentada más chica que la bloquee.
+        """
+        b = self._index[booking_id]
+        self._unassign(b)
+        if party_size is not None:
+            self.sizes[b] = party_size
+        if time is not None:
+            self.times[b] = time
+        self._candidates[b] = self._compute_candidates(b)
+        self._fill_unseated()
+
+        if self.match_booking[b] < 0:
+            seated = np.flatnonzero((self.match_booking >= 0) & (self.sizes < self.sizes[b]))
+            for victim in seated[np.argsort(self.sizes[seated], kind='stable')].tolist():
+                r = self._unassign(victim)
+                if self._place(b):
+                    self._place(victim)
+                    break
+                self._assign(victim, r)
+        return self.seated_covers()
+
+    def seated_covers(self):
+        return int(self.sizes[self.match_booking >= 0].sum())
+
+    def assignments(self):
+        """Diccionario booking_id -> TableTimeSlot id de las reservas sentadas."""
+        seated = np.flatnonzero(self.match_booking >= 0)
+        return dict(zip(
+            self.booking_ids[seated].tolist(),
+            self.resource_ids[self.match_booking[seated]].tolist(),
+        ))
+
+    def save(self):
+        """
+        Guarda la asignación en TableTimeSlot.booking y marca como completos
+        los intervalos sin mesas libres, con un número fijo de consultas.
+        """
+        used = self.match_resource >= 0
+        slots = np.unique(self.slot_ids)
+        free_per_slot = np.bincount(
+            np.searchsorted(slots, self.slot_ids[~used]), minlength=len(slots)
+        )
+        with transaction.atomic():
+            TableTimeSlot.objects.filter(pk__in=self.resource_ids.tolist()).update(booking=None)
+            TableTimeSlot.objects.bulk_update(
+                [
+                    TableTimeSlot(pk=pk, booking_id=booking_id)
+                    for booking_id, pk in self.assignments().items()
+                ],
+                ['booking'],
+                batch_size=500,
+            )
+            TimeSlot.objects.filter(pk__in=slots[free_per_slot == 0].tolist()).update(is_full=True)
+            TimeSlot.objects.filter(pk__in=slots[free_per_slot > 0].tolist()).update(is_full=False)
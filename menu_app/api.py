@@ -0,0 +1,247 @@
+import base64
+import json
+import re
+from decimal import Decimal
+
+from django.core.files.storage import default_storage
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.http import HttpResponse
+from django.views import View
+from django.views.decorators.http import condition
+
+from . import catalog_version, stock
+from .models import CatalogChange, Category, Product
+
+
+# -------------------------------------------------------
+# api.py
+# API JSON de solo lectura del menú para la app móvil y los
+# kioscos. Las filas se leen con values() sin instanciar
+# modelos y se serializan con el encoder en C de json; los
+# precios Decimal salen como texto ("10.50") para no perder
+# precisión. Las respuestas del catálogo llevan como ETag la
+# versión del catálogo: un GET condicional sin cambios
+# responde 304 sin tocar la BD. Los pedidos solo cambian esa
+# versión cuando un producto se agota o vuelve a tener stock,
+# así que "quantity" puede quedar atrasado en esas respuestas;
+# el stock al día se lee de /availability, que no usa ETag.
+# -------------------------------------------------------
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+# Solo dígitos ASCII (isdigit acepta '²', que int() rechaza) y dentro de
+# un entero de 64 bits.
+ID_RE = re.compile(r'[0-9]{1,18}')
+
+# Campo público -> columna o anotación de values()
+PRODUCT_FIELDS = {
+    'id': 'id',
+    'name': 'name',
+    'description': 'description',
+    'price': 'price',
+    'quantity': 'quantity',
+    'category': 'category_id',
+    'image': 'image',
+    'available': 'available',
+}
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f'{type(value).__name__} no es serializable')
+
+
+def json_response(data, status=200):
+    body = json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=_default)
+    return HttpResponse(body, status=status, content_type='application/json')
+
+
+def encode_cursor(name, pk):
+    return base64.urlsafe_b64encode(json.dumps([name, pk]).encode()).decode().rstrip('=')
+
+
+def is_id(value):
+    return ID_RE.fullmatch(value) is not None
+
+
+def decode_cursor(cursor):
+    """Devuelve (name, pk) o None si el cursor no es válido."""
+    try:
+        name, pk = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(name, str) or not isinstance(pk, int):
+        return None
+    return name, pk
+
+
+def product_values(queryset, fields, extra=()):
+    """values() de `queryset` con las columnas de los campos públicos `fields`."""
+    if 'available' in fields:
+        queryset = queryset.annotate(
+            available=ExpressionWrapper(Q(quantity__gt=0), output_field=BooleanField())
+        )
+    return queryset.values(*{PRODUCT_FIELDS[field] for field in fields}, *extra)
+
+
+def serialize_product(row, fields):
+    item = {field: row[PRODUCT_FIELDS[field]] for field in fields}
+    if item.get('image'):
+        item['image'] = default_storage.url(item['image'])
+    return item
+
+
+def _etag(request, *args, **kwargs):
+    return catalog_version.current()
+
+
+class CatalogAPIView(View):
+    """Base de las vistas de la API: GET condicional por versión del catálogo."""
+
+    def dispatch(self, request, *args, **kwargs):
+        response = condition(etag_func=_etag)(super().dispatch)(request, *args, **kwargs)
+        # Los clientes pueden guardar la respuesta pero deben revalidarla.
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+
+class ProductListAPIView(CatalogAPIView):
+    """
+    Lista de productos ordenada por nombre.
+
+    Parámetros:
+      - fields: campos separados por coma (por defecto, todos)
+      - category: id de categoría
+      - limit: productos por página (máximo MAX_LIMIT)
+      - after: cursor devuelto en "next" por la página anterior
+    """
+
+    def get(self, request):
+        errors = {}
+        requested = request.GET.get('fields')
+        fields = requested.split(',') if requested else list(PRODUCT_FIELDS)
+        unknown = [field for field in fields if field not in PRODUCT_FIELDS]
+        if unknown:
+            errors['fields'] = f"Campos desconocidos: {', '.join(unknown)}"
+        try:
+            limit = min(max(int(request.GET.get('limit', DEFAULT_LIMIT)), 1), MAX_LIMIT)
+        except ValueError:
+            errors['limit'] = 'El límite debe ser un número'
+        cursor = request.GET.get('after')
+        position = decode_cursor(cursor) if cursor else None
+        if cursor and position is None:
+            errors['after'] = 'Cursor inválido'
+        category = request.GET.get('category')
+        if category is not None and not is_id(category):
+            errors['category'] = 'La categoría debe ser un id'
+        if errors:
+            return json_response({'errors': errors}, status=400)
+
+        queryset = Product.objects.order_by('name', 'id')
+        if category is not None:
+            queryset = queryset.filter(category_id=int(category))
+        if position is not None:
+            name, pk = position
+            queryset = queryset.filter(Q(name__gt=name) | Q(name=name, id__gt=pk))
+        # name e id se leen siempre para armar el cursor.
+        rows = list(product_values(queryset, fields, extra=('id', 'name'))[:limit + 1])
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        results = [serialize_product(row, fields) for row in rows]
+
+        next_url = None
+        if has_next:
+            params = request.GET.copy()
+            params['after'] = encode_cursor(rows[-1]['name'], rows[-1]['id'])
+            next_url = f'{request.path}?{params.urlencode()}'
+        return json_response({'results': results, 'next': next_url})
+
+
+class CategoryListAPIView(CatalogAPIView):
+    """Categorías activas ordenadas por nombre."""
+
+    def get(self, request):
+        categories = list(
+            Category.objects.filter(is_active=True).order_by('name', 'id').values('id', 'name', 'description')
+        )
+        return json_response({'results': categories})
+
+
+class AvailabilityAPIView(View):
+    """
+    Stock de cada producto como {id: cantidad}, para refrescos frecuentes.
+    Cambia con cada pedido, así que no se responde con la versión del
+    catálogo como ETag.
+    Con ?ids=1,2,3 (hasta MAX_LIMIT) se lee de los contadores de stock.py
+    sin consultar la tabla de productos; lo usan las páginas cacheadas
+    para completar las etiquetas de disponibilidad.
+    """
+
+    def get(self, request):
+        ids = request.GET.get('ids')
+        if ids is None:
+            rows = Product.objects.order_by().values_list('id', 'quantity')
+        else:
+            ids = ids.split(',')
+            if not all(is_id(pk) for pk in ids) or len(ids) > MAX_LIMIT:
+                return json_response(
+                    {'errors': {'ids': f'Hasta {MAX_LIMIT} ids numéricos separados por coma'}}, status=400
+                )
+            rows = stock.get_many(ids).items()
+        response = json_response({'stock': {str(pk): quantity for pk, quantity in rows}})
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+
+class CatalogChangesAPIView(View):
+    """
+    Cambios del catálogo posteriores a ?since= (0 para todo el catálogo).
+
+    Devuelve el estado actual de los productos y categorías modificados,
+    los ids borrados, la última secuencia incluida ("seq", el próximo
+    ?since=) y "more" si quedaron cambios para otro pedido.
+    """
+    limit = 1000
+
+    def get(self, request):
+        since = request.GET.get('since', '0')
+        if not is_id(since):
+            return json_response({'errors': {'since': 'since debe ser un número'}}, status=400)
+
+        changes = list(
+            CatalogChange.objects.filter(id__gt=int(since))
+            .order_by('id')
+            .values_list('id', 'model', 'object_id', 'action')[:self.limit + 1]
+        )
+        more = len(changes) > self.limit
+        changes = changes[:self.limit]
+
+        # Solo importa el último cambio de cada objeto.
+        latest = {(model, object_id): action for _, model, object_id, action in changes}
+        upserts = {'product': set(), 'category': set()}
+        deleted = {'product': set(), 'category': set()}
+        for (model, object_id), action in latest.items():
+            (upserts if action == CatalogChange.UPSERT else deleted)[model].add(object_id)
+
+        products = [
+            serialize_product(row, PRODUCT_FIELDS)
+            for row in product_values(Product.objects.filter(pk__in=upserts['product']).order_by('id'), PRODUCT_FIELDS)
+        ]
+        categories = list(
+            Category.objects.filter(pk__in=upserts['category']).order_by('id').values('id', 'name', 'description', 'is_active')
+        )
+        # Un objeto que ya no existe se informa como borrado.
+        deleted['product'] |= upserts['product'] - {row['id'] for row in products}
+        deleted['category'] |= upserts['category'] - {row['id'] for row in categories}
+
+        return json_response({
+            'seq': changes[-1][0] if changes else int(since),
+            'more': more,
+            'products': products,
+            'categories': categories,
+            'deleted': {
+                'products': sorted(deleted['product']),
+                'categories': sorted(deleted['category']),
+            },
+        })
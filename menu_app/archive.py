@@ -0,0 +1,186 @@
+from datetime import timedelta
+from itertools import chain
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import (
+    ArchivedNotification,
+    ArchivedOrder,
+    ArchivedRating,
+    Notification,
+    Order,
+    OrderProduct,
+    OrderStateLog,
+    Rating,
+    UserNotification,
+)
+
+
+# -------------------------------------------------------
+# archive.py
+# Archivado de pedidos, calificaciones y notificaciones
+# anteriores a ARCHIVE_AFTER_DAYS. Cada lote se copia a la
+# tabla de archivo y se borra de la principal en la misma
+# transacción. Solo se archivan pedidos en estado final.
+# Las funciones de lectura combinan ambas tablas para que
+# el historial se consulte igual que antes.
+# -------------------------------------------------------
+
+FINAL_STATES = [state for state, targets in Order.TRANSITIONS.items() if not targets]
+
+
+def horizon(days=None):
+    """Fecha y hora a partir de la cual las filas se consideran activas."""
+    days = settings.ARCHIVE_AFTER_DAYS if days is None else days
+    return timezone.now() - timedelta(days=days)
+
+
+def archived_until():
+    """
+    Último día con pedidos archivados, o None si no hay ninguno. Hasta esa
+    fecha Order / OrderProduct ya no tienen todos los pedidos del día.
+    """
+    return ArchivedOrder.objects.aggregate(day=Max('buy_date'))['day']
+
+
+def _batches(queryset, batch_size):
+    """Recorre los pks de `queryset` de a `batch_size`, volviendo a consultar tras cada lote."""
+    while True:
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return
+        yield pks
+
+
+def archive_orders(before, batch_size=1000):
+    """Archiva los pedidos finalizados comprados antes de `before` (fecha)."""
+    archived = 0
+    queryset = Order.objects.filter(buy_date__lt=before, state__in=FINAL_STATES)
+    for pks in _batches(queryset, batch_size):
+        with transaction.atomic():
+            products = {}
+            quantities = {}
+            prices = {}
+            for order_id, product_id, quantity, unit_price in OrderProduct.objects.filter(
+                order_id__in=pks
+            ).order_by('pk').values_list('order_id', 'product_id', 'quantity', 'unit_price'):
+                products.setdefault(order_id, []).append(product_id)
+                quantities.setdefault(order_id, []).append(quantity)
+                prices.setdefault(order_id, []).append(str(unit_price))
+            logs = {}
+            for order_id, from_state, to_state, created_at in (
+                OrderStateLog.objects.filter(order_id__in=pks)
+                .order_by('created_at', 'pk')
+                .values_list('order_id', 'from_state', 'to_state', 'created_at')
+            ):
+                logs.setdefault(order_id, []).append([from_state, to_state, created_at.isoformat()])
+
+            ArchivedOrder.objects.bulk_create(
+                ArchivedOrder(
+                    **row,
+                    product_ids=products.get(row['id'], []),
+                    quantities=quantities.get(row['id'], []),
+                    unit_prices=prices.get(row['id'], []),
+                    state_log=logs.get(row['id'], []),
+                )
+                for row in Order.objects.filter(pk__in=pks).values('id', 'user_id', 'buy_date', 'code', 'amount', 'state')
+            )
+            OrderProduct.objects.filter(order_id__in=pks).delete()
+            OrderStateLog.objects.filter(order_id__in=pks).delete()
+            Order.objects.filter(pk__in=pks).delete()
+        archived += len(pks)
+    return archived
+
+
+def archive_ratings(before, batch_size=1000):
+    """Archiva las calificaciones creadas antes de `before`."""
+    archived = 0
+    queryset = Rating.objects.filter(created_at__lt=before)
+    for pks in _batches(queryset, batch_size):
+        with transaction.atomic():
+            ArchivedRating.objects.bulk_create(
+                ArchivedRating(**row)
+                for row in Rating.objects.filter(pk__in=pks).values(
+                    'id', 'user_id', 'product_id', 'title', 'text', 'rating', 'created_at'
+                )
+            )
+            Rating.objects.filter(pk__in=pks).delete()
+        archived += len(pks)
+    return archived
+
+
+def archive_notifications(before, batch_size=1000):
+    """Archiva las notificaciones creadas antes de `before` con sus destinatarios."""
+    archived = 0
+    Recipient = ArchivedNotification.users.through
+    queryset = Notification.objects.filter(created_at__lt=before)
+    for pks in _batches(queryset, batch_size):
+        with transaction.atomic():
+            ArchivedNotification.objects.bulk_create(
+                ArchivedNotification(**row)
+                for row in Notification.objects.filter(pk__in=pks).values(
+                    'id', 'title', 'message', 'created_at', 'is_read'
+                )
+            )
+            Recipient.objects.bulk_create(
+                Recipient(archivednotification_id=notification_id, user_id=user_id)
+                for notification_id, user_id in UserNotification.objects.filter(
+                    notification_id__in=pks
+                ).values_list('notification_id', 'user_id')
+            )
+            UserNotification.objects.filter(notification_id__in=pks).delete()
+            Notification.objects.filter(pk__in=pks).delete()
+        archived += len(pks)
+    return archived
+
+
+def archive_all(days=None, batch_size=1000):
+    """Archiva todo lo anterior al horizonte. Devuelve la cantidad por modelo."""
+    before = horizon(days)
+    return {
+        'orders': archive_orders(timezone.localdate(before), batch_size),
+        'ratings': archive_ratings(before, batch_size),
+        'notifications': archive_notifications(before, batch_size),
+    }
+
+
+# -------------------------------------------------------
+# Lectura del historial completo (tablas activas + archivo)
+# -------------------------------------------------------
+
+def find_order(code):
+    """Busca un pedido por código en la tabla activa y, si no está, en el archivo."""
+    return (
+        Order.objects.filter(code=code).first()
+        or ArchivedOrder.objects.filter(code=code).first()
+    )
+
+
+def orders_for(user):
+    """Pedidos del usuario, activos y archivados, del más reciente al más viejo."""
+    return sorted(
+        chain(Order.objects.filter(user=user), ArchivedOrder.objects.filter(user=user)),
+        key=lambda order: (order.buy_date, order.pk),
+        reverse=True,
+    )
+
+
+def ratings_for(product):
+    """Calificaciones del producto, activas y archivadas, de la más nueva a la más vieja."""
+    return sorted(
+        chain(Rating.objects.filter(product=product), ArchivedRating.objects.filter(product=product)),
+        key=lambda rating: rating.created_at,
+        reverse=True,
+    )
+
+
+def notifications_for(user):
+    """Notificaciones del usuario, activas y archivadas, de la más nueva a la más vieja."""
+    return sorted(
+        chain(user.notifications.all(), user.archived_notifications.all()),
+        key=lambda notification: notification.created_at,
+        reverse=True,
+    )
@@ -0,0 +1,110 @@
+from django.core import signing
+
+from .models import Order, Product
+
+
+# -------------------------------------------------------
+# cart.py
+# Carrito de compras guardado en una cookie firmada, sin
+# pasar por la sesión de la BD: ver o modificar el carrito no
+# genera consultas. Las líneas se guardan como "id:cantidad"
+# separadas por "|"; precios y stock se revalidan con una sola
+# consulta a Product al mostrar el carrito y al confirmarlo.
+# -------------------------------------------------------
+
+COOKIE_NAME = 'cart'
+SALT = 'menu_app.cart'
+MAX_AGE = 60 * 60 * 24 * 30  # 30 días
+MAX_LINES = 50
+MAX_QUANTITY = 99
+
+
+class Cart:
+    """
+    Carrito de compras.
+
+    Atributos:
+      - lines: diccionario product_id -> cantidad
+    """
+
+    def __init__(self, lines=None):
+        self.lines = dict(lines or {})
+
+    @classmethod
+    def loads(cls, value):
+        lines = {}
+        for line in value.split('|') if value else []:
+            product_id, _, quantity = line.partition(':')
+            if product_id.isdigit() and quantity.isdigit() and int(quantity) > 0:
+                lines[int(product_id)] = min(int(quantity), MAX_QUANTITY)
+        return cls(list(lines.items())[:MAX_LINES])
+
+    def dumps(self):
+        return '|'.join(f'{product_id}:{quantity}' for product_id, quantity in self.lines.items())
+
+    @classmethod
+    def from_request(cls, request):
+        """Lee el carrito de la cookie; una cookie vencida o adulterada da un carrito vacío."""
+        try:
+            value = request.get_signed_cookie(COOKIE_NAME, default='', salt=SALT, max_age=MAX_AGE)
+        except signing.BadSignature:
+            value = ''
+        return cls.loads(value)
+
+    def save(self, response):
+        if self.lines:
+            response.set_signed_cookie(
+                COOKIE_NAME, self.dumps(), salt=SALT, max_age=MAX_AGE, httponly=True, samesite='Lax'
+            )
+        else:
+            response.delete_cookie(COOKIE_NAME, samesite='Lax')
+
+    def add(self, product_id, quantity=1):
+        if product_id not in self.lines and len(self.lines) >= MAX_LINES:
+            return False
+        self.lines[product_id] = min(self.lines.get(product_id, 0) + quantity, MAX_QUANTITY)
+        return True
+
+    def remove(self, product_id):
+        self.lines.pop(product_id, None)
+
+    def clear(self):
+        self.lines.clear()
+
+    def __len__(self):
+        return sum(self.lines.values())
+
+    def revalidate(self):
+        """
+        Carga los productos del carrito con una consulta y controla que
+        existan y tengan stock. Devuelve (items, errors) donde items es una
+        lista de (product, cantidad, subtotal) con los precios actuales.
+        """
+        products = Product.objects.only('name', 'price', 'quantity', 'category').in_bulk(self.lines)
+        items = []
+        errors = {}
+        for product_id, quantity in self.lines.items():
+            product = products.get(product_id)
+            if product is None:
+                errors[product_id] = 'El producto ya no está disponible'
+            elif product.quantity < quantity:
+                errors[product_id] = f'Solo quedan {product.quantity} unidades de {product.name}'
+            if product is not None:
+                items.append((product, quantity, product.price * quantity))
+        return items, errors
+
+    def checkout(self, user):
+        """
+        Revalida el carrito y crea el pedido con Order.place.
+        Devuelve (order, None) o (None, errors).
+        """
+        if not self.lines:
+            return None, {'cart': 'El carrito está vacío'}
+        items, errors = self.revalidate()
+        if errors:
+            return None, errors
+        return Order.place(
+            user,
+            [product for product, _, _ in items],
+            quantities={product.pk: quantity for product, quantity, _ in items},
+        )
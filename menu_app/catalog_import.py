@@ -0,0 +1,195 @@
+import csv
+import json
+import re
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.db import transaction
+
+from . import stock
+from .models import CatalogChange, Category, Product
+
+
+# -------------------------------------------------------
+# catalog_import.py
+# Importación de catálogos de productos (JSON, JSON Lines o
+# CSV) leyendo el archivo de forma incremental y guardando
+# por lotes con bulk_create(update_conflicts=True).
+# Acepta filas planas {name, description, price, quantity,
+# category, image} o el formato de fixture de Django
+# {model, pk, fields}. Sin pk, un producto con el mismo
+# nombre se actualiza en lugar de duplicarse. La categoría
+# puede ser un id (número, también como texto en CSV) o un
+# nombre; los nombres nuevos crean la categoría.
+# -------------------------------------------------------
+
+UPDATE_FIELDS = ['category', 'name', 'description', 'price', 'quantity', 'image']
+# Comienzo de un registro: una línea que empieza con '{' (JSON Lines o
+# un array con indentación, como los de dumpdata).
+RECORD_START = re.compile(r'\n(?=,?\{)')
+
+
+class MalformedRecord:
+    """Registro que iter_json no pudo interpretar; se reporta como fila inválida."""
+
+    def __init__(self, message):
+        self.message = message
+
+
+def iter_json(stream, chunk_size=65536):
+    """
+    Recorre los objetos de un array JSON (o de un archivo JSON Lines)
+    sin cargar el archivo completo en memoria.
+
+    Un registro mal formado se entrega como MalformedRecord y la lectura
+    sigue desde la próxima línea que empieza con '{'. En un array
+    compacto (sin saltos de línea) no hay dónde retomar y se descarta el
+    resto del archivo.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    eof = False
+    while True:
+        buffer = buffer.lstrip(' \t\r\n,[]')
+        if not buffer:
+            if eof:
+                return
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+        try:
+            obj, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError as exc:
+            # Sin el comienzo del registro siguiente no se sabe si el actual
+            # está mal formado o todavía no terminó de leerse.
+            boundary = RECORD_START.search(buffer, 1)
+            if boundary is None and not eof:
+                chunk = stream.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield MalformedRecord(f'JSON inválido: {exc.msg}')
+            buffer = buffer[boundary.end():] if boundary else ''
+            continue
+        yield obj
+        buffer = buffer[end:]
+
+
+def iter_csv(stream):
+    """Recorre las filas de un CSV con encabezado."""
+    yield from csv.DictReader(stream)
+
+
+def _parse_row(row, categories, category_ids):
+    """
+    Normaliza una fila y la valida con Product.validate.
+    Devuelve (Product sin guardar, None) o (None, errors).
+    """
+    if isinstance(row, MalformedRecord):
+        return None, {'row': row.message}
+    if not isinstance(row, dict):
+        return None, {'row': 'Se esperaba un objeto'}
+    pk = row.get('pk')
+    if 'fields' in row:
+        row = row['fields']
+        if not isinstance(row, dict):
+            return None, {'fields': 'Se esperaba un objeto'}
+    errors = {}
+
+    try:
+        price = Decimal(str(row.get('price'))) if row.get('price') not in (None, '') else None
+    except InvalidOperation:
+        price = None
+        errors['price'] = 'Precio inválido'
+    if price is not None and not price.is_finite():
+        price = None
+        errors['price'] = 'Precio inválido'
+    try:
+        quantity = int(row.get('quantity') or 0)
+    except (TypeError, ValueError, OverflowError):
+        quantity = None
+        errors['quantity'] = 'Cantidad inválida'
+
+    category = row.get('category')
+    category_id = None
+    new_category = None
+    if isinstance(category, str):
+        category = category.strip()
+        # En CSV todo llega como texto: un número es un id, igual que en JSON.
+        if category.isascii() and category.isdigit():
+            category = int(category)
+    if isinstance(category, bool) or not isinstance(category, (int, str, type(None))):
+        errors['category'] = 'Categoría inválida'
+    elif isinstance(category, int):
+        category_id = category
+        if category not in category_ids:
+            errors['category'] = f'Categoría inexistente: {category}'
+    elif category:
+        category_id = categories.get(category)
+        if category_id is None:
+            new_category = category
+
+    errors = {**Product.validate(row.get('name'), row.get('description'), price), **errors}
+    if errors:
+        return None, errors
+    if new_category is not None:
+        # Las categorías nuevas se crean solo para filas válidas.
+        category_id = categories[new_category] = Category.objects.create(name=new_category).pk
+        category_ids.add(category_id)
+    return Product(
+        pk=pk or None,
+        category_id=category_id,
+        name=row['name'],
+        description=row['description'],
+        price=price,
+        quantity=quantity,
+        image=row.get('image') or None,
+    ), None
+
+
+def import_catalog(rows, batch_size=1000):
+    """
+    Valida e inserta/actualiza los productos de `rows` en lotes de
+    `batch_size`. Las filas inválidas no interrumpen la importación.
+
+    Devuelve un diccionario con:
+      - imported: cantidad de productos guardados
+      - errors: lista de (número de fila, errors) empezando en 1
+    """
+    categories = dict(Category.objects.values_list('name', 'pk'))
+    category_ids = set(categories.values())
+    existing = dict(Product.objects.values_list('name', 'pk'))
+    result = {'imported': 0, 'errors': []}
+
+    rows = enumerate(rows, start=1)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return result
+
+        products = {}
+        for number, row in batch:
+            product, errors = _parse_row(row, categories, category_ids)
+            if errors:
+                result['errors'].append((number, errors))
+                continue
+            if product.pk is None:
+                product.pk = existing.get(product.name)
+            # Una fila posterior con la misma clave pisa a la anterior.
+            products[product.pk or ('new', product.name)] = product
+
+        with transaction.atomic():
+            saved = Product.objects.bulk_create(
+                products.values(),
+                update_conflicts=True,
+                unique_fields=['id'],
+                update_fields=UPDATE_FIELDS,
+            )
+            pks = [product.pk for product in saved if product.pk is not None]
+            CatalogChange.record('product', pks)
+            stock.forget(pks)
+        for product in saved:
+            if product.pk is not None:
+                existing[product.name] = product.pk
+        result['imported'] += len(saved)
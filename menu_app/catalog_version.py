@@ -0,0 +1,34 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+# -------------------------------------------------------
+# catalog_version.py
+# Versión del catálogo (productos y categorías) que usa la
+# API como ETag. Cada escritura genera una versión nueva al
+# confirmarse la transacción; los pedidos solo cuando agotan
+# o reponen un producto. La versión vence a
+# los CATALOG_VERSION_TTL segundos: con un cache local por
+# proceso, un worker que no vio el cambio deja de responder
+# 304 como mucho tras ese tiempo.
+# -------------------------------------------------------
+
+KEY = 'catalog:version'
+
+
+def current():
+    version = cache.get(KEY)
+    if version is None:
+        cache.add(KEY, uuid.uuid4().hex, settings.CATALOG_VERSION_TTL)
+        version = cache.get(KEY)
+    return version
+
+
+def bump():
+    """Invalida la versión actual cuando la transacción en curso se confirma."""
+    transaction.on_commit(
+        lambda: cache.set(KEY, uuid.uuid4().hex, settings.CATALOG_VERSION_TTL)
+    )
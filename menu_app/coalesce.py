@@ -0,0 +1,99 @@
+import threading
+import time
+
+from django.core.cache import cache
+
+from . import metrics
+
+
+# -------------------------------------------------------
+# coalesce.py
+# Cache con "single-flight" y stale-while-revalidate.
+# Cuando una entrada falta, un solo request la calcula y
+# los demás esperan su resultado (dentro del proceso con un
+# Event, entre procesos con un lock en el cache). Cuando la
+# entrada venció pero sigue dentro de la ventana stale, un
+# request la recalcula y el resto sirve la versión vieja.
+# -------------------------------------------------------
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+class _Flight:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.ok = False
+
+
+def _store(key, compute, ttl, stale_ttl):
+    value = compute()
+    cache.set(key, (value, time.time() + ttl), ttl + stale_ttl)
+    return value
+
+
+def _lead(key, compute, ttl, stale_ttl, lock_timeout, wait):
+    """Calcula la entrada o, si otro proceso ya lo está haciendo, la espera."""
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            return _store(key, compute, ttl, stale_ttl)
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        time.sleep(0.02)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+    # El otro proceso tardó demasiado: se calcula igual.
+    return _store(key, compute, ttl, stale_ttl)
+
+
+def get_or_compute(key, compute, ttl, stale_ttl=300, lock_timeout=10, wait=5.0, name='pages'):
+    """
+    Devuelve el valor cacheado en `key` o lo calcula con `compute()`
+    coalesciendo los requests concurrentes.
+
+    - ttl: segundos en que la entrada se considera fresca
+    - stale_ttl: segundos extra en que se sirve vencida mientras se recalcula
+    - wait: máximo que un request espera el cálculo de otro
+    """
+    entry = cache.get(key)
+    if entry is not None:
+        value, fresh_until = entry
+        if time.time() < fresh_until:
+            metrics.cache_requests.inc(cache=name, result='hit')
+            return value
+        if cache.add(f"{key}:lock", 1, lock_timeout):
+            metrics.cache_requests.inc(cache=name, result='revalidate')
+            try:
+                return _store(key, compute, ttl, stale_ttl)
+            finally:
+                cache.delete(f"{key}:lock")
+        metrics.cache_requests.inc(cache=name, result='stale')
+        return value
+
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        metrics.cache_requests.inc(cache=name, result='coalesced')
+        if flight.event.wait(wait) and flight.ok:
+            return flight.result
+        return _store(key, compute, ttl, stale_ttl)
+
+    metrics.cache_requests.inc(cache=name, result='miss')
+    try:
+        flight.result = _lead(key, compute, ttl, stale_ttl, lock_timeout, wait)
+        flight.ok = True
+        return flight.result
+    finally:
+        flight.event.set()
+        with _flights_lock:
+            _flights.pop(key, None)
@@ -0,0 +1,126 @@
+import os
+import threading
+import time
+
+from django.db import transaction
+from django.db.models import F
+
+
+# -------------------------------------------------------
+# codes.py
+# Generación de códigos únicos para Order y Booking.
+# Cada código es <prefijo><milisegundos><secuencia> en base 32
+# de Crockford: los códigos son cortos, ordenables por fecha
+# de creación (el índice único crece siempre por el final) y
+# no colisionan porque la secuencia es global. Cada hilo
+# reserva bloques de BLOCK_SIZE números en CodeSequence y los
+# reparte en memoria, así solo consulta la BD una vez por bloque.
+# -------------------------------------------------------
+
+ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+TIME_DIGITS = 9       # 45 bits: milisegundos hasta el año 3084
+SEQUENCE_DIGITS = 7   # 35 bits: ~34 mil millones de códigos
+BLOCK_SIZE = 1000
+
+
+def encode(number, digits):
+    """Codifica `number` en base 32 de Crockford con `digits` dígitos."""
+    chars = []
+    for _ in range(digits):
+        number, remainder = divmod(number, 32)
+        chars.append(ALPHABET[remainder])
+    if number:
+        raise ValueError('Número demasiado grande para la cantidad de dígitos')
+    return ''.join(reversed(chars))
+
+
+class _Block:
+    """Números [next, end) reservados por un hilo."""
+
+    def __init__(self, start, size):
+        self.next = start
+        self.end = start + size
+        self.pid = os.getpid()
+        self.committed = False
+
+    def commit(self):
+        self.committed = True
+
+
+class CodeAllocator:
+    """
+    Reparte códigos de una secuencia con bloques reservados en la BD.
+
+    Cada hilo tiene su bloque. Un bloque reservado dentro de una
+    transacción solo vale mientras esa transacción siga abierta y sin
+    revertir la reserva: si se revierte, la BD vuelve a entregar esos
+    números y el bloque se descarta antes de repartir otro código.
+
+    Atributos:
+      - name: nombre de la fila en CodeSequence
+      - prefix: letra inicial de los códigos
+      - block_size: números reservados por consulta
+    """
+
+    def __init__(self, name, prefix, block_size=BLOCK_SIZE):
+        self.name = name
+        self.prefix = prefix
+        self.block_size = block_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._last_ms = 0
+
+    def _lease(self):
+        """Reserva el siguiente bloque en la transacción en curso y lo devuelve."""
+        from .models import CodeSequence
+
+        with transaction.atomic():
+            CodeSequence.objects.get_or_create(name=self.name)
+            CodeSequence.objects.filter(name=self.name).update(
+                next_value=F('next_value') + self.block_size
+            )
+            end = CodeSequence.objects.values_list('next_value', flat=True).get(name=self.name)
+        block = _Block(end - self.block_size, self.block_size)
+        # Fuera de una transacción corre en el acto. Dentro, Django descarta
+        # el callback si se revierte el savepoint o la transacción que lo
+        # registró: un bloque sin confirmar cuyo callback ya no está
+        # pendiente es un bloque que la BD no conservó.
+        transaction.on_commit(block.commit)
+        return block
+
+    def _current_block(self):
+        """Bloque del hilo si todavía se puede usar, o None."""
+        block = getattr(self._local, 'block', None)
+        # Un worker creado con fork hereda el bloque del padre: se descarta.
+        if block is None or block.pid != os.getpid() or block.next >= block.end:
+            return None
+        if block.committed:
+            return block
+        pending = transaction.get_connection().run_on_commit
+        if any(getattr(callback, '__self__', None) is block for _, callback, _ in pending):
+            return block
+        return None
+
+    def next_code(self):
+        block = self._current_block()
+        if block is None:
+            block = self._local.block = self._lease()
+        sequence = block.next
+        block.next += 1
+        with self._lock:
+            # El reloj puede retroceder; el prefijo de tiempo nunca.
+            self._last_ms = max(self._last_ms, int(time.time() * 1000))
+            millis = self._last_ms
+        return self.prefix + encode(millis, TIME_DIGITS) + encode(sequence % 32 ** SEQUENCE_DIGITS, SEQUENCE_DIGITS)
+
+
+order_codes = CodeAllocator('order', 'P')
+booking_codes = CodeAllocator('booking', 'R')
+
+
+def new_order_code():
+    return order_codes.next_code()
+
+
+def new_booking_code():
+    return booking_codes.next_code()
@@ -0,0 +1,6 @@
+from django.conf import settings
+
+
+def assets(request):
+    """Indica a los templates si Bootstrap se sirve local o desde el CDN."""
+    return {'VENDOR_ASSETS': settings.VENDOR_ASSETS}
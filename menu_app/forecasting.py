@@ -0,0 +1,143 @@
+from datetime import timedelta
+
+import numpy as np
+from django.db.models import Sum
+from django.utils import timezone
+
+from . import archive
+from .models import DailyProductSales, OrderProduct, Product
+
+
+# -------------------------------------------------------
+# forecasting.py
+# Pronóstico de demanda y sugerencias de reposición de stock.
+# Las ventas diarias de todo el catálogo se cargan en una
+# matriz productos x días con una sola consulta y todos los
+# cálculos se hacen sobre la matriz, sin bucles por fila.
+# -------------------------------------------------------
+
+def load_daily_sales(days=730, end=None):
+    """
+    Carga las unidades vendidas por producto y por día de los últimos
+    `days` días hasta `end` (inclusive), sin contar pedidos cancelados.
+    Los días con pedidos archivados se leen de DailyProductSales, porque
+    sus líneas ya no están en OrderProduct.
+
+    Devuelve (product_ids, start, sales):
+      - product_ids: array con el id de cada fila de la matriz
+      - start: fecha de la primera columna
+      - sales: matriz float de forma (productos, days)
+    """
+    end = end or timezone.localdate()
+    start = end - timedelta(days=days - 1)
+    product_ids = np.array(
+        Product.objects.order_by('pk').values_list('pk', flat=True), dtype=np.int64
+    )
+    sales = np.zeros((len(product_ids), days))
+
+    rows = (
+        OrderProduct.objects.exclude(order__state='CANCELADO')
+        .filter(order__buy_date__range=(start, end))
+        .values_list('product_id', 'order__buy_date')
+        .annotate(units=Sum('quantity'))
+        .order_by()
+    )
+    archived = archive.archived_until()
+    if archived is not None and archived >= start:
+        rows = rows.filter(order__buy_date__gt=archived)
+        rows = rows.union(
+            DailyProductSales.objects.filter(day__range=(start, min(archived, end)))
+            .values_list('product_id', 'day', 'units')
+            .order_by(),
+            all=True,
+        )
+    data = list(rows)
+    if data and len(product_ids):
+        ids, dates, units = zip(*data)
+        ids = np.array(ids, dtype=np.int64)
+        offsets = (np.array(dates, dtype='datetime64[D]') - np.datetime64(start, 'D')).astype(np.int64)
+        positions = np.minimum(np.searchsorted(product_ids, ids), len(product_ids) - 1)
+        # Descarta productos creados después de leer product_ids.
+        known = product_ids[positions] == ids
+        np.add.at(sales, (positions[known], offsets[known]), np.array(units)[known])
+    return product_ids, start, sales
+
+
+def moving_average(sales, window):
+    """
+    Media móvil de `window` días sobre el eje de días. Las primeras
+    columnas promedian los días disponibles hasta ese punto.
+    """
+    cumulative = np.cumsum(sales, axis=1)
+    shifted = np.zeros_like(cumulative)
+    shifted[:, window:] = cumulative[:, :-window]
+    counts = np.minimum(np.arange(1, sales.shape[1] + 1), window)
+    return (cumulative - shifted) / counts
+
+
+def weekday_seasonality(sales, start):
+    """
+    Índice de estacionalidad semanal por producto: venta media de cada
+    día de la semana dividida por la venta media diaria. Devuelve una
+    matriz (productos, 7) indexada por date.weekday(); 1.0 si no hay ventas.
+    """
+    weekdays = (start.weekday() + np.arange(sales.shape[1])) % 7
+    totals = np.zeros((sales.shape[0], 7))
+    np.add.at(totals.T, weekdays, sales.T)
+    per_weekday = totals / np.maximum(np.bincount(weekdays, minlength=7), 1)
+    overall = sales.mean(axis=1, keepdims=True)
+    return np.divide(per_weekday, overall, out=np.ones_like(per_weekday), where=overall > 0)
+
+
+def forecast(sales, start, window=28, lead_time=2, service_z=1.65):
+    """
+    Calcula para cada producto:
+      - average: media móvil de los últimos `window` días
+      - demand: demanda esperada durante los `lead_time` días siguientes,
+        ajustada por la estacionalidad semanal
+      - reorder_point: demand más stock de seguridad (service_z desvíos)
+    """
+    average = moving_average(sales, window)[:, -1]
+    season = weekday_seasonality(sales, start)
+
+    first_future = (start + timedelta(days=sales.shape[1])).weekday()
+    future_weekdays = (first_future + np.arange(lead_time)) % 7
+    demand = average * season[:, future_weekdays].sum(axis=1)
+
+    deviation = sales[:, -window:].std(axis=1)
+    reorder_point = demand + service_z * deviation * np.sqrt(lead_time)
+    return {'average': average, 'demand': demand, 'reorder_point': reorder_point}
+
+
+def reorder_suggestions(days=730, window=28, lead_time=2, end=None):
+    """
+    Devuelve los productos cuyo stock (Product.quantity) está por debajo
+    del punto de reposición, con la cantidad sugerida a reponer, ordenados
+    por cantidad sugerida descendente.
+    """
+    if min(days, window, lead_time) < 1:
+        raise ValueError("days, window y lead_time deben ser mayores a 0")
+    product_ids, start, sales = load_daily_sales(days, end)
+    if not len(product_ids):
+        return []
+    result = forecast(sales, start, window=window, lead_time=lead_time)
+
+    catalog = {pk: (name, quantity) for pk, name, quantity in Product.objects.values_list('pk', 'name', 'quantity')}
+    names = [catalog.get(pk, ('', 0))[0] for pk in product_ids.tolist()]
+    stock = np.array([catalog.get(pk, ('', 0))[1] for pk in product_ids.tolist()])
+    reorder_point = np.ceil(result['reorder_point'])
+    suggested = np.maximum(reorder_point - stock, 0).astype(int)
+
+    order = np.argsort(-suggested, kind='stable')
+    return [
+        {
+            'product_id': int(product_ids[i]),
+            'name': names[i],
+            'quantity': int(stock[i]),
+            'average': round(float(result['average'][i]), 2),
+            'reorder_point': int(reorder_point[i]),
+            'suggested': int(suggested[i]),
+        }
+        for i in order
+        if suggested[i] > 0
+    ]
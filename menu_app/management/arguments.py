@@ -0,0 +1,12 @@
+import argparse
+
+
+def positive_int(value):
+    """Tipo de argparse para enteros mayores a 0."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} no es un número entero")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"debe ser mayor a 0 (se recibió {number})")
+    return number
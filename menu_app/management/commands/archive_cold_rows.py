@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from menu_app import archive
+from menu_app.management.arguments import positive_int
+
+
+class Command(BaseCommand):
+    help = "Mueve por lotes a las tablas de archivo los pedidos, calificaciones y notificaciones viejos."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=positive_int, default=None, help="Antigüedad mínima (por defecto ARCHIVE_AFTER_DAYS)."
+        )
+        parser.add_argument("--batch-size", type=positive_int, default=1000, help="Filas por lote.")
+
+    def handle(self, *args, **options):
+        archived = archive.archive_all(options["days"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            "Archivados: {orders} pedidos, {ratings} calificaciones, {notifications} notificaciones.".format(**archived)
+        ))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from menu_app.query_plans import audit
+
+
+class Command(BaseCommand):
+    help = "Muestra el plan de las consultas habituales y falla si alguna recorre una tabla completa."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--verbose-plans", action="store_true", help="Imprime el plan completo de cada consulta.")
+
+    def handle(self, *args, **options):
+        failed = 0
+        for name, plan, problems in audit():
+            if problems:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f"FALLA  {name}"))
+                for line in problems:
+                    self.stdout.write(f"         {line}")
+            else:
+                self.stdout.write(self.style.SUCCESS(f"OK     {name}"))
+            if options["verbose_plans"]:
+                for line in plan.splitlines():
+                    self.stdout.write(f"         {line}")
+        if failed:
+            raise CommandError(f"{failed} consultas sin índice adecuado.")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from menu_app.models import CatalogChange
+
+
+class Command(BaseCommand):
+    help = "Compacta el registro de cambios del catálogo dejando solo el último cambio de cada objeto."
+
+    def handle(self, *args, **options):
+        deleted = CatalogChange.compact()
+        self.stdout.write(self.style.SUCCESS(f"{deleted} cambios compactados."))
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from menu_app import media_storage
+from menu_app.models import CatalogChange, Product
+
+
+def locate(name):
+    """Ruta del archivo de una imagen anterior al storage por contenido."""
+    static_prefix = "/" + settings.STATIC_URL.strip("/") + "/"
+    if name.startswith(static_prefix):
+        return finders.find(name[len(static_prefix):])
+    # Antes MEDIA_ROOT no estaba definido y los archivos quedaban en BASE_DIR.
+    for root in (settings.MEDIA_ROOT, settings.BASE_DIR):
+        path = Path(root, name.lstrip("/"))
+        if path.is_file():
+            return path
+    return None
+
+
+class Command(BaseCommand):
+    help = "Pasa las imágenes de los productos al storage direccionado por contenido (una copia por foto)."
+
+    def handle(self, *args, **options):
+        names = (
+            Product.objects.exclude(image="").exclude(image__isnull=True)
+            .order_by().values_list("image", flat=True).distinct()
+        )
+        updated = 0
+        stored = set()
+        for name in names:
+            if media_storage.is_content_addressed(name):
+                continue
+            path = locate(name)
+            if path is None:
+                self.stderr.write(self.style.WARNING(f"No se encontró {name}"))
+                continue
+            with open(path, "rb") as file:
+                new_name = default_storage.save(Path(name).name, File(file))
+            stored.add(new_name)
+            with transaction.atomic():
+                ids = list(Product.objects.filter(image=name).values_list("pk", flat=True))
+                Product.objects.filter(pk__in=ids).update(image=new_name)
+                CatalogChange.record("product", ids)
+            updated += len(ids)
+        self.stdout.write(self.style.SUCCESS(
+            f"{updated} productos actualizados, {len(stored)} archivos distintos."
+        ))
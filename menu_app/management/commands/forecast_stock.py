@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from menu_app import forecasting
+from menu_app.management.arguments import positive_int
+
+
+class Command(BaseCommand):
+    help = "Pronostica la demanda por producto y sugiere cantidades a reponer."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=positive_int, default=730, help="Días de historial a analizar.")
+        parser.add_argument("--window", type=positive_int, default=28, help="Días de la media móvil.")
+        parser.add_argument("--lead-time", type=positive_int, default=2, help="Días hasta recibir la reposición.")
+
+    def handle(self, *args, **options):
+        suggestions = forecasting.reorder_suggestions(
+            days=options["days"], window=options["window"], lead_time=options["lead_time"]
+        )
+        if not suggestions:
+            self.stdout.write(self.style.SUCCESS("No hay productos para reponer."))
+            return
+
+        self.stdout.write(f"{'Producto':<40} {'Stock':>6} {'Media':>7} {'Punto':>6} {'Reponer':>8}")
+        for row in suggestions:
+            self.stdout.write(
+                f"{row['name'][:40]:<40} {row['quantity']:>6} {row['average']:>7} "
+                f"{row['reorder_point']:>6} {row['suggested']:>8}"
+            )
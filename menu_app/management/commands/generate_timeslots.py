@@ -0,0 +1,38 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from menu_app import timeslots
+from menu_app.management.arguments import positive_int
+
+
+class Command(BaseCommand):
+    help = "Genera los intervalos del calendario de reservas y los vincula con las mesas."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--weeks", type=positive_int, default=4, help="Semanas a generar.")
+        parser.add_argument("--start", help="Primer día (YYYY-MM-DD), por defecto hoy.")
+        parser.add_argument(
+            "--hours",
+            action="append",
+            help="Horario de apertura HH:MM-HH:MM (repetible). Por defecto 12:00-16:00 y 20:00-00:00.",
+        )
+        parser.add_argument("--slot-minutes", type=positive_int, default=120, help="Duración de cada intervalo.")
+        parser.add_argument("--batch-size", type=positive_int, default=500, help="Filas por bulk_create.")
+
+    def handle(self, *args, **options):
+        try:
+            first_day = date.fromisoformat(options["start"]) if options["start"] else timezone.localdate()
+            hours = [timeslots.parse_hours(value) for value in options["hours"] or []]
+        except ValueError as exc:
+            raise CommandError(f"Valor inválido: {exc}")
+
+        slots, links = timeslots.generate(
+            first_day,
+            options["weeks"],
+            hours=hours or None,
+            slot_minutes=options["slot_minutes"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"{slots} intervalos y {links} vínculos con mesas."))
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from menu_app import catalog_import
+
+
+class Command(BaseCommand):
+    help = "Importa un catálogo de productos desde JSON, JSON Lines o CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archivo a importar.")
+        parser.add_argument(
+            "--format",
+            choices=["json", "csv"],
+            help="Formato del archivo (por defecto, según la extensión).",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="Productos por lote.")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"No existe el archivo {path}")
+        fmt = options["format"] or ("csv" if path.suffix.lower() == ".csv" else "json")
+
+        with path.open(encoding="utf-8", newline="") as stream:
+            rows = catalog_import.iter_csv(stream) if fmt == "csv" else catalog_import.iter_json(stream)
+            result = catalog_import.import_catalog(rows, batch_size=options["batch_size"])
+
+        for number, errors in result["errors"]:
+            detail = "; ".join(f"{field}: {message}" for field, message in errors.items())
+            self.stderr.write(f"Fila {number}: {detail}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result['imported']} productos importados, {len(result['errors'])} filas con errores."
+            )
+        )
@@ -0,0 +1,34 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from menu_app.allocation import TableAllocator
+
+
+class Command(BaseCommand):
+    help = "Asigna mesas e intervalos a todas las reservas de una fecha."
+
+    def add_arguments(self, parser):
+        parser.add_argument("date", help="Fecha a planificar (YYYY-MM-DD).")
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Calcula la asignación sin guardarla."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            day = date.fromisoformat(options["date"])
+        except ValueError as exc:
+            raise CommandError(f"Fecha inválida: {exc}")
+
+        allocator = TableAllocator.for_date(day)
+        covers = allocator.solve()
+        seated = len(allocator.assignments())
+        if not options["dry_run"]:
+            allocator.save()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{seated} de {len(allocator.booking_ids)} reservas sentadas "
+                f"({covers} de {int(allocator.sizes.sum())} comensales)."
+            )
+        )
@@ -0,0 +1,103 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Se ejecuta en un proceso nuevo para medir un arranque en frío.
+PHASES_SCRIPT = """
+import json, os, sys, time
+os.environ["DJANGO_SETTINGS_MODULE"] = {settings_module!r}
+phases = []
+def mark(name, started):
+    phases.append((name, (time.perf_counter() - started) * 1000))
+    return time.perf_counter()
+
+t = time.perf_counter()
+import django
+t = mark("import django", t)
+from django.conf import settings
+settings.INSTALLED_APPS
+t = mark("cargar settings", t)
+django.setup(set_prefix=False)
+t = mark("django.setup() (apps, modelos, ready)", t)
+from django.core.handlers.wsgi import WSGIHandler
+WSGIHandler()
+t = mark("middlewares (WSGIHandler)", t)
+from django.urls import get_resolver
+get_resolver().url_patterns
+t = mark("URLconf, vistas y admin", t)
+if {warmup!r}:
+    from menu_app.warmup import warm_up
+    warm_up()
+    t = mark("warm_up()", t)
+print(json.dumps(phases))
+"""
+
+
+def parse_importtime(output):
+    """
+    Convierte la salida de -X importtime en un árbol de nodos
+    {name, self, cumulative, children} (tiempos en ms).
+    Python la imprime en post-orden: los hijos aparecen antes que el padre.
+    """
+    pending = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Un espacio separador y dos espacios por nivel de anidamiento.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        node = {
+            "name": name.strip(),
+            "self": int(self_us) / 1000,
+            "cumulative": int(cumulative_us) / 1000,
+            "children": pending.pop(depth + 1, []),
+        }
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+class Command(BaseCommand):
+    help = "Mide el arranque en frío: fases de django.setup() y árbol de imports (-X importtime)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--min-ms", type=float, default=2.0, help="Oculta imports más rápidos que esto.")
+        parser.add_argument("--depth", type=int, default=4, help="Profundidad máxima del árbol.")
+        parser.add_argument("--warmup", action="store_true", help="Incluye el tiempo de warm_up().")
+
+    def handle(self, *args, **options):
+        script = PHASES_SCRIPT.format(
+            settings_module=os.environ.get("DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE),
+            warmup=options["warmup"],
+        )
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+
+        phases = json.loads(result.stdout.strip().splitlines()[-1])
+        self.stdout.write(self.style.MIGRATE_HEADING("Fases de arranque"))
+        for name, elapsed in phases:
+            self.stdout.write(f"  {elapsed:8.1f} ms  {name}")
+        self.stdout.write(f"  {sum(elapsed for _, elapsed in phases):8.1f} ms  total")
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Imports (>= {options['min_ms']} ms acumulado)"))
+        self.stdout.write("  acumulado     propio  módulo")
+        for node in sorted(parse_importtime(result.stderr), key=lambda node: -node["cumulative"]):
+            self._write_node(node, 0, options)
+
+    def _write_node(self, node, depth, options):
+        if node["cumulative"] < options["min_ms"] or depth > options["depth"]:
+            return
+        self.stdout.write(
+            f"  {node['cumulative']:8.1f} ms {node['self']:7.1f} ms  {'  ' * depth}{node['name']}"
+        )
+        for child in sorted(node["children"], key=lambda child: -child["cumulative"]):
+            self._write_node(child, depth + 1, options)
@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from menu_app import timeslots
+from menu_app.management.arguments import positive_int
+
+
+class Command(BaseCommand):
+    help = "Borra por lotes los intervalos del calendario que ya pasaron."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-days", type=positive_int, default=30, help="Días pasados que se conservan."
+        )
+        parser.add_argument("--batch-size", type=positive_int, default=1000, help="Intervalos por lote.")
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=options["keep_days"])
+        deleted = timeslots.purge(before, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{deleted} intervalos borrados."))
@@ -0,0 +1,34 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from menu_app import rollups
+
+
+class Command(BaseCommand):
+    help = "Recalcula los acumulados diarios de ventas a partir de los pedidos."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="Primer día a recalcular (YYYY-MM-DD).")
+        parser.add_argument("--end", help="Último día a recalcular (YYYY-MM-DD).")
+
+    def handle(self, *args, **options):
+        try:
+            start = date.fromisoformat(options["start"]) if options["start"] else None
+            end = date.fromisoformat(options["end"]) if options["end"] else None
+        except ValueError as exc:
+            raise CommandError(f"Fecha inválida: {exc}")
+
+        created = rollups.rebuild(start, end)
+        if created["start"] is not None and created["start"] != start:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Los días anteriores a {created['start']} tienen pedidos archivados y se conservan."
+                )
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Acumulados recalculados: {products} por producto, "
+                "{categories} por categoría, {states} por estado.".format(**created)
+            )
+        )
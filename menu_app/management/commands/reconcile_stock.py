@@ -0,0 +1,20 @@
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand
+
+from menu_app import stock
+
+
+class Command(BaseCommand):
+    help = "Alinea los contadores de stock del cache con Product.quantity."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Productos leídos por consulta.")
+
+    def handle(self, *args, **options):
+        if isinstance(caches["default"], LocMemCache):
+            self.stderr.write(self.style.WARNING(
+                "El cache es LocMem (propio de cada proceso): los contadores de los workers no cambian."
+            ))
+        fixed = stock.reconcile(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Stock reconciliado: {fixed} contadores corregidos."))
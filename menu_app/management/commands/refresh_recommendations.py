@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from menu_app import recommendations
+
+
+class Command(BaseCommand):
+    help = "Suma los pedidos nuevos a las co-ocurrencias y recalcula las recomendaciones afectadas."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full", action="store_true",
+            help="Vuelve a contar todos los pedidos (los borrados no se restan de otro modo).",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000, help="Líneas de pedido por lote.")
+
+    def handle(self, *args, **options):
+        result = recommendations.refresh(batch_size=options["batch_size"], full=options["full"])
+        self.stdout.write(self.style.SUCCESS(
+            "Recomendaciones actualizadas: {orders} pedidos contados, {products} productos recalculados.".format(**result)
+        ))
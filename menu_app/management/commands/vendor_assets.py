@@ -0,0 +1,46 @@
+import re
+from pathlib import Path
+from urllib.request import urlopen
+
+from django.core.management.base import BaseCommand, CommandError
+
+VENDOR_DIR = Path(__file__).resolve().parents[2] / "static" / "vendor"
+
+# Archivo local -> URL del CDN (mismas versiones que usa base.html)
+ASSETS = {
+    "bootstrap/bootstrap.min.css": "https://cdn.jsdelivr.net/npm/bootstrap@5.3.5/dist/css/bootstrap.min.css",
+    "bootstrap/bootstrap.bundle.min.js": "https://cdn.jsdelivr.net/npm/bootstrap@5.3.5/dist/js/bootstrap.bundle.min.js",
+    "bootstrap-icons/bootstrap-icons.min.css": "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/bootstrap-icons.min.css",
+    "bootstrap-icons/fonts/bootstrap-icons.woff2": "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/fonts/bootstrap-icons.woff2",
+    "bootstrap-icons/fonts/bootstrap-icons.woff": "https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/font/fonts/bootstrap-icons.woff",
+}
+
+# Los .map no se descargan: se quita la referencia para que
+# ManifestStaticFilesStorage no falle buscándolos.
+SOURCE_MAP = re.compile(rb"\n?(/\*# sourceMappingURL=[^*]*\*/|//# sourceMappingURL=\S*)\s*$")
+
+
+class Command(BaseCommand):
+    help = "Descarga Bootstrap y Bootstrap Icons a menu_app/static/vendor para no depender del CDN."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Vuelve a descargar los archivos existentes.")
+
+    def handle(self, *args, **options):
+        for name, url in ASSETS.items():
+            target = VENDOR_DIR / name
+            if target.exists() and not options["force"]:
+                self.stdout.write(f"{name} ya existe")
+                continue
+            try:
+                with urlopen(url, timeout=30) as response:
+                    data = response.read()
+            except OSError as exc:
+                raise CommandError(f"No se pudo descargar {url}: {exc}")
+            if name.endswith((".css", ".js")):
+                data = SOURCE_MAP.sub(b"", data)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+            self.stdout.write(f"{name} descargado")
+
+        self.stdout.write(self.style.SUCCESS("Listo. Usar DJANGO_VENDOR_ASSETS=1 para servirlos localmente."))
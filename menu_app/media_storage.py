@@ -0,0 +1,182 @@
+import hashlib
+import os
+import re
+import tempfile
+import uuid
+from pathlib import Path
+
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import transaction
+
+
+# -------------------------------------------------------
+# media_storage.py
+# Storage de archivos subidos direccionado por contenido.
+# Cada archivo se guarda como images/ab/cd/<sha256>.<ext>:
+# la misma foto subida dos veces ocupa un solo archivo y su
+# nombre nunca cambia de contenido, por lo que se puede
+# cachear para siempre. Un archivo se borra cuando ningún
+# producto lo referencia (el conteo sale de la BD).
+# Un alta que reutiliza un archivo y un release() del mismo
+# pueden cruzarse: release() lo aparta, vuelve a consultar
+# y lo restaura si el alta ya confirmó; el alta, al
+# confirmarse, lo vuelve a escribir si igual falta.
+# -------------------------------------------------------
+
+PREFIX = 'images'
+NAME_RE = re.compile(rf'^{PREFIX}/[0-9a-f]{{2}}/[0-9a-f]{{2}}/([0-9a-f]{{64}})(\.[a-z0-9]{{1,8}})?$')
+
+
+def is_content_addressed(name):
+    return bool(name) and NAME_RE.match(name) is not None
+
+
+def digest_of(name):
+    """SHA-256 de un nombre direccionado por contenido (None si no lo es)."""
+    match = NAME_RE.match(name or '')
+    return match.group(1) if match else None
+
+
+def parse_range(header, size):
+    """
+    Interpreta un header Range de un solo rango de bytes. Devuelve
+    (start, end) inclusivo, None si no hay rango utilizable (se responde
+    el archivo completo) o False si el rango no se puede satisfacer.
+    """
+    match = re.fullmatch(r'bytes=(\d*)-(\d*)', (header or '').strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        # bytes=-N: los últimos N bytes
+        if not int(last):
+            return False
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        return False
+    return start, end
+
+
+class FileRange:
+    """
+    Vista de solo lectura de `length` bytes de un archivo desde su
+    posición actual. Expone fileno() para que el servidor WSGI pueda
+    usar sendfile limitado por el Content-Length de la respuesta.
+    """
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage que ignora el nombre subido y guarda cada archivo
+    según el SHA-256 de su contenido, conservando la extensión. Si el
+    archivo ya existe no se vuelve a escribir, salvo que falte al
+    confirmarse la transacción.
+
+    Los nombres absolutos (como /static/images/... de los fixtures) se
+    devuelven tal cual en url().
+    """
+    chunk_size = 64 * 1024
+
+    def get_available_name(self, name, max_length=None):
+        # El nombre definitivo lo decide _save a partir del contenido.
+        return name
+
+    def content_name(self, name, content):
+        sha256 = hashlib.sha256()
+        content.seek(0)
+        for chunk in content.chunks(self.chunk_size):
+            sha256.update(chunk)
+        content.seek(0)
+        digest = sha256.hexdigest()
+        extension = Path(name).suffix.lower()
+        if not re.fullmatch(r'\.[a-z0-9]{1,8}', extension):
+            extension = ''
+        return f'{PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{extension}'
+
+    def _save(self, name, content):
+        name = self.content_name(name, content)
+        path = Path(self.path(name))
+        if path.exists():
+            transaction.on_commit(lambda: self._restore(path, content))
+            return name
+        self._write(path, content)
+        return name
+
+    def _restore(self, path, content):
+        """Reescribe `path` si un release() lo borró antes de confirmarse el alta."""
+        if path.exists():
+            return
+        try:
+            content.seek(0)
+        except (ValueError, OSError):
+            return  # el archivo subido ya se cerró
+        self._write(path, content)
+
+    def _write(self, path, content):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Se escribe a un temporal y se renombra: dos procesos que suben
+        # la misma foto escriben el mismo contenido y ninguno ve un
+        # archivo a medias.
+        fd, temporary = tempfile.mkstemp(dir=path.parent, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as output:
+                for chunk in content.chunks(self.chunk_size):
+                    output.write(chunk)
+            if self.file_permissions_mode is not None:
+                os.chmod(temporary, self.file_permissions_mode)
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def url(self, name):
+        if name and name.startswith('/'):
+            return name
+        return super().url(name)
+
+
+def release(name, in_use):
+    """
+    Borra el archivo `name` al confirmarse la transacción si in_use(name)
+    indica que ya nadie lo referencia. Solo aplica a nombres direccionados
+    por contenido.
+    """
+    if not is_content_addressed(name):
+        return
+
+    def delete():
+        if in_use(name):
+            return
+        path = Path(default_storage.path(name))
+        # Se aparta con un rename atómico y se vuelve a consultar: un alta
+        # que confirmó en el medio lo recupera.
+        trash = path.with_name(f'.release-{uuid.uuid4().hex}')
+        try:
+            os.rename(path, trash)
+        except FileNotFoundError:
+            return
+        if in_use(name):
+            os.replace(trash, path)
+        else:
+            trash.unlink()
+
+    transaction.on_commit(delete)
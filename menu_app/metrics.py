@@ -0,0 +1,258 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+
+
+# -------------------------------------------------------
+# metrics.py
+# Contadores e histogramas en formato de texto de Prometheus.
+# Cada hilo acumula en un diccionario propio (sin locks en el
+# camino caliente); al terminar cada request se vuelca a los
+# totales del proceso, que se escriben en un archivo JSON por
+# proceso dentro de METRICS_DIR. /metrics suma los archivos
+# de todos los workers de Gunicorn; gunicorn.conf.py vacía
+# el directorio al arrancar y pasa los totales de cada
+# worker que termina a AGGREGATE_FILE, así los contadores
+# nunca retroceden. Cada archivo se reescribe a lo sumo
+# cada WRITE_INTERVAL: lo que ve /metrics de los otros
+# workers puede atrasar hasta ese tiempo.
+# -------------------------------------------------------
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+WRITE_INTERVAL = 1.0  # segundos entre escrituras del archivo del proceso
+AGGREGATE_FILE = 'aggregate.json'  # totales de los workers que terminaron
+
+_registry = {}
+_local = threading.local()
+_lock = threading.Lock()
+_totals = {}
+_write_lock = threading.Lock()
+_last_write = 0.0
+_timer = None
+
+
+class Metric:
+    """Base de Counter e Histogram: nombre, ayuda y etiquetas."""
+    kind = None
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        _registry[name] = self
+
+    def _key(self, labels):
+        return (self.name, tuple(str(labels.get(label, '')) for label in self.labelnames))
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        pending = _pending()
+        key = self._key(labels)
+        pending[key] = pending.get(key, 0) + amount
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        pending = _pending()
+        key = self._key(labels)
+        data = pending.get(key)
+        if data is None:
+            # [conteo por bucket..., +Inf, suma]
+            data = pending[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        data[bisect_left(self.buckets, value)] += 1
+        data[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+
+def _pending():
+    pending = getattr(_local, 'pending', None)
+    if pending is None:
+        pending = _local.pending = {}
+    return pending
+
+
+def _merge(target, key, value):
+    current = target.get(key)
+    if current is None:
+        target[key] = list(value) if isinstance(value, list) else value
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            current[i] += item
+    else:
+        target[key] = current + value
+
+
+def metrics_dir():
+    return Path(settings.METRICS_DIR)
+
+
+def _read(path):
+    """Filas [name, labels, value] de un archivo de métricas, o [] si no se puede leer."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return []  # no existe o un worker lo está reescribiendo
+
+
+def _write_rows(target, rows):
+    temporary = target.with_suffix('.tmp')
+    temporary.write_text(json.dumps(rows))
+    os.replace(temporary, target)
+
+
+def remove_process(pid):
+    """
+    Suma los totales de un worker que terminó a AGGREGATE_FILE y borra su
+    archivo (hook child_exit de Gunicorn, que corre solo en el proceso
+    maestro, de a un worker por vez). Solo hay contadores e histogramas,
+    que se conservan; no hay gauges que descartar.
+    """
+    directory = metrics_dir()
+    source = directory / f'{pid}.json'
+    rows = _read(source)
+    if rows:
+        aggregate = directory / AGGREGATE_FILE
+        combined = {}
+        for name, labels, value in [*_read(aggregate), *rows]:
+            _merge(combined, (name, tuple(labels)), value)
+        _write_rows(aggregate, [[name, list(labels), value] for (name, labels), value in combined.items()])
+    source.unlink(missing_ok=True)
+    directory.joinpath(f'{pid}.tmp').unlink(missing_ok=True)
+
+
+def clear():
+    """Borra los archivos de todos los procesos y el acumulado (al arrancar el servicio)."""
+    for pattern in ('*.json', '*.tmp'):
+        for path in metrics_dir().glob(pattern):
+            path.unlink(missing_ok=True)
+
+
+def _write():
+    """Reescribe el archivo del proceso con los totales actuales."""
+    global _last_write, _timer
+    with _lock:
+        _timer = None
+        _last_write = time.monotonic()
+        snapshot = [[name, list(labels), value] for (name, labels), value in _totals.items()]
+    with _write_lock:
+        directory = metrics_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        _write_rows(directory / f'{os.getpid()}.json', snapshot)
+
+
+def flush(force=False):
+    """
+    Vuelca lo acumulado por el hilo actual a los totales del proceso y
+    reescribe el archivo del proceso. Si la última escritura fue hace
+    menos de WRITE_INTERVAL (y no es force), la escritura se programa
+    para cuando se cumpla, así un worker que queda inactivo no retiene
+    sus últimos valores.
+    """
+    global _timer
+    pending = _pending()
+    with _lock:
+        for key, value in pending.items():
+            _merge(_totals, key, value)
+        pending.clear()
+        wait = WRITE_INTERVAL - (time.monotonic() - _last_write)
+        if not force and wait > 0:
+            if _timer is None:
+                _timer = threading.Timer(wait, _write)
+                _timer.daemon = True
+                _timer.start()
+            return
+    _write()
+
+
+def collect():
+    """
+    Suma los archivos de todos los procesos y el de los que terminaron.
+    Solo el proceso actual se escribe en el momento; los demás pueden
+    atrasar hasta WRITE_INTERVAL. Devuelve {(name, labels): value}.
+    """
+    flush(force=True)
+    combined = {}
+    for path in metrics_dir().glob('*.json'):
+        for name, labels, value in _read(path):
+            _merge(combined, (name, tuple(labels)), value)
+    return combined
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ''
+    return '{' + ','.join(
+        '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for name, value in pairs
+    ) + '}'
+
+
+def render(values=None):
+    """Genera la exposición en formato de texto de Prometheus 0.0.4."""
+    values = collect() if values is None else values
+    lines = []
+    for name, metric in sorted(_registry.items()):
+        lines.append(f'# HELP {name} {metric.help}')
+        lines.append(f'# TYPE {name} {metric.kind}')
+        for (key_name, labels), value in sorted(values.items()):
+            if key_name != name:
+                continue
+            if metric.kind == 'counter':
+                lines.append(f'{name}{_format_labels(metric.labelnames, labels)} {value}')
+                continue
+            cumulative = 0
+            for bound, count in zip([*metric.buckets, '+Inf'], value[:-1]):
+                cumulative += count
+                le = _format_labels(metric.labelnames, labels, [('le', bound)])
+                lines.append(f'{name}_bucket{le} {cumulative}')
+            lines.append(f'{name}_sum{_format_labels(metric.labelnames, labels)} {value[-1]}')
+            lines.append(f'{name}_count{_format_labels(metric.labelnames, labels)} {cumulative}')
+    return '\n'.join(lines) + '\n'
+
+
+# -------------------------------------------------------
+# Métricas de la aplicación
+# -------------------------------------------------------
+http_requests = Counter(
+    'http_requests_total', 'Requests atendidos por vista.', ['view', 'method', 'status']
+)
+http_duration = Histogram(
+    'http_request_duration_seconds', 'Latencia de cada request por vista.', ['view']
+)
+db_duration = Histogram(
+    'db_query_duration_seconds', 'Duración de cada consulta SQL por vista.', ['view'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+db_queries = Counter('db_queries_total', 'Consultas SQL ejecutadas por vista.', ['view'])
+cache_requests = Counter('cache_requests_total', 'Lecturas de cache por uso y resultado.', ['cache', 'result'])
+orders_placed = Counter('orders_placed_total', 'Pedidos creados.')
+order_place_duration = Histogram('order_place_duration_seconds', 'Duración de Order.place.')
+order_transitions = Counter('order_transitions_total', 'Pedidos que cambiaron de estado.', ['state'])
+allocation_duration = Histogram(
+    'booking_allocation_duration_seconds', 'Duración de la asignación de mesas de una fecha.'
+)
+bookings_seated = Counter('bookings_seated_total', 'Reservas sentadas por el asignador de mesas.')
+notifications_sent = Counter('notifications_sent_total', 'Notificaciones entregadas a usuarios.', ['kind'])
@@ -0,0 +1,130 @@
+import mimetypes
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.db import connection
+from django.http import FileResponse
+from django.utils.cache import patch_vary_headers
+
+from . import metrics
+
+
+# -------------------------------------------------------
+# middleware.py
+# Middlewares propios de la aplicación.
+# -------------------------------------------------------
+
+class StaticAssetsMiddleware:
+    """
+    Sirve los archivos de STATIC_ROOT sin pasar por las vistas.
+
+    - Elige la variante .br o .gz según Accept-Encoding y agrega
+      Vary: Accept-Encoding cuando existen variantes.
+    - Los archivos con hash del manifest se marcan como inmutables
+      por un año; el resto se cachea una hora.
+    """
+    IMMUTABLE = 'public, max-age=31536000, immutable'
+    SHORT = 'public, max-age=3600'
+    ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = '/' + settings.STATIC_URL.strip('/') + '/'
+        self.root = Path(settings.STATIC_ROOT).resolve() if settings.STATIC_ROOT else None
+        self.hashed = set(getattr(staticfiles_storage, 'hashed_files', {}).values())
+
+    def __call__(self, request):
+        if self.root and request.method in ('GET', 'HEAD') and request.path.startswith(self.prefix):
+            response = self.serve(request, request.path[len(self.prefix):])
+            if response is not None:
+                return response
+        return self.get_response(request)
+
+    @staticmethod
+    def accepted_encodings(header):
+        """
+        Codificaciones de un header Accept-Encoding como {codificación: q}.
+        Un q=0 es un rechazo explícito; un q que no se entiende cuenta como 1.
+        """
+        accepted = {}
+        for token in header.split(','):
+            encoding, *params = (part.strip() for part in token.split(';'))
+            if not encoding:
+                continue
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition('=')
+                if name.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        pass
+            accepted[encoding.lower()] = quality
+        return accepted
+
+    def serve(self, request, name):
+        path = (self.root / name).resolve()
+        if not path.is_relative_to(self.root) or not path.is_file():
+            return None
+
+        accepted = self.accepted_encodings(request.headers.get('Accept-Encoding', ''))
+        variants = [
+            (encoding, path.with_name(path.name + suffix))
+            for encoding, suffix in self.ENCODINGS
+        ]
+        variants = [(encoding, variant) for encoding, variant in variants if variant.is_file()]
+        encoding, served = next(
+            (
+                (encoding, variant)
+                for encoding, variant in variants
+                if accepted.get(encoding, accepted.get('*', 0)) > 0
+            ),
+            (None, path),
+        )
+
+        content_type, _ = mimetypes.guess_type(path.name)
+        response = FileResponse(served.open('rb'), content_type=content_type or 'application/octet-stream')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        if variants:
+            patch_vary_headers(response, ['Accept-Encoding'])
+        response.headers['Cache-Control'] = self.IMMUTABLE if name in self.hashed else self.SHORT
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Registra latencia, cantidad de requests y tiempo de cada consulta SQL
+    por vista, y vuelca las métricas del hilo al terminar el request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = []
+
+        def time_query(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                queries.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        with connection.execute_wrapper(time_query):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        match = request.resolver_match
+        view = match.view_name if match else 'sin_ruta'
+        metrics.http_requests.inc(view=view, method=request.method, status=response.status_code)
+        metrics.http_duration.observe(elapsed, view=view)
+        for duration in queries:
+            metrics.db_duration.observe(duration, view=view)
+        if queries:
+            metrics.db_queries.inc(len(queries), view=view)
+        metrics.flush()
+        return response
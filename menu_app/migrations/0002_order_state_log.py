@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-19 10:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderStateLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_state', models.CharField(choices=[('PREPARACION', 'Preparación'), ('ENVIADO', 'Enviado'), ('RECIBIDO', 'Recibido'), ('CANCELADO', 'Cancelado')], help_text='Estado anterior del pedido.', max_length=12)),
+                ('to_state', models.CharField(choices=[('PREPARACION', 'Preparación'), ('ENVIADO', 'Enviado'), ('RECIBIDO', 'Recibido'), ('CANCELADO', 'Cancelado')], help_text='Estado nuevo del pedido.', max_length=12)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora de la transición.')),
+                ('order', models.ForeignKey(help_text='Pedido cuyo estado cambió.', on_delete=django.db.models.deletion.CASCADE, related_name='state_logs', to='menu_app.order')),
+            ],
+            options={
+                'verbose_name': 'Order State Log',
+                'verbose_name_plural': 'Order State Logs',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2 on 2026-10-19 10:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0002_order_state_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStateSales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(help_text='Día al que corresponde el acumulado.')),
+                ('orders', models.IntegerField(default=0, help_text='Cantidad de pedidos.')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, help_text='Importe acumulado.', max_digits=14)),
+                ('state', models.CharField(choices=[('PREPARACION', 'Preparación'), ('ENVIADO', 'Enviado'), ('RECIBIDO', 'Recibido'), ('CANCELADO', 'Cancelado')], help_text='Estado de los pedidos.', max_length=12)),
+            ],
+            options={
+                'verbose_name': 'Daily State Sales',
+                'verbose_name_plural': 'Daily State Sales',
+                'ordering': ['day'],
+                'abstract': False,
+                'unique_together': {('day', 'state')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyCategorySales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(help_text='Día al que corresponde el acumulado.')),
+                ('orders', models.IntegerField(default=0, help_text='Cantidad de pedidos.')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, help_text='Importe acumulado.', max_digits=14)),
+                ('units', models.IntegerField(default=0, help_text='Unidades vendidas.')),
+                ('category', models.ForeignKey(blank=True, help_text='Categoría de los productos vendidos.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_sales', to='menu_app.category')),
+            ],
+            options={
+                'verbose_name': 'Daily Category Sales',
+                'verbose_name_plural': 'Daily Category Sales',
+                'ordering': ['day'],
+                'abstract': False,
+                'unique_together': {('day', 'category')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyProductSales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(help_text='Día al que corresponde el acumulado.')),
+                ('orders', models.IntegerField(default=0, help_text='Cantidad de pedidos.')),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, help_text='Importe acumulado.', max_digits=14)),
+                ('units', models.IntegerField(default=0, help_text='Unidades vendidas.')),
+                ('product', models.ForeignKey(help_text='Producto vendido.', on_delete=django.db.models.deletion.CASCADE, related_name='daily_sales', to='menu_app.product')),
+            ],
+            options={
+                'verbose_name': 'Daily Product Sales',
+                'verbose_name_plural': 'Daily Product Sales',
+                'ordering': ['day'],
+                'abstract': False,
+                'unique_together': {('day', 'product')},
+            },
+        ),
+    ]
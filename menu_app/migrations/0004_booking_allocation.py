@@ -0,0 +1,34 @@
+# Generated by Django 5.2 on 2026-10-19 10:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0003_daily_sales'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='party_size',
+            field=models.PositiveIntegerField(default=2, help_text='Cantidad de comensales.'),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='time',
+            field=models.TimeField(blank=True, help_text='Hora pedida para la reserva (opcional).', null=True),
+        ),
+        migrations.AddField(
+            model_name='tabletimeslot',
+            name='booking',
+            field=models.ForeignKey(blank=True, help_text='Reserva que ocupa la mesa en este intervalo.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='assignments', to='menu_app.booking'),
+        ),
+        migrations.AlterField(
+            model_name='table',
+            name='booking',
+            field=models.ForeignKey(blank=True, help_text='Reserva a la que pertenece la mesa.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='tables', to='menu_app.booking'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-19 10:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0004_booking_allocation'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='timeslot',
+            unique_together={('start', 'end')},
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-19 10:54
+
+import menu_app.codes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0005_timeslot_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CodeSequence',
+            fields=[
+                ('name', models.CharField(help_text='Nombre de la secuencia.', max_length=30, primary_key=True, serialize=False)),
+                ('next_value', models.BigIntegerField(default=0, help_text='Primer número todavía no reservado.')),
+            ],
+            options={
+                'verbose_name': 'Code sequence',
+                'verbose_name_plural': 'Code sequences',
+            },
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='code',
+            field=models.CharField(default=menu_app.codes.new_booking_code, help_text='Código único de la reserva.', max_length=100, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='code',
+            field=models.CharField(default=menu_app.codes.new_order_code, help_text='Código único identificador del pedido.', max_length=100, unique=True),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2 on 2026-10-19 10:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0006_code_sequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedNotification',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(help_text='Título de la notificación.', max_length=255)),
+                ('message', models.TextField(help_text='Mensaje o contenido de la notificación.')),
+                ('created_at', models.DateTimeField(help_text='Fecha y hora en que se creó la notificación.')),
+                ('is_read', models.BooleanField(default=False, help_text='Indica si la notificación había sido leída.')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora en que se archivó la notificación.')),
+                ('users', models.ManyToManyField(blank=True, help_text='Usuarios que recibieron la notificación.', related_name='archived_notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Notification',
+                'verbose_name_plural': 'Archived Notifications',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedRating',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(help_text='Título de la calificación.', max_length=255)),
+                ('text', models.TextField(help_text='Texto o comentarios de la calificación.')),
+                ('rating', models.PositiveIntegerField(help_text='Valor de la calificación.')),
+                ('created_at', models.DateTimeField(help_text='Fecha y hora de creación de la calificación.')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora en que se archivó la calificación.')),
+                ('product', models.ForeignKey(help_text='Producto al que pertenece la calificación.', on_delete=django.db.models.deletion.CASCADE, related_name='archived_ratings', to='menu_app.product')),
+                ('user', models.ForeignKey(help_text='Usuario que realizó la calificación.', on_delete=django.db.models.deletion.CASCADE, related_name='archived_ratings', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Rating',
+                'verbose_name_plural': 'Archived Ratings',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedOrder',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('buy_date', models.DateField(help_text='Fecha en que se realizó la compra.')),
+                ('code', models.CharField(help_text='Código único identificador del pedido.', max_length=100, unique=True)),
+                ('amount', models.FloatField(help_text='Importe total del pedido.')),
+                ('state', models.CharField(choices=[('PREPARACION', 'Preparación'), ('ENVIADO', 'Enviado'), ('RECIBIDO', 'Recibido'), ('CANCELADO', 'Cancelado')], help_text='Estado final del pedido.', max_length=12)),
+                ('product_ids', models.JSONField(default=list, help_text='Ids de los productos incluidos en el pedido.')),
+                ('state_log', models.JSONField(default=list, help_text='Historial de estados del pedido.')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora en que se archivó el pedido.')),
+                ('user', models.ForeignKey(help_text='Usuario que generó el pedido.', on_delete=django.db.models.deletion.CASCADE, related_name='archived_orders', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Order',
+                'verbose_name_plural': 'Archived Orders',
+                'ordering': ['-buy_date'],
+                'indexes': [models.Index(fields=['user', '-buy_date'], name='menu_app_ar_user_id_3c5059_idx')],
+            },
+        ),
+    ]
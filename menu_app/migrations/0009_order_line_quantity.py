@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-19 10:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0008_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedorder',
+            name='quantities',
+            field=models.JSONField(default=list, help_text='Unidades de cada producto, en el orden de product_ids.'),
+        ),
+        migrations.AddField(
+            model_name='orderproduct',
+            name='quantity',
+            field=models.PositiveIntegerField(default=1, help_text='Unidades del producto en el pedido.'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-19 11:06
+
+from django.db import migrations, models
+
+
+def seed_existing(apps, schema_editor):
+    """Registra el catálogo actual para que ?since=0 devuelva todo."""
+    CatalogChange = apps.get_model('menu_app', 'CatalogChange')
+    for model, name in (('Category', 'category'), ('Product', 'product')):
+        ids = apps.get_model('menu_app', model).objects.order_by('pk').values_list('pk', flat=True)
+        CatalogChange.objects.bulk_create(
+            (CatalogChange(model=name, object_id=pk, action='upsert') for pk in ids.iterator()),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0009_order_line_quantity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('model', models.CharField(help_text='Modelo del objeto modificado.', max_length=20)),
+                ('object_id', models.BigIntegerField(help_text='Id del objeto modificado.')),
+                ('action', models.CharField(choices=[('upsert', 'Alta o modificación'), ('delete', 'Baja')], help_text='Tipo de cambio.', max_length=6)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora del cambio.')),
+            ],
+            options={
+                'verbose_name': 'Catalog Change',
+                'verbose_name_plural': 'Catalog Changes',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['model', 'object_id'], name='menu_app_ca_model_e3fa5e_idx')],
+            },
+        ),
+        migrations.RunPython(seed_existing, migrations.RunPython.noop),
+    ]
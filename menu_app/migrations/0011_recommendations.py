@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-19 11:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0010_catalog_change'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductPair',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('orders', models.PositiveIntegerField(help_text='Pedidos que incluyen a ambos productos.')),
+                ('other', models.ForeignKey(help_text='Producto pedido junto con el anterior.', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='menu_app.product')),
+                ('product', models.ForeignKey(help_text='Producto.', on_delete=django.db.models.deletion.CASCADE, related_name='pairs', to='menu_app.product')),
+            ],
+            options={
+                'verbose_name': 'Product Pair',
+                'verbose_name_plural': 'Product Pairs',
+                'unique_together': {('product', 'other')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(help_text='Posición de la recomendación (0 es la mejor).')),
+                ('orders', models.PositiveIntegerField(help_text='Pedidos que incluyen a ambos productos.')),
+                ('product', models.ForeignKey(help_text='Producto para el que se recomienda.', on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='menu_app.product')),
+                ('recommended', models.ForeignKey(help_text='Producto recomendado.', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='menu_app.product')),
+            ],
+            options={
+                'verbose_name': 'Product Recommendation',
+                'verbose_name_plural': 'Product Recommendations',
+                'ordering': ['rank'],
+                'unique_together': {('product', 'rank')},
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_unit_price(apps, schema_editor):
+    """Las líneas existentes toman el precio actual: es el único que se conoce."""
+    OrderProduct = apps.get_model('menu_app', 'OrderProduct')
+    Product = apps.get_model('menu_app', 'Product')
+    OrderProduct.objects.update(
+        unit_price=Subquery(Product.objects.filter(pk=OuterRef('product_id')).values('price')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0011_recommendations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderproduct',
+            name='unit_price',
+            field=models.DecimalField(decimal_places=2, help_text='Precio unitario al momento del pedido.', max_digits=10, null=True),
+        ),
+        migrations.RunPython(backfill_unit_price, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='orderproduct',
+            name='unit_price',
+            field=models.DecimalField(decimal_places=2, help_text='Precio unitario al momento del pedido.', max_digits=10),
+        ),
+    ]
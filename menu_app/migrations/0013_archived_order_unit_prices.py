@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0012_order_line_unit_price'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedorder',
+            name='unit_prices',
+            field=models.JSONField(default=list, help_text='Precio unitario al momento del pedido, en el orden de product_ids.'),
+        ),
+    ]
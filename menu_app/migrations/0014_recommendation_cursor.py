@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+def move_cursor(apps, schema_editor):
+    """El avance guardado en CodeSequence('recommendations') pasa al cursor propio."""
+    CodeSequence = apps.get_model('menu_app', 'CodeSequence')
+    RecommendationCursor = apps.get_model('menu_app', 'RecommendationCursor')
+    sequence = CodeSequence.objects.filter(name='recommendations').first()
+    if sequence is not None:
+        RecommendationCursor.objects.create(pk=1, next_order=sequence.next_value)
+        sequence.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu_app', '0013_archived_order_unit_prices'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('next_order', models.BigIntegerField(default=0, help_text='Primer id de pedido sin contar.')),
+                ('recent', models.JSONField(default=list, help_text='Ids ya contados de la ventana anterior a next_order.')),
+                ('revision', models.PositiveBigIntegerField(default=0, help_text='Cantidad de avances del cursor.')),
+            ],
+            options={
+                'verbose_name': 'Recommendation cursor',
+                'verbose_name_plural': 'Recommendation cursors',
+            },
+        ),
+        migrations.RunPython(move_cursor, migrations.RunPython.noop),
+    ]
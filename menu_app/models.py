@@ -1,6 +1,13 @@
-from django.db import models
+from collections import Counter
+from decimal import Decimal
+
+from django.db import DatabaseError, IntegrityError, models, transaction
+from django.db.models import Case, F, Q, Value, When
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
+from django.utils import timezone
+
+from . import catalog_version, codes, media_storage, metrics, stock
 
 # -------------------------------------------------------
 # models.py
@@ -147,6 +154,8 @@ class Booking(models.Model):
       - code: código único de la reserva
       - observations: comentarios u observaciones
       - date: fecha de la reserva
+      - time: hora pedida (opcional, sin hora admite cualquier turno)
+      - party_size: cantidad de comensales
     """
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -166,6 +175,7 @@ class Booking(models.Model):
     code = models.CharField(
         max_length=100,
         unique=True,
+        default=codes.new_booking_code,
         help_text="Código único de la reserva."
     )
     observations = models.TextField(
@@ -175,15 +185,75 @@ class Booking(models.Model):
     date = models.DateField(
         help_text="Fecha programada de la reserva."
     )
+    time = models.TimeField(
+        null=True,
+        blank=True,
+        help_text="Hora pedida para la reserva (opcional)."
+    )
+    party_size = models.PositiveIntegerField(
+        default=2,
+        help_text="Cantidad de comensales."
+    )
 
     class Meta:
         ordering = ['-date']
+        indexes = [
+            models.Index(fields=['user', '-date']),
+            models.Index(fields=['date']),
+        ]
         verbose_name = 'Booking'
         verbose_name_plural = 'Bookings'
 
     def __str__(self):
         return f"Booking {self.code} - {self.user.username}"
 
+    @classmethod
+    def bulk_approve(cls, queryset, approval_date=None):
+        """
+        Aprueba las reservas pendientes de `queryset` con un único UPDATE,
+        avisa a cada usuario con una notificación que lista sus reservas y
+        marca como reservadas las mesas vinculadas, todo en una transacción
+        y con un número fijo de consultas.
+
+        Devuelve (approved, skipped): reservas aprobadas y reservas que ya
+        estaban aprobadas.
+        """
+        approval_date = approval_date or timezone.localdate()
+        with transaction.atomic():
+            # Se bloquea por pk: un queryset con joins puede repetir reservas.
+            rows = list(
+                cls.objects.filter(pk__in=queryset.order_by().values('pk'))
+                .select_for_update()
+                .order_by('date', 'time', 'pk')
+                .values_list('pk', 'user_id', 'code', 'date', 'time', 'approved')
+            )
+            pending = [row for row in rows if not row[5]]
+            if not pending:
+                return 0, len(rows)
+            ids = [row[0] for row in pending]
+            cls.objects.filter(pk__in=ids).update(approved=True, approval_date=approval_date)
+
+            lines = {}
+            for _, user_id, code, day, time, _ in pending:
+                when = f"{day:%d/%m/%Y}" + (f" a las {time:%H:%M}" if time else "")
+                lines.setdefault(user_id, []).append(f"Reserva {code} para el {when}.")
+            notifications = Notification.objects.bulk_create(
+                Notification(
+                    title='Reserva aprobada' if len(user_lines) == 1 else 'Reservas aprobadas',
+                    message='\n'.join(user_lines),
+                )
+                for user_lines in lines.values()
+            )
+            UserNotification.objects.bulk_create(
+                UserNotification(user_id=user_id, notification=notification)
+                for user_id, notification in zip(lines, notifications)
+            )
+            Table.objects.filter(
+                models.Q(booking_id__in=ids) | models.Q(tabletimeslot__booking_id__in=ids)
+            ).update(is_reserved=True)
+        metrics.notifications_sent.inc(len(notifications), kind='booking_approved')
+        return len(pending), len(rows) - len(pending)
+
 
 # -------------------------------------------------------
 # Order model
@@ -214,6 +284,7 @@ class Order(models.Model):
     code = models.CharField(
         max_length=100,
         unique=True,
+        default=codes.new_order_code,
         help_text="Código único identificador del pedido."
     )
     amount = models.FloatField(
@@ -239,14 +310,223 @@ class Order(models.Model):
         related_name='orders',
         help_text="Productos incluidos en el pedido."
     )
+    # Transiciones permitidas: estado origen -> estados destino válidos.
+    # RECIBIDO y CANCELADO son estados finales.
+    TRANSITIONS = {
+        'PREPARACION': ('ENVIADO', 'CANCELADO'),
+        'ENVIADO': ('RECIBIDO', 'CANCELADO'),
+        'RECIBIDO': (),
+        'CANCELADO': (),
+    }
+
     class Meta:
         ordering = ['-buy_date']
+        indexes = [models.Index(fields=['user', '-buy_date'])]
         verbose_name = 'Order'
         verbose_name_plural = 'Orders'
 
     def __str__(self):
         return f"Order {self.code} - {self.user.username}"
 
+    @classmethod
+    def place(cls, user, products, code=None, buy_date=None, quantities=None):
+        """
+        Crea un pedido con sus productos, descuenta el stock y actualiza los
+        acumulados diarios de ventas. Sin `code` se genera uno con
+        codes.new_order_code.
+        `quantities` indica las unidades por id de producto (1 por defecto).
+        Devuelve (order, None) o (None, errors); sin stock suficiente los
+        errores van por id de producto, como en Cart.revalidate.
+        """
+        products = list({product.pk: product for product in products}.values())
+        if not products:
+            return None, {'products': 'El pedido debe incluir al menos un producto'}
+        quantities = {product.pk: (quantities or {}).get(product.pk, 1) for product in products}
+        if any(quantity < 1 for quantity in quantities.values()):
+            return None, {'quantity': 'La cantidad debe ser al menos 1'}
+
+        try:
+            with metrics.order_place_duration.time(), transaction.atomic():
+                # Primero el stock: si no alcanza, no se escribe nada más.
+                Product.move_stock({pk: -quantity for pk, quantity in quantities.items()})
+                order = cls.objects.create(
+                    user=user,
+                    buy_date=buy_date or timezone.localdate(),
+                    code=code or codes.new_order_code(),
+                    amount=float(sum(product.price * quantities[product.pk] for product in products)),
+                )
+                OrderProduct.objects.bulk_create(
+                    OrderProduct(
+                        order=order, product=product, quantity=quantities[product.pk], unit_price=product.price
+                    )
+                    for product in products
+                )
+                DailySales.record_lines(
+                    [
+                        (order.pk, order.buy_date, product.pk, product.category_id, product.price,
+                         quantities[product.pk])
+                        for product in products
+                    ],
+                    sign=1,
+                )
+                DailyStateSales.record_states(
+                    Counter({(order.buy_date, order.state): 1}),
+                    Counter({(order.buy_date, order.state): order.amount}),
+                )
+        except OutOfStock as exc:
+            names = {product.pk: product.name for product in products}
+            return None, {
+                pk: f'No quedan unidades suficientes de {names.get(pk, pk)}' for pk in exc.product_ids
+            }
+        metrics.orders_placed.inc()
+        return order, None
+
+    @classmethod
+    def sources_for(cls, state):
+        """Estados desde los que se puede pasar a `state`."""
+        return [origin for origin, targets in cls.TRANSITIONS.items() if state in targets]
+
+    def can_transition(self, state):
+        return state in self.TRANSITIONS.get(self.state, ())
+
+    def transition(self, state):
+        """
+        Cambia el estado del pedido si la transición es válida y la registra
+        en OrderStateLog. Devuelve (bool, errors) como Product.new.
+        """
+        if state not in self.TRANSITIONS:
+            return False, {'state': 'Estado inexistente'}
+        if not self.can_transition(state):
+            return False, {'state': f'No se puede pasar de {self.state} a {state}'}
+
+        with transaction.atomic():
+            # UPDATE condicionado al estado leído: si otro proceso cambió
+            # el pedido en el medio, no se pisa su transición.
+            updated = Order.objects.filter(pk=self.pk, state=self.state).update(state=state)
+            if not updated:
+                return False, {'state': 'El pedido fue modificado por otro proceso'}
+            OrderStateLog.objects.create(order=self, from_state=self.state, to_state=state)
+            self._record_transitions([(self.pk, self.state, self.buy_date, self.amount)], state)
+        metrics.order_transitions.inc(state=state)
+        self.state = state
+        return True, None
+
+    @classmethod
+    def bulk_transition(cls, queryset, state):
+        """
+        Pasa a `state` todos los pedidos de `queryset` en un único UPDATE
+        condicionado y registra las transiciones con un solo bulk_create.
+
+        Devuelve (transitioned, rejected): cantidad de pedidos actualizados y
+        cantidad de pedidos rechazados por no admitir la transición.
+        """
+        if state not in cls.TRANSITIONS:
+            raise ValueError(f"Estado inexistente: {state}")
+        sources = cls.sources_for(state)
+
+        with transaction.atomic():
+            # pk__in quita los repetidos de un queryset con joins y
+            # select_for_update bloquea los pedidos hasta el UPDATE, así el
+            # registro y los acumulados corresponden a las filas cambiadas.
+            rows = list(
+                cls.objects.filter(pk__in=queryset.order_by().values('pk'))
+                .select_for_update()
+                .order_by('pk')
+                .values_list('pk', 'state', 'buy_date', 'amount')
+            )
+            valid = [row for row in rows if row[1] in sources]
+            transitioned = 0
+            if valid:
+                transitioned = cls.objects.filter(
+                    pk__in=[row[0] for row in valid],
+                    state__in=sources,
+                ).update(state=state)
+                if transitioned != len(valid):
+                    # Sin bloqueo de filas (SQLite) otro proceso pudo cambiar
+                    # alguno en el medio: se deshace todo antes que registrar mal.
+                    raise DatabaseError('Los pedidos fueron modificados por otro proceso')
+                OrderStateLog.objects.bulk_create(
+                    OrderStateLog(order_id=pk, from_state=origin, to_state=state)
+                    for pk, origin, _, _ in valid
+                )
+                cls._record_transitions(valid, state)
+        metrics.order_transitions.inc(transitioned, state=state)
+        return transitioned, len(rows) - transitioned
+
+    @classmethod
+    def _record_transitions(cls, rows, state):
+        """
+        Refleja en los acumulados diarios un cambio de estado de `rows`
+        (tuplas pk, estado anterior, buy_date, amount). Al cancelar, las
+        líneas del pedido dejan de contar como venta y sus unidades vuelven
+        al stock.
+        """
+        counts = Counter()
+        amounts = Counter()
+        for _, origin, day, amount in rows:
+            counts[(day, origin)] -= 1
+            amounts[(day, origin)] -= amount
+            counts[(day, state)] += 1
+            amounts[(day, state)] += amount
+        DailyStateSales.record_states(counts, amounts)
+
+        if state == 'CANCELADO':
+            lines = OrderProduct.objects.filter(
+                order_id__in=[row[0] for row in rows],
+            ).values_list(
+                'order_id', 'order__buy_date', 'product_id', 'product__category_id', 'unit_price', 'quantity'
+            )
+            lines = list(lines)
+            DailySales.record_lines(lines, sign=-1)
+            restock = Counter()
+            for _, _, product_id, _, _, quantity in lines:
+                restock[product_id] += quantity
+            Product.move_stock(restock)
+
+
+# -------------------------------------------------------
+# OrderStateLog model
+# Registro compacto de las transiciones de estado de un pedido.
+# -------------------------------------------------------
+class OrderStateLog(models.Model):
+    """
+    Registro de auditoría de los cambios de estado de Order.
+
+    Atributos:
+      - order: pedido afectado
+      - from_state: estado anterior
+      - to_state: estado nuevo
+      - created_at: fecha y hora de la transición
+    """
+    order = models.ForeignKey(
+        Order,
+        on_delete=models.CASCADE,
+        related_name='state_logs',
+        help_text="Pedido cuyo estado cambió."
+    )
+    from_state = models.CharField(
+        max_length=12,
+        choices=Order.STATE_CHOICES,
+        help_text="Estado anterior del pedido."
+    )
+    to_state = models.CharField(
+        max_length=12,
+        choices=Order.STATE_CHOICES,
+        help_text="Estado nuevo del pedido."
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Fecha y hora de la transición."
+    )
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Order State Log'
+        verbose_name_plural = 'Order State Logs'
+
+    def __str__(self):
+        return f"Order {self.order_id}: {self.from_state} -> {self.to_state}"
+
 
 # -------------------------------------------------------
 # Category model
@@ -283,12 +563,104 @@ class Category(models.Model):
         return self.name
 
 
+# -------------------------------------------------------
+# DirtyFieldsMixin
+# Guarda una copia de los valores leídos de la BD para que
+# save() escriba solo las columnas modificadas.
+# -------------------------------------------------------
+class DirtyFieldsMixin:
+    """
+    Mixin para modelos que hace que save() use update_fields con las
+    columnas que cambiaron desde la última lectura o guardado, y que no
+    ejecute ningún UPDATE si no cambió nada.
+
+    Las instancias nuevas y los save() con update_fields explícito se
+    comportan como siempre. Los campos que modifica pre_save (por ejemplo
+    auto_now) no se detectan: hay que incluirlos a mano en update_fields.
+    """
+
+    def _field_values(self):
+        values = {}
+        loaded = self.__dict__
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.attname not in loaded:
+                continue
+            value = loaded[field.attname]
+            # Los archivos se comparan por nombre (FieldFile no es copiable).
+            values[field.attname] = getattr(value, 'name', value) if isinstance(field, models.FileField) else value
+        return values
+
+    def _take_snapshot(self):
+        self._loaded_values = self._field_values()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._take_snapshot()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._take_snapshot()
+
+    def get_dirty_fields(self):
+        """
+        Nombres de los campos modificados desde la última lectura. Un campo
+        diferido que se cargó después cuenta como modificado.
+        """
+        snapshot = getattr(self, '_loaded_values', None)
+        if snapshot is None:
+            return [field.name for field in self._meta.concrete_fields if not field.primary_key]
+        current = self._field_values()
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if field.attname in current
+            and (field.attname not in snapshot or snapshot[field.attname] != current[field.attname])
+        ]
+
+    def save(self, *args, **kwargs):
+        tracked = (
+            getattr(self, '_loaded_values', None) is not None
+            and not self._state.adding
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+            and not args
+        )
+        if tracked:
+            dirty = self.get_dirty_fields()
+            if not dirty:
+                return
+            kwargs['update_fields'] = dirty
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or getattr(self, '_loaded_values', None) is None:
+            self._take_snapshot()
+        else:
+            # Solo quedan limpios los campos que se escribieron.
+            saved = {self._meta.get_field(name).attname for name in update_fields}
+            current = self._field_values()
+            self._loaded_values.update({name: current[name] for name in saved if name in current})
+
+
+class OutOfStock(Exception):
+    """
+    Product.move_stock no pudo descontar: `product_ids` son los productos
+    sin unidades suficientes (o inexistentes).
+    """
+
+    def __init__(self, product_ids):
+        super().__init__(f'Stock insuficiente: {product_ids}')
+        self.product_ids = product_ids
+
+
 # -------------------------------------------------------
 # Product model
 # Representa un producto que puede recibir valoraciones.
 # Representa un producto que pertenece a una categoría.
 # -------------------------------------------------------
-class Product(models.Model):
+class Product(DirtyFieldsMixin, models.Model):
     """
     Producto del catálogo, con validaciones y métodos auxiliares.
 
@@ -333,12 +705,65 @@ class Product(models.Model):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['category', 'name']),
+            models.Index(fields=['name']),
+        ]
         verbose_name = 'Product'
         verbose_name_plural = 'Products'
 
     def __str__(self):
         return self.name
 
+    @classmethod
+    def release_image(cls, name):
+        """Borra la imagen `name` si ya ningún producto la usa."""
+        media_storage.release(name, lambda name: cls.objects.filter(image=name).exists())
+
+    @classmethod
+    def move_stock(cls, deltas):
+        """
+        Suma `deltas` ({id: unidades}, negativas para descontar) a
+        Product.quantity con un solo UPDATE y mueve los contadores de
+        stock.py al confirmarse la transacción. Solo los productos que se
+        agotan o vuelven a tener stock cuentan como cambio del catálogo:
+        el resto de los pedidos no invalida la versión (ETag) de la API.
+
+        Cada descuento se condiciona a que alcance el stock: si alguna
+        fila no se actualiza, no se mueve nada y se lanza OutOfStock (para
+        que la transacción del llamador también se revierta).
+        """
+        deltas = {pk: delta for pk, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        condition = Q(pk__in=[pk for pk, delta in deltas.items() if delta > 0])
+        for pk, delta in deltas.items():
+            if delta < 0:
+                condition |= Q(pk=pk, quantity__gte=-delta)
+        try:
+            with transaction.atomic():
+                updated = cls.objects.filter(condition).update(
+                    quantity=F('quantity') + Case(
+                        *[When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()],
+                        output_field=models.IntegerField(),
+                    )
+                )
+                if updated != len(deltas):
+                    raise OutOfStock([])
+                flipped = [
+                    pk
+                    for pk, quantity in cls.objects.filter(pk__in=deltas).values_list('pk', 'quantity')
+                    if (quantity > 0) != (quantity - deltas[pk] > 0)
+                ]
+        except OutOfStock:
+            # Ya revertido el UPDATE: se informa qué productos no alcanzaron.
+            available = dict(cls.objects.filter(pk__in=deltas).values_list('pk', 'quantity'))
+            raise OutOfStock([
+                pk for pk, delta in deltas.items() if pk not in available or available[pk] + delta < 0
+            ])
+        CatalogChange.record('product', flipped)
+        stock.adjust(deltas)
+
     @classmethod
     def validate(cls, name, description, price):
         errors = {}
@@ -351,7 +776,7 @@ class Product(models.Model):
         return errors
 
     @classmethod
-    def new(cls, category, name, description, price, quantity, image=None):
+    def new(cls, category=None, name=None, description=None, price=None, quantity=0, image=None):
         errors = cls.validate(name, description, price)
         if errors:
             return False, errors
@@ -375,6 +800,88 @@ class Product(models.Model):
             self.image = image
         self.save()
 
+    # Campos que aceptan new_many y update_many en cada payload
+    PAYLOAD_FIELDS = ('category', 'name', 'description', 'price', 'quantity', 'image')
+
+    @classmethod
+    def validate_many(cls, payloads):
+        """Valida una lista de payloads; devuelve los errores de cada índice."""
+        return [
+            cls.validate(payload.get('name'), payload.get('description'), payload.get('price'))
+            for payload in payloads
+        ]
+
+    @classmethod
+    def new_many(cls, payloads, batch_size=500):
+        """
+        Versión por lotes de new: valida todos los payloads y crea los
+        válidos con un solo bulk_create. Devuelve, por índice,
+        (True, product) o (False, errors).
+        """
+        results = []
+        products = []
+        for payload, errors in zip(payloads, cls.validate_many(payloads)):
+            if errors:
+                results.append((False, errors))
+                continue
+            product = cls(quantity=0)
+            for field in cls.PAYLOAD_FIELDS:
+                if payload.get(field) is not None:
+                    setattr(product, field, payload[field])
+            products.append(product)
+            results.append((True, product))
+        cls.objects.bulk_create(products, batch_size=batch_size)
+        CatalogChange.record('product', [product.pk for product in products])
+        return results
+
+    @classmethod
+    def update_many(cls, payloads, batch_size=500):
+        """
+        Versión por lotes de update. Cada payload lleva 'pk' y los campos
+        a cambiar; un valor None deja el campo como está. Los productos se
+        leen con una consulta y se guardan con bulk_update agrupando por
+        los campos que realmente cambiaron.
+
+        Devuelve, por índice, (True, campos cambiados) o (False, errors).
+        """
+        products = cls.objects.in_bulk([payload.get('pk') for payload in payloads])
+        results = []
+        groups = {}
+        for payload in payloads:
+            product = products.get(payload.get('pk'))
+            if product is None:
+                results.append((False, {'pk': 'Producto inexistente'}))
+                continue
+            values = {
+                field: payload[field] if payload.get(field) is not None else getattr(product, field)
+                for field in ('name', 'description', 'price')
+            }
+            errors = cls.validate(**values)
+            if errors:
+                results.append((False, errors))
+                continue
+
+            changed = []
+            for field in cls.PAYLOAD_FIELDS:
+                value = payload.get(field)
+                # category se compara por id para no leer la categoría actual
+                attname = 'category_id' if field == 'category' else field
+                if field == 'category' and isinstance(value, Category):
+                    value = value.pk
+                if value is not None and value != getattr(product, attname):
+                    setattr(product, attname, value)
+                    changed.append(field)
+            if changed:
+                groups.setdefault(tuple(changed), {})[product.pk] = product
+            results.append((True, changed))
+
+        with transaction.atomic():
+            for fields, group in groups.items():
+                cls.objects.bulk_update(group.values(), fields, batch_size=batch_size)
+            CatalogChange.record('product', [pk for group in groups.values() for pk in group])
+            stock.forget([pk for fields, group in groups.items() if 'quantity' in fields for pk in group])
+        return results
+
 # -------------------------------------------------------
 # Rating model
 # Representa una calificación realizada por un usuario.
@@ -422,6 +929,7 @@ class Rating(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['product', '-created_at'])]
         verbose_name = 'Rating'
         verbose_name_plural = 'Ratings'
 
@@ -450,6 +958,8 @@ class Table(models.Model):
         Booking,
         on_delete=models.CASCADE, # Esta es una entidad débil
         related_name='tables',
+        null=True,
+        blank=True,
         help_text="Reserva a la que pertenece la mesa."
     )
     capacity = models.IntegerField(
@@ -507,6 +1017,8 @@ class TimeSlot(models.Model):
 
     class Meta:
         ordering = ['start']
+        # Permite regenerar el calendario sin duplicar intervalos
+        unique_together = ('start', 'end')
         verbose_name = 'TimeSlot'
         verbose_name_plural = 'TimeSlots'
 
@@ -526,6 +1038,7 @@ class TableTimeSlot(models.Model):
     Atributos:
       - table: referencia a Table
       - timeslot: referencia a TimeSlot
+      - booking: reserva asignada a la mesa en ese intervalo (opcional)
     """
     table = models.ForeignKey(
         Table,
@@ -537,6 +1050,14 @@ class TableTimeSlot(models.Model):
         on_delete=models.CASCADE,
         help_text="Intervalo de tiempo asociado a la mesa."
     )
+    booking = models.ForeignKey(
+        Booking,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='assignments',
+        help_text="Reserva que ocupa la mesa en este intervalo."
+    )
 
     class Meta:
         unique_together = ('table', 'timeslot')
@@ -558,6 +1079,8 @@ class OrderProduct(models.Model):
     Atributos:
       - order: referencia a Order
       - product: referencia a Product
+      - quantity: unidades del producto en el pedido
+      - unit_price: precio del producto al hacer el pedido
     """
     order = models.ForeignKey(
         Order,
@@ -569,6 +1092,15 @@ class OrderProduct(models.Model):
         on_delete=models.CASCADE,
         help_text="Producto asociado."
     )
+    quantity = models.PositiveIntegerField(
+        default=1,
+        help_text="Unidades del producto en el pedido."
+    )
+    unit_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        help_text="Precio unitario al momento del pedido."
+    )
 
     class Meta:
         unique_together = ('order', 'product')
@@ -578,5 +1110,555 @@ class OrderProduct(models.Model):
     def __str__(self):
         return f"Order {self.order.code} - Product {self.product.title}"
 
+
+# -------------------------------------------------------
+# Acumulados diarios de ventas
+# Tablas de resumen por día que se actualizan al crear o
+# cancelar pedidos, para que los reportes lean pocas filas
+# en lugar de recorrer todo Order / OrderProduct.
 # -------------------------------------------------------
+class DailySales(models.Model):
+    """
+    Base abstracta de los acumulados diarios.
 
+    Atributos:
+      - day: día de compra (Order.buy_date)
+      - orders: cantidad de pedidos
+      - revenue: importe acumulado
+    """
+    day = models.DateField(
+        help_text="Día al que corresponde el acumulado."
+    )
+    orders = models.IntegerField(
+        default=0,
+        help_text="Cantidad de pedidos."
+    )
+    revenue = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text="Importe acumulado."
+    )
+
+    class Meta:
+        abstract = True
+        ordering = ['day']
+
+    @classmethod
+    def accumulate(cls, lookup, **deltas):
+        """
+        Suma `deltas` a la fila `lookup` con F(), creándola si no existe.
+        Si otro proceso crea la fila entre el UPDATE y el INSERT, el
+        INSERT choca con unique_together y se repite el UPDATE.
+        """
+        increments = {field: F(field) + value for field, value in deltas.items()}
+        if cls.objects.filter(**lookup).update(**increments):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(**lookup, **deltas)
+        except IntegrityError:
+            cls.objects.filter(**lookup).update(**increments)
+
+    @staticmethod
+    def record_lines(lines, sign):
+        """
+        Acumula líneas de pedido (order_id, buy_date, product_id, category_id,
+        price, quantity) en los resúmenes por producto y por categoría. `sign`
+        es 1 al crear el pedido y -1 al cancelarlo.
+        """
+        by_product = {}
+        by_category = {}
+        for order_id, day, product_id, category_id, price, quantity in lines:
+            # OrderProduct es único por (order, product): cada línea es un pedido distinto.
+            orders, units, revenue = by_product.get((day, product_id), (0, 0, Decimal(0)))
+            by_product[(day, product_id)] = (orders + 1, units + quantity, revenue + price * quantity)
+            orders, units, revenue = by_category.get((day, category_id), (set(), 0, Decimal(0)))
+            orders.add(order_id)
+            by_category[(day, category_id)] = (orders, units + quantity, revenue + price * quantity)
+
+        for (day, product_id), (orders, units, revenue) in by_product.items():
+            DailyProductSales.accumulate(
+                {'day': day, 'product_id': product_id},
+                orders=sign * orders, units=sign * units, revenue=sign * revenue,
+            )
+        for (day, category_id), (orders, units, revenue) in by_category.items():
+            DailyCategorySales.accumulate(
+                {'day': day, 'category_id': category_id},
+                orders=sign * len(orders), units=sign * units, revenue=sign * revenue,
+            )
+
+
+class DailyProductSales(DailySales):
+    """
+    Ventas por producto y por día (excluye pedidos cancelados).
+
+    Atributos:
+      - product: producto vendido
+      - units: unidades vendidas
+    """
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='daily_sales',
+        help_text="Producto vendido."
+    )
+    units = models.IntegerField(
+        default=0,
+        help_text="Unidades vendidas."
+    )
+
+    class Meta(DailySales.Meta):
+        unique_together = ('day', 'product')
+        verbose_name = 'Daily Product Sales'
+        verbose_name_plural = 'Daily Product Sales'
+
+    def __str__(self):
+        return f"{self.day} - Product {self.product_id}: {self.units}"
+
+
+class DailyCategorySales(DailySales):
+    """
+    Ventas por categoría y por día (excluye pedidos cancelados).
+    Los productos sin categoría se acumulan con category NULL.
+
+    Atributos:
+      - category: categoría de los productos vendidos
+      - units: unidades vendidas
+    """
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='daily_sales',
+        help_text="Categoría de los productos vendidos."
+    )
+    units = models.IntegerField(
+        default=0,
+        help_text="Unidades vendidas."
+    )
+
+    class Meta(DailySales.Meta):
+        unique_together = ('day', 'category')
+        verbose_name = 'Daily Category Sales'
+        verbose_name_plural = 'Daily Category Sales'
+
+    def __str__(self):
+        return f"{self.day} - Category {self.category_id}: {self.units}"
+
+
+class DailyStateSales(DailySales):
+    """
+    Pedidos e importe (Order.amount) por estado y por día.
+
+    Atributos:
+      - state: estado de los pedidos
+    """
+    state = models.CharField(
+        max_length=12,
+        choices=Order.STATE_CHOICES,
+        help_text="Estado de los pedidos."
+    )
+
+    class Meta(DailySales.Meta):
+        unique_together = ('day', 'state')
+        verbose_name = 'Daily State Sales'
+        verbose_name_plural = 'Daily State Sales'
+
+    def __str__(self):
+        return f"{self.day} - {self.state}: {self.orders}"
+
+    @classmethod
+    def record_states(cls, counts, amounts):
+        """Acumula deltas de pedidos e importe indexados por (day, state)."""
+        for (day, state), orders in counts.items():
+            if orders or amounts[(day, state)]:
+                cls.accumulate(
+                    {'day': day, 'state': state},
+                    orders=orders, revenue=Decimal(str(round(amounts[(day, state)], 2))),
+                )
+
+
+# -------------------------------------------------------
+# CodeSequence model
+# Secuencias de las que codes.py reserva bloques de números.
+# -------------------------------------------------------
+class CodeSequence(models.Model):
+    """
+    Modelo que guarda el próximo número libre de cada secuencia de códigos.
+
+    Atributos:
+      - name: nombre de la secuencia ('order', 'booking')
+      - next_value: primer número todavía no reservado
+    """
+    name = models.CharField(
+        max_length=30,
+        primary_key=True,
+        help_text="Nombre de la secuencia."
+    )
+    next_value = models.BigIntegerField(
+        default=0,
+        help_text="Primer número todavía no reservado."
+    )
+
+    class Meta:
+        verbose_name = 'Code sequence'
+        verbose_name_plural = 'Code sequences'
+
+    def __str__(self):
+        return f"{self.name}: {self.next_value}"
+
+
+# -------------------------------------------------------
+# Archive models
+# Copias de pedidos, calificaciones y notificaciones viejas.
+# archive.py mueve las filas por lotes para que las tablas
+# principales (y sus índices) no crezcan indefinidamente.
+# Los acumulados diarios de ventas no se tocan al archivar.
+# -------------------------------------------------------
+class ArchivedOrder(models.Model):
+    """
+    Pedido archivado. Conserva el id y los campos de Order.
+
+    Atributos:
+      - user, buy_date, code, amount, state: como en Order
+      - product_ids: ids de los productos del pedido
+      - quantities: unidades de cada producto de product_ids
+      - unit_prices: precio unitario (texto decimal) de cada producto de product_ids
+      - state_log: transiciones [from_state, to_state, created_at]
+      - archived_at: fecha y hora en que se archivó
+    """
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_orders',
+        help_text="Usuario que generó el pedido."
+    )
+    buy_date = models.DateField(
+        help_text="Fecha en que se realizó la compra."
+    )
+    code = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="Código único identificador del pedido."
+    )
+    amount = models.FloatField(
+        help_text="Importe total del pedido."
+    )
+    state = models.CharField(
+        max_length=12,
+        choices=Order.STATE_CHOICES,
+        help_text="Estado final del pedido."
+    )
+    product_ids = models.JSONField(
+        default=list,
+        help_text="Ids de los productos incluidos en el pedido."
+    )
+    quantities = models.JSONField(
+        default=list,
+        help_text="Unidades de cada producto, en el orden de product_ids."
+    )
+    unit_prices = models.JSONField(
+        default=list,
+        help_text="Precio unitario al momento del pedido, en el orden de product_ids."
+    )
+    state_log = models.JSONField(
+        default=list,
+        help_text="Historial de estados del pedido."
+    )
+    archived_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Fecha y hora en que se archivó el pedido."
+    )
+
+    class Meta:
+        ordering = ['-buy_date']
+        indexes = [models.Index(fields=['user', '-buy_date'])]
+        verbose_name = 'Archived Order'
+        verbose_name_plural = 'Archived Orders'
+
+    def __str__(self):
+        return f"Order {self.code} (archivado)"
+
+    @property
+    def products(self):
+        """Productos del pedido que todavía existen en el catálogo."""
+        return Product.objects.filter(pk__in=self.product_ids)
+
+
+class ArchivedRating(models.Model):
+    """
+    Calificación archivada. Conserva el id y los campos de Rating.
+
+    Atributos:
+      - user, product, title, text, rating, created_at: como en Rating
+      - archived_at: fecha y hora en que se archivó
+    """
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_ratings',
+        help_text="Usuario que realizó la calificación."
+    )
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='archived_ratings',
+        help_text="Producto al que pertenece la calificación."
+    )
+    title = models.CharField(
+        max_length=255,
+        help_text="Título de la calificación."
+    )
+    text = models.TextField(
+        help_text="Texto o comentarios de la calificación."
+    )
+    rating = models.PositiveIntegerField(
+        help_text="Valor de la calificación."
+    )
+    created_at = models.DateTimeField(
+        help_text="Fecha y hora de creación de la calificación."
+    )
+    archived_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Fecha y hora en que se archivó la calificación."
+    )
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Archived Rating'
+        verbose_name_plural = 'Archived Ratings'
+
+    def __str__(self):
+        return f"Rating {self.rating} - {self.title} (archivada)"
+
+
+class ArchivedNotification(models.Model):
+    """
+    Notificación archivada junto con sus destinatarios.
+
+    Atributos:
+      - title, message, created_at, is_read: como en Notification
+      - users: usuarios que la recibieron
+      - archived_at: fecha y hora en que se archivó
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(
+        max_length=255,
+        help_text="Título de la notificación."
+    )
+    message = models.TextField(
+        help_text="Mensaje o contenido de la notificación."
+    )
+    created_at = models.DateTimeField(
+        help_text="Fecha y hora en que se creó la notificación."
+    )
+    is_read = models.BooleanField(
+        default=False,
+        help_text="Indica si la notificación había sido leída."
+    )
+    users = models.ManyToManyField(
+        settings.AUTH_USER_MODEL,
+        related_name='archived_notifications',
+        blank=True,
+        help_text="Usuarios que recibieron la notificación."
+    )
+    archived_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Fecha y hora en que se archivó la notificación."
+    )
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Archived Notification'
+        verbose_name_plural = 'Archived Notifications'
+
+    def __str__(self):
+        return f"{self.title} (archivada)"
+
+
+# -------------------------------------------------------
+# CatalogChange model
+# Registro de cambios del catálogo para la sincronización
+# incremental de kioscos y terminales (/menu/changes/).
+# -------------------------------------------------------
+class CatalogChange(models.Model):
+    """
+    Cambio de un producto o una categoría. El id es la secuencia
+    creciente que los clientes usan como ?since=.
+
+    Atributos:
+      - model: 'product' o 'category'
+      - object_id: id del objeto modificado
+      - action: alta/modificación o baja
+      - created_at: fecha y hora del cambio
+    """
+    UPSERT = 'upsert'
+    DELETE = 'delete'
+    ACTION_CHOICES = [
+        (UPSERT, 'Alta o modificación'),
+        (DELETE, 'Baja'),
+    ]
+    id = models.BigAutoField(primary_key=True)
+    model = models.CharField(
+        max_length=20,
+        help_text="Modelo del objeto modificado."
+    )
+    object_id = models.BigIntegerField(
+        help_text="Id del objeto modificado."
+    )
+    action = models.CharField(
+        max_length=6,
+        choices=ACTION_CHOICES,
+        help_text="Tipo de cambio."
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Fecha y hora del cambio."
+    )
+
+    class Meta:
+        ordering = ['id']
+        indexes = [models.Index(fields=['model', 'object_id'])]
+        verbose_name = 'Catalog Change'
+        verbose_name_plural = 'Catalog Changes'
+
+    def __str__(self):
+        return f"#{self.id} {self.action} {self.model} {self.object_id}"
+
+    @classmethod
+    def record(cls, model, object_ids, action=UPSERT):
+        """Registra un cambio por objeto e invalida la versión del catálogo."""
+        if not object_ids:
+            return
+        cls.objects.bulk_create(
+            cls(model=model, object_id=object_id, action=action) for object_id in object_ids
+        )
+        catalog_version.bump()
+
+    @classmethod
+    def compact(cls):
+        """
+        Deja solo el último cambio de cada objeto: alcanza para que un
+        cliente con cualquier ?since= reciba el estado final. Devuelve la
+        cantidad de filas borradas.
+        """
+        latest = cls.objects.values('model', 'object_id').annotate(last=models.Max('id')).values('last')
+        deleted, _ = cls.objects.exclude(id__in=latest).delete()
+        return deleted
+
+
+# -------------------------------------------------------
+# Recomendaciones "los clientes también pidieron"
+# ProductPair es la matriz dispersa de co-ocurrencias entre
+# productos (en ambos sentidos) y ProductRecommendation sus
+# K mejores vecinos por producto, que lee la página de
+# detalle. Las arma recommendations.refresh(), que guarda
+# su avance en RecommendationCursor.
+# -------------------------------------------------------
+class ProductPair(models.Model):
+    """
+    Cantidad de pedidos que incluyen a dos productos.
+
+    Atributos:
+      - product: producto (ForeignKey)
+      - other: producto pedido junto con product (ForeignKey)
+      - orders: pedidos que incluyen a ambos
+    """
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='pairs',
+        help_text="Producto."
+    )
+    other = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='+',
+        help_text="Producto pedido junto con el anterior."
+    )
+    orders = models.PositiveIntegerField(
+        help_text="Pedidos que incluyen a ambos productos."
+    )
+
+    class Meta:
+        unique_together = ('product', 'other')
+        verbose_name = 'Product Pair'
+        verbose_name_plural = 'Product Pairs'
+
+    def __str__(self):
+        return f"{self.product_id} + {self.other_id}: {self.orders}"
+
+
+class ProductRecommendation(models.Model):
+    """
+    Uno de los K productos más pedidos junto con otro.
+
+    Atributos:
+      - product: producto de la página de detalle (ForeignKey)
+      - recommended: producto recomendado (ForeignKey)
+      - rank: posición, empezando en 0
+      - orders: pedidos que incluyen a ambos
+    """
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='recommendations',
+        help_text="Producto para el que se recomienda."
+    )
+    recommended = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='+',
+        help_text="Producto recomendado."
+    )
+    rank = models.PositiveSmallIntegerField(
+        help_text="Posición de la recomendación (0 es la mejor)."
+    )
+    orders = models.PositiveIntegerField(
+        help_text="Pedidos que incluyen a ambos productos."
+    )
+
+    class Meta:
+        ordering = ['rank']
+        unique_together = ('product', 'rank')
+        verbose_name = 'Product Recommendation'
+        verbose_name_plural = 'Product Recommendations'
+
+    def __str__(self):
+        return f"{self.product_id} #{self.rank}: {self.recommended_id}"
+
+
+class RecommendationCursor(models.Model):
+    """
+    Avance de recommendations.refresh (una sola fila).
+
+    Atributos:
+      - next_order: primer id de pedido que todavía no se contó
+      - recent: ids ya contados dentro de la ventana que se vuelve a
+        revisar antes de next_order (pedidos confirmados fuera de orden)
+      - revision: se incrementa en cada avance; evita que dos procesos
+        cuenten el mismo lote
+    """
+    next_order = models.BigIntegerField(
+        default=0,
+        help_text="Primer id de pedido sin contar."
+    )
+    recent = models.JSONField(
+        default=list,
+        help_text="Ids ya contados de la ventana anterior a next_order."
+    )
+    revision = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Cantidad de avances del cursor."
+    )
+
+    class Meta:
+        verbose_name = 'Recommendation cursor'
+        verbose_name_plural = 'Recommendation cursors'
+
+    def __str__(self):
+        return f"Recomendaciones: desde el pedido {self.next_order}"
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+from django.db import connections
+from django.utils import timezone
+
+from .models import (
+    Booking,
+    DailyProductSales,
+    Notification,
+    Order,
+    OrderProduct,
+    Product,
+    ProductRecommendation,
+    Rating,
+    TableTimeSlot,
+    TimeSlot,
+)
+
+
+# -------------------------------------------------------
+# query_plans.py
+# Registro de las consultas habituales de la aplicación y
+# análisis de su plan de ejecución (EXPLAIN QUERY PLAN en
+# SQLite, EXPLAIN en PostgreSQL). audit_query_plans falla si
+# alguna recorre una tabla completa u ordena en memoria.
+# Los parámetros son valores cualesquiera: el plan no depende
+# de que existan filas.
+# -------------------------------------------------------
+
+def _midnight():
+    return datetime.combine(timezone.localdate(), datetime.min.time(), tzinfo=timezone.get_current_timezone())
+
+
+CANONICAL_QUERIES = {
+    'pedidos de un usuario': lambda: Order.objects.filter(user_id=1),
+    'pedido por código': lambda: Order.objects.filter(code='P0'),
+    'productos de un pedido': lambda: OrderProduct.objects.filter(order_id=1),
+    'reservas de un usuario': lambda: Booking.objects.filter(user_id=1),
+    'reservas de una fecha': lambda: Booking.objects.filter(date=timezone.localdate()),
+    'calificaciones de un producto': lambda: Rating.objects.filter(product_id=1),
+    'productos de una categoría': lambda: Product.objects.filter(category_id=1),
+    'detalle de producto': lambda: Product.objects.filter(pk=1),
+    'menú completo': lambda: Product.objects.order_by('name'),
+    'recomendaciones de un producto': lambda: ProductRecommendation.objects.filter(
+        product_id=1
+    ).select_related('recommended'),
+    'intervalos de un día': lambda: TimeSlot.objects.filter(
+        start__gte=_midnight(), start__lt=_midnight() + timedelta(days=1)
+    ),
+    'mesas/intervalos de un día': lambda: TableTimeSlot.objects.filter(
+        timeslot__start__gte=_midnight(), timeslot__start__lt=_midnight() + timedelta(days=1)
+    ),
+    'notificaciones de un usuario': lambda: Notification.objects.filter(users=1),
+    'ventas diarias por producto': lambda: DailyProductSales.objects.filter(
+        day__range=(timezone.localdate() - timedelta(days=30), timezone.localdate())
+    ).order_by('day'),
+}
+
+# Fragmentos del plan que indican un recorrido completo o un ordenamiento en memoria.
+# En SQLite "SCAN tabla" sin índice recorre la tabla entera.
+PROBLEMS = {
+    'sqlite': lambda line: (
+        (line.startswith('SCAN ') and ' USING ' not in line)
+        or 'USE TEMP B-TREE' in line
+    ),
+    'postgresql': lambda line: line.startswith(('Seq Scan', 'Sort ')),
+}
+
+
+def _detail(line):
+    """Texto de una línea del plan sin columnas numéricas ni sangría."""
+    if line[:1].isdigit():
+        # SQLite: "id parent notused detalle"
+        return line.split(' ', 3)[-1]
+    return line.strip().lstrip('-> ')
+
+
+def audit(queries=None):
+    """
+    Ejecuta EXPLAIN sobre cada consulta del registro.
+    Devuelve una lista de (nombre, plan, líneas problemáticas).
+    """
+    queries = CANONICAL_QUERIES if queries is None else queries
+    results = []
+    for name, factory in queries.items():
+        queryset = factory()
+        is_problem = PROBLEMS.get(connections[queryset.db].vendor, lambda detail: False)
+        plan = queryset.explain()
+        problems = [_detail(line) for line in plan.splitlines() if is_problem(_detail(line))]
+        results.append((name, plan, problems))
+    return results
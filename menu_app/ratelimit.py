@@ -0,0 +1,65 @@
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+
+# -------------------------------------------------------
+# ratelimit.py
+# Limitador token bucket por IP y por usuario guardado en
+# el cache de Django. La lectura y escritura del bucket no
+# son atómicas: con mucha concurrencia puede pasar algún
+# request de más, lo cual es aceptable para frenar abusos.
+# -------------------------------------------------------
+
+def client_ip(request):
+    if settings.TRUST_X_FORWARDED_FOR:
+        forwarded = request.headers.get('X-Forwarded-For')
+        if forwarded:
+            return forwarded.split(',')[0].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def take_token(key, capacity, refill_rate, now=None):
+    """
+    Consume un token del bucket `key`. Devuelve (True, 0) si se permitió o
+    (False, segundos hasta el próximo token).
+    """
+    now = time.time() if now is None else now
+    tokens, updated = cache.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - updated) * refill_rate)
+    if tokens < 1:
+        return False, math.ceil((1 - tokens) / refill_rate)
+    timeout = math.ceil(capacity / refill_rate) + 1
+    cache.set(key, (tokens - 1, now), timeout)
+    return True, 0
+
+
+class RateLimitMixin:
+    """
+    Mixin para vistas de escritura: limita los métodos de
+    `rate_limit_methods` con un bucket por IP y otro por usuario.
+
+    Atributos:
+      - rate_limit: (capacidad, tokens por segundo)
+      - rate_limit_scope: prefijo de las claves en el cache
+    """
+    rate_limit = (10, 0.5)
+    rate_limit_scope = 'write'
+    rate_limit_methods = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in self.rate_limit_methods:
+            capacity, refill_rate = self.rate_limit
+            keys = [f'ratelimit:{self.rate_limit_scope}:ip:{client_ip(request)}']
+            if request.user.is_authenticated:
+                keys.append(f'ratelimit:{self.rate_limit_scope}:user:{request.user.pk}')
+            for key in keys:
+                allowed, retry_after = take_token(key, capacity, refill_rate)
+                if not allowed:
+                    response = HttpResponse('Demasiados pedidos, intentá más tarde.', status=429)
+                    response['Retry-After'] = str(retry_after)
+                    return response
+        return super().dispatch(request, *args, **kwargs)
@@ -0,0 +1,230 @@
+import numpy as np
+from django.db import transaction
+from django.db.models import F
+
+from .models import (
+    ArchivedOrder,
+    OrderProduct,
+    Product,
+    ProductPair,
+    ProductRecommendation,
+    RecommendationCursor,
+)
+
+
+# -------------------------------------------------------
+# recommendations.py
+# "Los clientes también pidieron": co-ocurrencias de
+# productos en un mismo pedido. Las líneas de los pedidos
+# nuevos se leen por lotes como arrays, los pares de cada
+# pedido se generan con NumPy sin bucles por fila y se suman
+# a la matriz dispersa ProductPair. Solo se recalculan los
+# K mejores vecinos (ProductRecommendation) de los productos
+# que aparecieron en el lote. El avance se guarda en
+# RecommendationCursor: el primer pedido sin contar y los
+# ids ya contados de los RESCAN_ORDERS anteriores, que se
+# vuelven a revisar para sumar los pedidos que se
+# confirmaron después de otros con id mayor.
+# Se cuentan todos los pedidos, incluso los cancelados: el
+# interés conjunto existió igual. Los pedidos archivados
+# siguen contando; los borrados no se restan hasta un
+# refresh(full=True).
+# -------------------------------------------------------
+
+TOP_K = 6
+RESCAN_ORDERS = 1000  # ids anteriores al cursor que se vuelven a revisar
+
+
+def order_pairs(order_ids, product_ids):
+    """
+    Pares (producto, otro producto) de cada pedido, en ambos sentidos,
+    a partir de sus líneas. Devuelve (products, others, counts) con la
+    cantidad de pedidos de cada par distinto.
+    """
+    order_ids = np.asarray(order_ids, dtype=np.int64)
+    product_ids = np.asarray(product_ids, dtype=np.int64)
+    empty = np.array([], dtype=np.int64)
+    if not len(order_ids):
+        return empty, empty, empty
+
+    order = np.lexsort((product_ids, order_ids))
+    order_ids, product_ids = order_ids[order], product_ids[order]
+    # Una línea por producto y pedido
+    keep = np.ones(len(order_ids), dtype=bool)
+    keep[1:] = (order_ids[1:] != order_ids[:-1]) | (product_ids[1:] != product_ids[:-1])
+    order_ids, product_ids = order_ids[keep], product_ids[keep]
+
+    # Cada línea se cruza con todas las de su pedido: inicio y tamaño del grupo.
+    _, starts, sizes = np.unique(order_ids, return_index=True, return_counts=True)
+    group_sizes = np.repeat(sizes, sizes)
+    group_starts = np.repeat(starts, sizes)
+    left = np.repeat(np.arange(len(order_ids)), group_sizes)
+    offsets = np.arange(len(left)) - np.repeat(np.cumsum(group_sizes) - group_sizes, group_sizes)
+    right = np.repeat(group_starts, group_sizes) + offsets
+    distinct = left != right
+
+    width = int(product_ids.max()) + 1
+    keys, counts = np.unique(product_ids[left[distinct]] * width + product_ids[right[distinct]], return_counts=True)
+    return keys // width, keys % width, counts
+
+
+def top_k(products, others, counts, k=TOP_K):
+    """
+    Los `k` vecinos con más pedidos de cada producto (a igualdad, el de
+    menor id). Devuelve (products, others, counts, ranks).
+    """
+    order = np.lexsort((others, -counts, products))
+    products, others, counts = products[order], others[order], counts[order]
+    _, starts, sizes = np.unique(products, return_index=True, return_counts=True)
+    ranks = np.arange(len(products)) - np.repeat(starts, sizes)
+    best = ranks < k
+    return products[best], others[best], counts[best], ranks[best]
+
+
+def merge_counts(existing, products, others, counts):
+    """
+    Suma los pares nuevos a `existing` (filas product, other, orders).
+    Devuelve (products, others, counts) de todos los pares y una máscara
+    con los que cambiaron.
+    """
+    existing = np.asarray(existing, dtype=np.int64).reshape(-1, 3)
+    all_products = np.concatenate([existing[:, 0], products])
+    all_others = np.concatenate([existing[:, 1], others])
+    width = int(max(all_products.max(), all_others.max())) + 1
+    new_keys = products * width + others
+    keys, inverse = np.unique(all_products * width + all_others, return_inverse=True)
+    totals = np.bincount(inverse, weights=np.concatenate([existing[:, 2], counts])).astype(np.int64)
+    return keys // width, keys % width, totals, np.isin(keys, new_keys)
+
+
+def refresh(batch_size=5000, full=False):
+    """
+    Cuenta los pedidos que todavía no se contaron y actualiza ProductPair
+    y las recomendaciones de los productos afectados. Con `full` se
+    vuelve a contar todo desde cero, incluidos los pedidos archivados
+    (y sin los borrados). `batch_size` limita las líneas nuevas leídas
+    por lote (un pedido nunca queda partido entre dos lotes).
+
+    Devuelve un diccionario con la cantidad de pedidos contados y de
+    productos cuyas recomendaciones se recalcularon.
+    """
+    result = {'orders': 0, 'products': 0}
+    if full:
+        with transaction.atomic():
+            ProductPair.objects.all().delete()
+            ProductRecommendation.objects.all().delete()
+            RecommendationCursor.objects.get_or_create(pk=1)
+            RecommendationCursor.objects.filter(pk=1).update(
+                next_order=0, recent=[], revision=F('revision') + 1
+            )
+            result = _count_archived(batch_size)
+
+    while True:
+        cursor, _ = RecommendationCursor.objects.get_or_create(pk=1)
+        counted = set(cursor.recent)
+        late = [
+            line
+            for line in OrderProduct.objects.filter(
+                order_id__gte=cursor.next_order - RESCAN_ORDERS, order_id__lt=cursor.next_order
+            ).values_list('order_id', 'product_id')
+            if line[0] not in counted
+        ]
+        lines = list(
+            OrderProduct.objects.filter(order_id__gte=cursor.next_order)
+            .order_by('order_id')
+            .values_list('order_id', 'product_id')[:batch_size + 1]
+        )
+        if len(lines) > batch_size:
+            # El último pedido puede estar incompleto: queda para el próximo lote.
+            last = lines[-1][0]
+            complete = [line for line in lines if line[0] != last]
+            lines = complete or list(
+                OrderProduct.objects.filter(order_id=last).values_list('order_id', 'product_id')
+            )
+        if not late and not lines:
+            return result
+        next_order = lines[-1][0] + 1 if lines else cursor.next_order
+        order_ids, product_ids = (np.array(column, dtype=np.int64) for column in zip(*late, *lines))
+        new_ids = set(order_ids.tolist())
+        recent = sorted(pk for pk in counted | new_ids if pk >= next_order - RESCAN_ORDERS)
+        counted = _apply(order_ids, product_ids, cursor, next_order, recent)
+        if counted is not None:
+            result['orders'] += len(new_ids)
+            result['products'] += counted
+
+
+def _count_archived(batch_size):
+    """
+    Suma los pares de los pedidos archivados, que ya no están en
+    OrderProduct. Se leen de a `batch_size` pedidos y se ignoran los
+    productos que ya no existen.
+    """
+    result = {'orders': 0, 'products': 0}
+    catalog = np.array(Product.objects.values_list('pk', flat=True), dtype=np.int64)
+    queryset = ArchivedOrder.objects.order_by('pk').values_list('pk', 'product_ids')
+    last = None
+    while True:
+        batch = list((queryset if last is None else queryset.filter(pk__gt=last))[:batch_size])
+        if not batch:
+            return result
+        last = batch[-1][0]
+        order_ids = np.array([pk for pk, products in batch for _ in products], dtype=np.int64)
+        product_ids = np.array([product for _, products in batch for product in products], dtype=np.int64)
+        known = np.isin(product_ids, catalog)
+        result['orders'] += len(batch)
+        result['products'] += _add_pairs(order_ids[known], product_ids[known])
+
+
+def _apply(order_ids, product_ids, cursor, next_order, recent):
+    """
+    Suma los pares de un lote y recalcula las recomendaciones de sus
+    productos. Devuelve la cantidad de productos recalculados, o None si
+    otro proceso ya contó el lote.
+    """
+    with transaction.atomic():
+        # El cursor se avanza solo si nadie lo movió en el medio.
+        if not RecommendationCursor.objects.filter(pk=cursor.pk, revision=cursor.revision).update(
+            next_order=next_order, recent=recent, revision=F('revision') + 1
+        ):
+            return None
+        return _add_pairs(order_ids, product_ids)
+
+
+def _add_pairs(order_ids, product_ids):
+    """
+    Suma los pares de las líneas dadas a ProductPair y recalcula las
+    recomendaciones de sus productos. Devuelve cuántos se recalcularon.
+    """
+    products, others, counts = order_pairs(order_ids, product_ids)
+    touched = np.unique(products).tolist()
+    if not touched:
+        return 0
+    with transaction.atomic():
+        existing = list(
+            ProductPair.objects.filter(product_id__in=touched).values_list('product_id', 'other_id', 'orders')
+        )
+        products, others, counts, changed = merge_counts(existing, products, others, counts)
+        ProductPair.objects.bulk_create(
+            [
+                ProductPair(product_id=product, other_id=other, orders=orders)
+                for product, other, orders in zip(
+                    products[changed].tolist(), others[changed].tolist(), counts[changed].tolist()
+                )
+            ],
+            update_conflicts=True,
+            unique_fields=['product', 'other'],
+            update_fields=['orders'],
+            batch_size=1000,
+        )
+
+        ProductRecommendation.objects.filter(product_id__in=touched).delete()
+        ProductRecommendation.objects.bulk_create(
+            [
+                ProductRecommendation(product_id=product, recommended_id=other, orders=orders, rank=rank)
+                for product, other, orders, rank in zip(
+                    *(column.tolist() for column in top_k(products, others, counts))
+                )
+            ],
+            batch_size=1000,
+        )
+    return len(touched)
@@ -0,0 +1,132 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Sum
+
+from . import archive
+from .models import (
+    DailyCategorySales,
+    DailyProductSales,
+    DailyStateSales,
+    Order,
+    OrderProduct,
+)
+
+
+# -------------------------------------------------------
+# rollups.py
+# Reconstrucción y consultas sobre los acumulados diarios
+# de ventas (DailyProductSales, DailyCategorySales y
+# DailyStateSales). Los reportes leen estas tablas en lugar
+# de agregar todo el historial de Order / OrderProduct.
+# -------------------------------------------------------
+
+# Cada línea se valúa al precio del momento del pedido, igual que Order.place.
+LINE_REVENUE = Sum(F('unit_price') * F('quantity'), output_field=DecimalField(max_digits=14, decimal_places=2))
+
+
+def _in_range(queryset, field, start, end):
+    if start is not None:
+        queryset = queryset.filter(**{f"{field}__gte": start})
+    if end is not None:
+        queryset = queryset.filter(**{f"{field}__lte": end})
+    return queryset
+
+
+def rebuild(start=None, end=None):
+    """
+    Recalcula los acumulados de los días entre `start` y `end` (inclusive)
+    a partir de Order / OrderProduct. Sin fechas, recalcula todo.
+    Los días con pedidos archivados no se tocan: sus líneas ya no están en
+    OrderProduct y los acumulados son el único registro de esas ventas, así
+    que `start` se corre al día siguiente al último archivado.
+    Devuelve la cantidad de filas creadas por tabla y el primer día recalculado.
+    """
+    archived = archive.archived_until()
+    if archived is not None and (start is None or start <= archived):
+        start = archived + timedelta(days=1)
+    if end is not None and start is not None and start > end:
+        return {'products': 0, 'categories': 0, 'states': 0, 'start': start}
+
+    lines = _in_range(
+        OrderProduct.objects.exclude(order__state='CANCELADO'), 'order__buy_date', start, end
+    )
+    orders = _in_range(Order.objects.order_by(), 'buy_date', start, end)
+
+    with transaction.atomic():
+        for model in (DailyProductSales, DailyCategorySales, DailyStateSales):
+            _in_range(model.objects.all(), 'day', start, end).delete()
+
+        products = DailyProductSales.objects.bulk_create(
+            DailyProductSales(
+                day=row['order__buy_date'],
+                product_id=row['product_id'],
+                orders=row['orders'],
+                units=row['units'],
+                revenue=row['revenue'],
+            )
+            for row in lines.values('order__buy_date', 'product_id').annotate(
+                orders=Count('order_id', distinct=True),
+                units=Sum('quantity'),
+                revenue=LINE_REVENUE,
+            ).order_by()
+        )
+        categories = DailyCategorySales.objects.bulk_create(
+            DailyCategorySales(
+                day=row['order__buy_date'],
+                category_id=row['product__category_id'],
+                orders=row['orders'],
+                units=row['units'],
+                revenue=row['revenue'],
+            )
+            for row in lines.values('order__buy_date', 'product__category_id').annotate(
+                orders=Count('order_id', distinct=True),
+                units=Sum('quantity'),
+                revenue=LINE_REVENUE,
+            ).order_by()
+        )
+        states = DailyStateSales.objects.bulk_create(
+            DailyStateSales(
+                day=row['buy_date'],
+                state=row['state'],
+                orders=row['orders'],
+                revenue=Decimal(str(round(row['revenue'], 2))),
+            )
+            for row in orders.values('buy_date', 'state').annotate(
+                orders=Count('id'),
+                revenue=Sum('amount'),
+            )
+        )
+    return {'products': len(products), 'categories': len(categories), 'states': len(states), 'start': start}
+
+
+def top_products(start, end, limit=10):
+    """Productos más vendidos entre `start` y `end` (inclusive)."""
+    return list(
+        DailyProductSales.objects.filter(day__range=(start, end))
+        .values('product_id', 'product__name')
+        .annotate(units=Sum('units'), revenue=Sum('revenue'))
+        .order_by('-units', 'product__name')[:limit]
+    )
+
+
+def sales_by_category(start, end):
+    """Unidades e importe por categoría entre `start` y `end`."""
+    return list(
+        DailyCategorySales.objects.filter(day__range=(start, end))
+        .values('category_id', 'category__name')
+        .annotate(orders=Sum('orders'), units=Sum('units'), revenue=Sum('revenue'))
+        .order_by('-revenue')
+    )
+
+
+def revenue_by_day(start, end):
+    """Pedidos e importe por día (sin cancelados) entre `start` y `end`."""
+    return list(
+        DailyStateSales.objects.filter(day__range=(start, end))
+        .exclude(state='CANCELADO')
+        .values('day')
+        .annotate(orders=Sum('orders'), revenue=Sum('revenue'))
+        .order_by('day')
+    )
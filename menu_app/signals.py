@@ -0,0 +1,49 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import stock
+from .models import CatalogChange, Category, Product
+
+
+# -------------------------------------------------------
+# signals.py
+# Registro de cambios del catálogo (CatalogChange), contadores
+# de stock e imágenes sin uso. Van en señales y no en
+# save()/delete() para cubrir también QuerySet.delete(), la
+# acción "borrar seleccionados" del admin y los borrados en
+# cascada. QuerySet.update() no envía señales: quien lo usa
+# (move_stock, update_many, catalog_import) registra aparte.
+# Se conectan en MenuAppConfig.ready().
+# -------------------------------------------------------
+
+@receiver(post_save, sender=Category)
+def category_saved(sender, instance, **kwargs):
+    CatalogChange.record('category', [instance.pk])
+
+
+@receiver(post_delete, sender=Category)
+def category_deleted(sender, instance, **kwargs):
+    # Sus productos borrados en cascada envían su propio post_delete.
+    CatalogChange.record('category', [instance.pk], CatalogChange.DELETE)
+
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance, created, **kwargs):
+    # DirtyFieldsMixin no llega a guardar si nada cambió, y todavía no
+    # actualizó su copia: get_dirty_fields() son los campos recién escritos.
+    CatalogChange.record('product', [instance.pk])
+    if created:
+        return
+    dirty = instance.get_dirty_fields()
+    if 'quantity' in dirty:
+        stock.forget([instance.pk])
+    previous_image = (getattr(instance, '_loaded_values', None) or {}).get('image')
+    if 'image' in dirty and previous_image != instance.image.name:
+        Product.release_image(previous_image)
+
+
+@receiver(post_delete, sender=Product)
+def product_deleted(sender, instance, **kwargs):
+    CatalogChange.record('product', [instance.pk], CatalogChange.DELETE)
+    stock.forget([instance.pk])
+    Product.release_image(instance.image.name)
@@ -0,0 +1,12 @@
+// Las páginas cacheadas no llevan el token CSRF de cada visitante: cada
+// input con data-csrf-cookie recibe el valor de la cookie csrftoken
+// (CSRF_COOKIE_NAME), que la vista envía aunque la página venga del cache.
+(function () {
+    var match = document.cookie.match(/(?:^|;\s*)csrftoken=([^;]+)/);
+    if (!match) {
+        return;
+    }
+    document.querySelectorAll("input[data-csrf-cookie]").forEach(function (input) {
+        input.value = decodeURIComponent(match[1]);
+    });
+})();
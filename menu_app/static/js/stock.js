@@ -0,0 +1,25 @@
+// Completa la disponibilidad de las páginas cacheadas: cada elemento
+// con data-stock-product recibe data-available con el stock actual.
+(function () {
+    var url = document.currentScript.dataset.url;
+    var nodes = document.querySelectorAll("[data-stock-product]");
+    if (!nodes.length) {
+        return;
+    }
+    var ids = Array.prototype.map.call(nodes, function (node) {
+        return node.dataset.stockProduct;
+    });
+    fetch(url + "?ids=" + ids.join(","))
+        .then(function (response) {
+            return response.ok ? response.json() : null;
+        })
+        .then(function (data) {
+            if (!data) {
+                return;
+            }
+            nodes.forEach(function (node) {
+                var quantity = data.stock[node.dataset.stockProduct] || 0;
+                node.dataset.available = quantity > 0 ? "true" : "false";
+            });
+        });
+})();
@@ -0,0 +1,109 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from . import metrics
+
+
+# -------------------------------------------------------
+# stock.py
+# Disponibilidad de productos servida desde el cache.
+# Cada producto tiene un contador stock:<id> que se carga
+# desde Product.quantity la primera vez que se lee. Los
+# pedidos lo mueven con incr/decr atómicos al confirmarse la
+# transacción; las ediciones del admin lo descartan para que
+# la próxima lectura lo recargue. Cada contador vence a los
+# STOCK_CACHE_TTL segundos y se recarga de la base, así un
+# desvío no dura más que eso. reconcile() lo vuelve a alinear
+# antes (comando reconcile_stock), por si un worker se perdió
+# una actualización.
+# -------------------------------------------------------
+
+def _key(product_id):
+    return f'stock:{product_id}'
+
+
+def get_many(product_ids):
+    """
+    Stock de cada id como {id: cantidad}, con una sola consulta para los
+    que no estaban en el cache. Los ids inexistentes no aparecen.
+    """
+    product_ids = list(dict.fromkeys(int(pk) for pk in product_ids))
+    cached = cache.get_many([_key(pk) for pk in product_ids])
+    stock = {pk: cached[_key(pk)] for pk in product_ids if _key(pk) in cached}
+    missing = [pk for pk in product_ids if pk not in stock]
+    metrics.cache_requests.inc(len(stock), cache='stock', result='hit')
+    if missing:
+        from .models import Product
+
+        metrics.cache_requests.inc(len(missing), cache='stock', result='miss')
+        loaded = dict(Product.objects.filter(pk__in=missing).values_list('id', 'quantity'))
+        for pk, quantity in loaded.items():
+            # add no pisa un contador que otro proceso cargó (y quizás movió)
+            # después de la lectura: en ese caso vale el del cache.
+            if not cache.add(_key(pk), quantity, timeout=settings.STOCK_CACHE_TTL):
+                loaded[pk] = cache.get(_key(pk), quantity)
+        stock.update(loaded)
+    return stock
+
+
+def get(product_id):
+    return get_many([product_id]).get(int(product_id), 0)
+
+
+def is_available(product_id):
+    return get(product_id) > 0
+
+
+def adjust(deltas):
+    """
+    Suma `deltas` ({id: unidades}, negativas para descontar) a los
+    contadores cuando la transacción en curso se confirma. Un contador
+    que no está en el cache se deja así: la próxima lectura lo carga ya
+    actualizado desde la base.
+    """
+    def apply():
+        for product_id, delta in deltas.items():
+            if not delta:
+                continue
+            try:
+                cache.incr(_key(product_id), delta)
+            except ValueError:
+                pass
+
+    transaction.on_commit(apply)
+
+
+def forget(product_ids):
+    """Descarta los contadores de `product_ids` al confirmarse la transacción."""
+    keys = [_key(pk) for pk in product_ids]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def reconcile(batch_size=1000):
+    """
+    Reescribe los contadores con Product.quantity recorriendo la tabla
+    por lotes. Devuelve la cantidad de contadores que estaban
+    desalineados (los ausentes no cuentan: se cargarán al leerlos).
+
+    Solo sirve con un cache compartido (DJANGO_CACHE_URL): con LocMem
+    cada proceso tiene sus contadores y el comando reconcile_stock, que
+    corre en otro proceso, no toca los de los workers.
+    """
+    from .models import Product
+
+    fixed = 0
+    last = 0
+    while True:
+        rows = list(
+            Product.objects.filter(pk__gt=last).order_by('pk').values_list('id', 'quantity')[:batch_size]
+        )
+        if not rows:
+            return fixed
+        cached = cache.get_many([_key(pk) for pk, _ in rows])
+        fixed += sum(
+            1 for pk, quantity in rows if _key(pk) in cached and cached[_key(pk)] != quantity
+        )
+        cache.set_many({_key(pk): quantity for pk, quantity in rows}, timeout=settings.STOCK_CACHE_TTL)
+        last = rows[-1][0]
@@ -0,0 +1,52 @@
+import gzip
+from pathlib import Path
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # brotli es opcional: sin él solo se generan .gz
+    brotli = None
+
+
+# -------------------------------------------------------
+# storage.py
+# Storage de archivos estáticos para producción: nombres con
+# hash de contenido (ManifestStaticFilesStorage) y variantes
+# precomprimidas .gz y .br generadas en collectstatic.
+# -------------------------------------------------------
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    ManifestStaticFilesStorage que además escribe junto a cada archivo de
+    texto una versión gzip y, si está instalado brotli, una brotli.
+
+    manifest_strict = False: una referencia a un archivo que no existe
+    (por ejemplo images/default_food.jpg) usa el nombre sin hash en lugar
+    de romper la página.
+    """
+    manifest_strict = False
+    compress_extensions = ('.css', '.js', '.mjs', '.svg', '.json', '.txt', '.html', '.xml', '.ico')
+    min_size = 256
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        names = set(self.hashed_files) | set(self.hashed_files.values())
+        for name in sorted(names):
+            if name.endswith(self.compress_extensions) and self.exists(name):
+                self.compress(name)
+
+    def compress(self, name):
+        path = Path(self.path(name))
+        data = path.read_bytes()
+        if len(data) < self.min_size:
+            return
+        variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants['.br'] = brotli.compress(data)
+        for suffix, compressed in variants.items():
+            # Solo vale la pena si la variante es realmente más chica.
+            if len(compressed) < len(data):
+                path.with_name(path.name + suffix).write_bytes(compressed)
@@ -1,14 +1,38 @@
+from functools import lru_cache
+
 from django import template
+from django.urls import get_script_prefix, get_urlconf, reverse
 from django.utils.html import format_html
-from django.urls import reverse
 
 
 register = template.Library()
 
 
+@lru_cache(maxsize=128)
+def _reverse_static(url_name, script_prefix, urlconf):
+    # El prefijo y el urlconf son parte de la clave para que un cambio
+    # de configuración (por ejemplo en tests) no devuelva una URL vieja.
+    return reverse(url_name, urlconf=urlconf)
+
+
+def reverse_static(url_name):
+    """reverse() memoizado para rutas sin argumentos."""
+    return _reverse_static(url_name, get_script_prefix(), get_urlconf())
+
+
+@register.simple_tag(takes_context=True)
+def navbar_active(context, *url_names):
+    """
+    Nombres de las rutas activas entre `url_names`, separados por coma.
+    Sirve de clave del fragmento cacheado de la barra: hay tantas
+    variantes como combinaciones de links activos, no una por path.
+    """
+    return ','.join(name for name in url_names if reverse_static(name) in context.request.path)
+
+
 @register.simple_tag(takes_context=True)
 def navbar_link(context, url_name, label):
-    path = reverse(url_name)
+    path = reverse_static(url_name)
     is_active = path in context.request.path
 
     css_class = "nav-link active" if is_active else "nav-link"
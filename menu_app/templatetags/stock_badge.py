@@ -0,0 +1,11 @@
+from django import template
+
+from menu_app import stock
+
+register = template.Library()
+
+
+@register.simple_tag
+def stock_available(product_id):
+    """Disponibilidad según los contadores de stock.py, sin leer el producto."""
+    return stock.is_available(product_id)
@@ -0,0 +1,40 @@
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+# -------------------------------------------------------
+# runner.py
+# Runner de tests del proyecto (TEST_RUNNER).
+# Con --parallel, Django clona la base de datos de prueba
+# ya migrada una vez por proceso. Este runner además:
+#   - usa un hasher de contraseñas rápido: PBKDF2 es la
+#     mayor parte del tiempo de los tests que crean usuarios
+#   - guarda los archivos subidos y los archivos de métricas
+#     en directorios temporales compartidos por los procesos
+#     y los borra al terminar
+# -------------------------------------------------------
+
+class ParallelTestRunner(DiscoverRunner):
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._media_root = tempfile.mkdtemp(prefix="restaurante-media-")
+        self._metrics_dir = tempfile.mkdtemp(prefix="restaurante-metrics-")
+        self._saved = {
+            "PASSWORD_HASHERS": settings.PASSWORD_HASHERS,
+            "MEDIA_ROOT": settings.MEDIA_ROOT,
+            "METRICS_DIR": settings.METRICS_DIR,
+        }
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        settings.MEDIA_ROOT = self._media_root
+        settings.METRICS_DIR = self._metrics_dir
+
+    def teardown_test_environment(self, **kwargs):
+        for name, value in self._saved.items():
+            setattr(settings, name, value)
+        shutil.rmtree(self._media_root, ignore_errors=True)
+        shutil.rmtree(self._metrics_dir, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,120 @@
+from datetime import date, timedelta
+
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import connection
+from django.test import TestCase
+
+
+# -------------------------------------------------------
+# seeding.py
+# Datos de prueba grandes que se arman una sola vez por
+# proceso. La primera clase que pide una combinación de
+# seeds las ejecuta con el ORM (Order.place, acumulados,
+# etc.) y guarda una foto de todas las tablas de menu_app;
+# las clases siguientes la restauran con un bulk_create por
+# tabla. Cada TestCase revierte su transacción al terminar,
+# así que la foto siempre se toma sobre una BD vacía.
+# -------------------------------------------------------
+
+SEEDS = {}
+_snapshots = {}
+
+
+def seed(name):
+    """Registra una función que crea datos de prueba bajo `name`."""
+    def register(function):
+        SEEDS[name] = function
+        return function
+    return register
+
+
+def _models():
+    return [
+        model for model in apps.get_app_config('menu_app').get_models(include_auto_created=True)
+        if not model._meta.abstract
+    ]
+
+
+def take_snapshot():
+    """Filas de todas las tablas de menu_app como [(model, attnames, rows)]."""
+    snapshot = []
+    for model in _models():
+        attnames = [field.attname for field in model._meta.concrete_fields]
+        rows = list(model._base_manager.order_by().values_list(*attnames))
+        if rows:
+            snapshot.append((model, attnames, rows))
+    return snapshot
+
+
+def restore_snapshot(snapshot):
+    # Las FK de Django son diferidas: el orden de las tablas no importa.
+    for model, attnames, rows in snapshot:
+        model._base_manager.bulk_create(
+            [model(**dict(zip(attnames, row))) for row in rows], batch_size=500
+        )
+    # En PostgreSQL las secuencias no avanzan con pks explícitos.
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), [model for model, _, _ in snapshot]):
+            cursor.execute(sql)
+
+
+def load(names):
+    """Aplica las seeds `names`, reutilizando la foto si ya se armaron antes."""
+    key = tuple(names)
+    if key in _snapshots:
+        restore_snapshot(_snapshots[key])
+        return
+    for name in names:
+        SEEDS[name]()
+    _snapshots[key] = take_snapshot()
+
+
+class SeededTestCase(TestCase):
+    """
+    TestCase que carga en setUpTestData las seeds de `seeds`.
+    Los tests solo deben leer las filas por consultas, no por atributos
+    de la clase, ya que al restaurar la foto no se ejecutan las seeds.
+    """
+    seeds = ()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        load(cls.seeds)
+
+
+# -------------------------------------------------------
+# Seeds del proyecto
+# -------------------------------------------------------
+
+@seed('order_history')
+def order_history(days=90, customers=5):
+    """Catálogo de 20 productos en 4 categorías y 90 días de pedidos."""
+    from menu_app.models import Category, Order, Product, User
+
+    categories = [Category.objects.create(name=f'Categoría {i}') for i in range(4)]
+    products = Product.objects.bulk_create(
+        Product(
+            category=categories[i % 4],
+            name=f'Plato {i}',
+            description='Plato de prueba',
+            price=10 + i,
+            quantity=50,
+        )
+        for i in range(20)
+    )
+    users = [User.objects.create_user(username=f'cliente{i}', password='clave') for i in range(customers)]
+    start = date(2025, 1, 1)
+    for day in range(days):
+        for i, user in enumerate(users):
+            if (day + i) % 3:
+                continue
+            lines = [products[(day + i + k * 7) % 20] for k in range(1 + day % 3)]
+            order, _ = Order.place(
+                user, lines,
+                buy_date=start + timedelta(days=day),
+                quantities={product.pk: 1 + (day + k) % 2 for k, product in enumerate(lines)},
+            )
+            if day % 10 == 0:
+                order.transition('CANCELADO')
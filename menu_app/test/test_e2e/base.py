@@ -1,3 +1,4 @@
+import atexit
 import os
 
 from django.contrib.staticfiles.testing import StaticLiveServerTestCase
@@ -7,6 +8,31 @@ os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "true"
 headless = os.environ.get("HEADLESS", 1) == 1
 slow_mo = os.environ.get("SLOW_MO", 0)
 
+_playwright = None
+_browser = None
+
+
+def get_browser():
+    """
+    Devuelve el Chromium del proceso, lanzándolo la primera vez.
+    Con --parallel cada worker tiene el suyo y lo reutilizan todas
+    sus clases de test; se cierra al terminar el proceso.
+    """
+    global _playwright, _browser
+    if _browser is None:
+        _playwright = sync_playwright().start()
+        _browser = _playwright.chromium.launch(headless=headless, slow_mo=int(slow_mo))
+        atexit.register(_close_browser)
+    return _browser
+
+
+def _close_browser():
+    global _playwright, _browser
+    if _browser is not None:
+        _browser.close()
+        _playwright.stop()
+        _playwright = _browser = None
+
 
 class BaseE2ETest(StaticLiveServerTestCase):
     """Clase base con la configuración común para todos los tests E2E"""
@@ -14,22 +40,13 @@ class BaseE2ETest(StaticLiveServerTestCase):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.playwright = sync_playwright().start()
-        cls.browser = cls.playwright.chromium.launch(
-            headless=headless, slow_mo=int(slow_mo)
-        )
-
-    @classmethod
-    def tearDownClass(cls):
-        cls.browser.close()
-        cls.playwright.stop()
-        super().tearDownClass()
+        cls.browser = get_browser()
 
     def setUp(self):
-        # Crear un contexto y página de Playwright
+        # Un contexto nuevo por test aísla cookies y storage sin relanzar el navegador
         self.context = self.browser.new_context()
         self.page = self.context.new_page()
 
     def tearDown(self):
-        # Cerrar la página después de cada test
-        self.page.close()
+        # Cerrar el contexto también cierra sus páginas
+        self.context.close()
@@ -0,0 +1,78 @@
+from datetime import datetime, time, timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from menu_app.models import (
+    Booking,
+    Notification,
+    Order,
+    Product,
+    Table,
+    TableTimeSlot,
+    TimeSlot,
+    User,
+    UserNotification,
+)
+
+# 2 consultas de sesión y usuario + pedidos, sus productos, reservas,
+# sus mesas/intervalos y notificaciones.
+ACCOUNT_QUERIES = 7
+
+
+class AccountViewTest(TestCase):
+    """Tests para el panel del usuario"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="cliente", password="clave")
+        self.products = [
+            Product.objects.create(name=f"Plato {i}", description="Rico", price=10 + i, quantity=1000)
+            for i in range(3)
+        ]
+        self.tomorrow = timezone.localdate() + timedelta(days=1)
+
+    def _history(self, size):
+        for i in range(size):
+            Order.place(self.user, self.products, buy_date=timezone.localdate() - timedelta(days=i))
+            booking = Booking.objects.create(user=self.user, date=self.tomorrow + timedelta(days=i), time=time(20))
+            start = timezone.make_aware(datetime.combine(booking.date, time(20)))
+            slot = TimeSlot.objects.create(start=start, end=start + timedelta(hours=2))
+            table = Table.objects.create(capacity=4, description=f"Mesa {i}")
+            TableTimeSlot.objects.create(table=table, timeslot=slot, booking=booking)
+            notification = Notification.objects.create(title=f"Aviso {i}", message="Hola")
+            UserNotification.objects.create(user=self.user, notification=notification)
+
+    def _assert_queries(self, size):
+        self._history(size)
+        self.client.force_login(self.user)
+        with self.assertNumQueries(ACCOUNT_QUERIES):
+            response = self.client.get(reverse("account"))
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_fixed_queries_small_history(self):
+        """Test que verifica la cantidad de consultas con poco historial"""
+        response = self._assert_queries(2)
+        self.assertContains(response, "Plato 2")
+        self.assertContains(response, "Mesa 1")
+        self.assertContains(response, "Aviso 1")
+
+    def test_fixed_queries_large_history(self):
+        """Test que verifica que la cantidad de consultas no crece con el historial"""
+        response = self._assert_queries(25)
+        self.assertEqual(len(response.context["orders"]), 10)
+        self.assertTrue(response.context["has_next"])
+
+    def test_pagination(self):
+        """Test que verifica la última página de pedidos"""
+        self._history(12)
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("account"), {"page": 2})
+        self.assertEqual(len(response.context["orders"]), 2)
+        self.assertFalse(response.context["has_next"])
+
+    def test_requires_login(self):
+        """Test que verifica que el panel redirige al login sin sesión"""
+        response = self.client.get(reverse("account"))
+        self.assertRedirects(response, f"{reverse('login')}?next={reverse('account')}")
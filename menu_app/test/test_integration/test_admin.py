@@ -0,0 +1,42 @@
+from datetime import date
+
+from django.test import TestCase
+from django.urls import reverse
+
+from menu_app.models import Booking, Product, User
+
+
+class ReorderAdminViewTest(TestCase):
+    def test_reorder_view(self):
+        """Test que verifica que la vista de reposición del admin funciona"""
+        admin = User.objects.create_superuser(username="admin", password="clave")
+        Product.objects.create(name="Pizza", description="Muzzarella", price=500, quantity=0)
+        self.client.force_login(admin)
+
+        response = self.client.get(reverse("admin:menu_app_product_reorder"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "admin/menu_app/product/reorder.html")
+        self.assertEqual(response.context["suggestions"], [])
+
+        response = self.client.get(reverse("admin:menu_app_product_changelist"))
+        self.assertContains(response, reverse("admin:menu_app_product_reorder"))
+
+
+class BookingAdminTest(TestCase):
+    def test_approve_action(self):
+        """Test que verifica la acción del admin que aprueba reservas en lote"""
+        admin = User.objects.create_superuser(username="admin", password="clave")
+        booking = Booking.objects.create(user=admin, date=date(2025, 6, 7))
+        self.client.force_login(admin)
+
+        response = self.client.post(
+            reverse("admin:menu_app_booking_changelist"),
+            {"action": "approve", "_selected_action": [booking.pk]},
+            follow=True,
+        )
+
+        self.assertContains(response, "1 reservas aprobadas")
+        booking.refresh_from_db()
+        self.assertTrue(booking.approved)
+        self.assertEqual(admin.notifications.get().title, "Reserva aprobada")
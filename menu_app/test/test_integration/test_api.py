@@ -0,0 +1,176 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from menu_app.api import encode_cursor
+from menu_app.models import Category, Product
+
+
+class MenuAPITest(TestCase):
+    """Tests para la API JSON del menú"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.pizzas = Category.objects.create(name="Pizzas")
+        self.products = [
+            Product.objects.create(
+                category=self.pizzas if i % 2 else None,
+                name=f"Plato {i:02d}",
+                description="Rico",
+                price=f"{10 + i}.50",
+                quantity=i % 3,
+            )
+            for i in range(7)
+        ]
+
+    def test_sparse_fields(self):
+        """Test que verifica que se devuelven solo los campos pedidos y el precio como texto"""
+        response = self.client.get(reverse("api_products"), {"fields": "id,price,available"})
+        first = response.json()["results"][0]
+        self.assertEqual(first, {"id": self.products[0].pk, "price": "10.50", "available": False})
+
+    def test_unknown_field(self):
+        """Test que verifica que un campo desconocido da 400"""
+        response = self.client.get(reverse("api_products"), {"fields": "id,password"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.json()["errors"])
+
+    def test_keyset_pagination(self):
+        """Test que verifica que la paginación por cursor recorre todos los productos sin repetir"""
+        names = []
+        url = f"{reverse('api_products')}?fields=name&limit=3"
+        while url:
+            with self.assertNumQueries(1):
+                data = self.client.get(url).json()
+            names += [item["name"] for item in data["results"]]
+            url = data["next"]
+        self.assertEqual(names, [f"Plato {i:02d}" for i in range(7)])
+
+    def test_filter_by_category(self):
+        """Test que verifica el filtro por categoría"""
+        response = self.client.get(reverse("api_products"), {"fields": "id", "category": self.pizzas.pk})
+        self.assertEqual(len(response.json()["results"]), 3)
+
+    def test_non_ascii_digits_rejected(self):
+        """Test que verifica que dígitos no ASCII o ids enormes dan 400 y no un error 500"""
+        for value in ("²", "１", "9" * 30):
+            for url, params in (
+                ("api_products", {"category": value}),
+                ("api_availability", {"ids": f"1,{value}"}),
+                ("menu_changes", {"since": value}),
+            ):
+                response = self.client.get(reverse(url), params)
+                self.assertEqual(response.status_code, 400, (url, value))
+
+    def test_invalid_cursor(self):
+        """Test que verifica que un cursor adulterado da 400"""
+        response = self.client.get(reverse("api_products"), {"after": "no-es-un-cursor"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(reverse("api_products"), {"after": encode_cursor("Plato 03", self.products[3].pk)})
+        self.assertEqual(response.json()["results"][0]["name"], "Plato 04")
+
+    def test_conditional_get(self):
+        """Test que verifica que sin cambios se responde 304 sin consultas y con cambios 200"""
+        response = self.client.get(reverse("api_products"))
+        etag = response["ETag"]
+        self.assertEqual(response["Cache-Control"], "no-cache")
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("api_products"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.products[0].update(quantity=5)
+        response = self.client.get(reverse("api_products"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["quantity"], 5)
+
+    def test_availability_without_etag(self):
+        """Test que verifica que la disponibilidad, que cambia con cada pedido, no usa la versión del catálogo"""
+        response = self.client.get(reverse("api_availability"))
+
+        self.assertNotIn("ETag", response)
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        self.assertEqual(response.json()["stock"][str(self.products[1].pk)], 1)
+
+    def test_availability_by_ids(self):
+        """Test que verifica que ?ids= sale de los contadores de stock sin consultar productos"""
+        ids = f"{self.products[1].pk},{self.products[3].pk}"
+        self.client.get(reverse("api_availability"), {"ids": ids})
+        cache.delete("catalog:version")
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("api_availability"), {"ids": ids})
+        self.assertEqual(response.json()["stock"], {str(self.products[1].pk): 1, str(self.products[3].pk): 0})
+
+        response = self.client.get(reverse("api_availability"), {"ids": "1,uno"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_product_page_badge(self):
+        """Test que verifica que la página del producto marca la disponibilidad para stock.js"""
+        response = self.client.get(reverse("product_detail", args=[self.products[2].pk]))
+        self.assertContains(response, f'data-stock-product="{self.products[2].pk}" data-available="true"')
+        response = self.client.get(reverse("product_detail", args=[self.products[3].pk]))
+        self.assertContains(response, 'data-available="false"')
+
+    def test_categories(self):
+        """Test que verifica la lista de categorías activas"""
+        Category.objects.create(name="Ocultas", is_active=False)
+        response = self.client.get(reverse("api_categories"))
+        self.assertEqual([c["name"] for c in response.json()["results"]], ["Pizzas"])
+
+
+class CatalogChangesAPITest(TestCase):
+    """Tests para la sincronización incremental del catálogo"""
+
+    def setUp(self):
+        self.pizzas = Category.objects.create(name="Pizzas")
+        self.pizza = Product.objects.create(
+            category=self.pizzas, name="Pizza", description="Muzzarella", price="10.00", quantity=5
+        )
+        self.salad = Product.objects.create(name="Ensalada", description="Mixta", price="4.00", quantity=2)
+
+    def _changes(self, since, **params):
+        return self.client.get(reverse("menu_changes"), {"since": since, **params}).json()
+
+    def test_full_then_incremental(self):
+        """Test que verifica una sincronización completa y luego solo los cambios"""
+        full = self._changes(0)
+        self.assertEqual({p["name"] for p in full["products"]}, {"Pizza", "Ensalada"})
+        self.assertEqual([c["name"] for c in full["categories"]], ["Pizzas"])
+
+        self.pizza.update(price=12)
+        salad_pk = self.salad.pk
+        self.salad.delete()
+        # Cambios y productos; sin categorías modificadas no se consultan.
+        with self.assertNumQueries(2):
+            delta = self.client.get(reverse("menu_changes"), {"since": full["seq"]}).json()
+
+        self.assertEqual([(p["name"], p["price"]) for p in delta["products"]], [("Pizza", "12.00")])
+        self.assertEqual(delta["deleted"], {"products": [salad_pk], "categories": []})
+        self.assertEqual(self._changes(delta["seq"])["products"], [])
+
+    def test_created_and_deleted_in_window(self):
+        """Test que verifica que un producto creado y borrado después de since se informa como borrado"""
+        seq = self._changes(0)["seq"]
+        temporary = Product.objects.create(name="Temporal", description="x", price=1, quantity=1)
+        pk = temporary.pk
+        temporary.delete()
+        self.assertEqual(self._changes(seq)["deleted"]["products"], [pk])
+
+    def test_more(self):
+        """Test que verifica que los cambios se entregan en tandas con "more" """
+        from menu_app.api import CatalogChangesAPIView
+
+        CatalogChangesAPIView.limit, original = 2, CatalogChangesAPIView.limit
+        self.addCleanup(setattr, CatalogChangesAPIView, "limit", original)
+        first = self._changes(0)
+        self.assertTrue(first["more"])
+        second = self._changes(first["seq"])
+        self.assertFalse(second["more"])
+
+    def test_invalid_since(self):
+        """Test que verifica que un since inválido da 400"""
+        response = self.client.get(reverse("menu_changes"), {"since": "ayer"})
+        self.assertEqual(response.status_code, 400)
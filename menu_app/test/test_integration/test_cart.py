@@ -0,0 +1,97 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from menu_app.cart import COOKIE_NAME, Cart
+from menu_app.models import Order, Product, User
+
+
+class CartViewTest(TestCase):
+    """Tests para las vistas del carrito"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="cliente", password="clave")
+        self.pizza = Product.objects.create(name="Pizza", description="Muzzarella", price=10, quantity=5)
+
+    def test_add_without_database(self):
+        """Test que verifica que agregar al carrito no consulta la BD ni usa la sesión"""
+        with self.assertNumQueries(0):
+            response = self.client.post(reverse("cart_update", args=[self.pizza.pk]), {"quantity": 2})
+        self.assertRedirects(response, reverse("cart"))
+        self.assertIn(COOKIE_NAME, response.cookies)
+        self.assertNotIn("sessionid", response.cookies)
+
+    @override_settings(PAGE_CACHE_TTL=30)
+    def test_add_requires_csrf_token_from_cached_page(self):
+        """Test que verifica que agregar exige el token CSRF, tomado de la cookie de la página cacheada"""
+        self.addCleanup(cache.clear)
+        client = Client(enforce_csrf_checks=True)
+        url = reverse("cart_update", args=[self.pizza.pk])
+        self.assertEqual(client.post(url, {"quantity": 1}).status_code, 403)
+
+        # La segunda visita sale del cache y aun así envía la cookie.
+        Client().get(reverse("product_detail", args=[self.pizza.pk]))
+        page = client.get(reverse("product_detail", args=[self.pizza.pk]))
+        self.assertContains(page, "data-csrf-cookie")
+        token = page.cookies[settings.CSRF_COOKIE_NAME].value
+
+        response = client.post(url, {"quantity": 1, "csrfmiddlewaretoken": token})
+        self.assertRedirects(response, reverse("cart"), fetch_redirect_response=False)
+
+    def test_cart_page_single_query(self):
+        """Test que verifica que la página del carrito hace una sola consulta"""
+        self.client.post(reverse("cart_update", args=[self.pizza.pk]), {"quantity": 2})
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("cart"))
+        self.assertContains(response, "Pizza")
+        self.assertEqual(response.context["total"], 20)
+
+    def test_remove(self):
+        """Test que verifica que cantidad 0 quita el producto y borra la cookie"""
+        self.client.post(reverse("cart_update", args=[self.pizza.pk]))
+        response = self.client.post(reverse("cart_update", args=[self.pizza.pk]), {"quantity": 0})
+        self.assertEqual(response.cookies[COOKIE_NAME].value, "")
+
+    def test_checkout(self):
+        """Test que verifica que confirmar el carrito crea el pedido y lo vacía"""
+        self.client.force_login(self.user)
+        self.client.post(reverse("cart_update", args=[self.pizza.pk]), {"quantity": 2})
+
+        response = self.client.post(reverse("checkout"))
+
+        self.assertRedirects(response, reverse("account"))
+        self.assertEqual(Order.objects.get(user=self.user).amount, 20)
+        self.assertEqual(response.cookies[COOKIE_NAME].value, "")
+
+    def test_checkout_out_of_stock(self):
+        """Test que verifica que sin stock se vuelve a mostrar el carrito con el error"""
+        self.client.force_login(self.user)
+        self.client.post(reverse("cart_update", args=[self.pizza.pk]), {"quantity": 9})
+
+        response = self.client.post(reverse("checkout"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Solo quedan 5 unidades")
+        self.assertFalse(Order.objects.exists())
+
+    def test_checkout_sold_out_after_revalidate(self):
+        """Test que verifica que si otro pedido agota el stock después de revalidar se muestra el error"""
+        self.client.force_login(self.user)
+        self.client.post(reverse("cart_update", args=[self.pizza.pk]), {"quantity": 2})
+        revalidate = Cart.revalidate
+
+        def sold_out(cart):
+            result = revalidate(cart)
+            Product.objects.filter(pk=self.pizza.pk).update(quantity=1)
+            return result
+
+        with mock.patch.object(Cart, "revalidate", sold_out):
+            response = self.client.post(reverse("checkout"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "No quedan unidades suficientes de Pizza")
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual(Product.objects.get(pk=self.pizza.pk).quantity, 1)
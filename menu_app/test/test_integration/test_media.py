@@ -0,0 +1,76 @@
+import tempfile
+from io import StringIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from menu_app.media_storage import is_content_addressed
+from menu_app.models import Product
+
+
+class MediaViewTest(TestCase):
+    """Tests para el servicio de imágenes direccionadas por contenido"""
+
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings = override_settings(MEDIA_ROOT=media.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.data = bytes(range(256)) * 4
+        self.name = default_storage.save("pizza.jpg", ContentFile(self.data))
+        self.url = default_storage.url(self.name)
+
+    def test_full_file(self):
+        """Test que verifica la respuesta completa con ETag y cache inmutable"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.data)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertEqual(response["Content-Length"], str(len(self.data)))
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertIn(response["ETag"].strip('"'), self.name)
+
+    def test_range(self):
+        """Test que verifica que un Range devuelve 206 con solo los bytes pedidos"""
+        response = self.client.get(self.url, HTTP_RANGE="bytes=10-19")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), self.data[10:20])
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(response["Content-Range"], f"bytes 10-19/{len(self.data)}")
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=5000-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{len(self.data)}")
+
+    def test_if_none_match(self):
+        """Test que verifica que con el ETag vigente se responde 304"""
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_unknown_names(self):
+        """Test que verifica que solo se sirven nombres direccionados por contenido"""
+        self.assertEqual(self.client.get("/media/../db.sqlite3").status_code, 404)
+        self.assertEqual(self.client.get(self.url.replace(self.name[-10:-4], "000000")).status_code, 404)
+
+    def test_dedupe_images_command(self):
+        """Test que verifica que dedupe_images pasa las imágenes del fixture al storage por contenido"""
+        for name in ("Pizza", "Otra pizza"):
+            Product.objects.create(
+                name=name, description="Muzzarella", price=10, quantity=1,
+                image="/static/images/pizza_margherita.jpg",
+            )
+
+        out = StringIO()
+        call_command("dedupe_images", stdout=out)
+
+        self.assertIn("2 productos actualizados, 1 archivos distintos", out.getvalue())
+        names = set(Product.objects.values_list("image", flat=True))
+        self.assertEqual(len(names), 1)
+        self.assertTrue(is_content_addressed(names.pop()))
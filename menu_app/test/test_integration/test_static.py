@@ -0,0 +1,94 @@
+import gzip
+import io
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from menu_app.management.commands import vendor_assets
+from menu_app.middleware import StaticAssetsMiddleware
+
+
+class StaticPipelineTest(SimpleTestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        self.settings = override_settings(
+            STATIC_ROOT=self.root.name,
+            STORAGES={
+                "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+                "staticfiles": {"BACKEND": "menu_app.storage.CompressedManifestStaticFilesStorage"},
+            },
+        )
+        self.settings.enable()
+        self.addCleanup(self.settings.disable)
+        call_command("collectstatic", interactive=False, verbosity=0)
+        self.middleware = StaticAssetsMiddleware(lambda request: None)
+
+    def _get(self, name, encoding=""):
+        request = RequestFactory().get(f"/static/{name}", HTTP_ACCEPT_ENCODING=encoding)
+        return self.middleware(request)
+
+    def test_collectstatic_writes_gzip_variants(self):
+        """Test que verifica que collectstatic genera las variantes .gz"""
+        hashed = staticfiles_storage.stored_name("admin/css/base.css")
+
+        self.assertNotEqual(hashed, "admin/css/base.css")
+        compressed = Path(self.root.name, hashed + ".gz").read_bytes()
+        self.assertEqual(gzip.decompress(compressed), Path(self.root.name, hashed).read_bytes())
+
+    def test_serves_hashed_file_immutable_and_compressed(self):
+        """Test que verifica encabezados de cache, Vary y Content-Encoding"""
+        hashed = staticfiles_storage.stored_name("admin/css/base.css")
+
+        response = self._get(hashed, "gzip, deflate")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Content-Type"], "text/css")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertIn("immutable", response["Cache-Control"])
+        response.close()
+
+    def test_zero_quality_refuses_encoding(self):
+        """Test que verifica que q=0 en Accept-Encoding rechaza la codificación"""
+        hashed = staticfiles_storage.stored_name("admin/css/base.css")
+
+        for header in ("gzip;q=0, br;q=0", "br;q=0, *;q=0", "*;q=0"):
+            response = self._get(hashed, header)
+            self.assertNotIn("Content-Encoding", response, header)
+            response.close()
+        response = self._get(hashed, "br;q=0, *;q=0.5")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        response.close()
+
+    def test_serves_plain_file_without_encoding(self):
+        """Test que verifica la respuesta sin compresión y sin hash"""
+        response = self._get("admin/css/base.css")
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertNotIn("immutable", response["Cache-Control"])
+        response.close()
+
+    def test_missing_file_and_traversal_pass_through(self):
+        """Test que verifica que los archivos inexistentes siguen a la vista"""
+        self.assertIsNone(self._get("no/existe.css"))
+        self.assertIsNone(self._get("../settings.py"))
+
+
+class VendorAssetsCommandTest(SimpleTestCase):
+    def test_vendor_assets_strips_source_maps(self):
+        """Test que verifica la descarga de Bootstrap sin referencias a .map"""
+        with tempfile.TemporaryDirectory() as directory:
+            body = b"body{}\n/*# sourceMappingURL=bootstrap.min.css.map */"
+            with mock.patch.object(vendor_assets, "VENDOR_DIR", Path(directory)), mock.patch.object(
+                vendor_assets, "urlopen", side_effect=lambda url, timeout: io.BytesIO(body)
+            ):
+                call_command("vendor_assets", stdout=io.StringIO())
+
+            css = Path(directory, "bootstrap", "bootstrap.min.css").read_bytes()
+            self.assertEqual(css, b"body{}")
+            self.assertTrue(Path(directory, "bootstrap-icons", "fonts", "bootstrap-icons.woff2").exists())
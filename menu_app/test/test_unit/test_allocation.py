@@ -0,0 +1,107 @@
+from datetime import date, datetime, time, timezone as dt_timezone
+
+import numpy as np
+from django.test import SimpleTestCase, TestCase
+
+from menu_app.allocation import TableAllocator
+from menu_app.models import Booking, Table, TableTimeSlot, TimeSlot, User
+
+
+def allocator(sizes, times, capacities, slots):
+    """Arma un asignador con una mesa por capacidad en cada intervalo (inicio, fin)."""
+    resources = [(capacity, slot) for slot in range(len(slots)) for capacity in capacities]
+    return TableAllocator(
+        booking_ids=range(1, len(sizes) + 1),
+        sizes=sizes,
+        times=times,
+        resource_ids=range(1, len(resources) + 1),
+        capacities=[capacity for capacity, _ in resources],
+        slot_ids=[slot + 1 for _, slot in resources],
+        starts=[slots[slot][0] for _, slot in resources],
+        ends=[slots[slot][1] for _, slot in resources],
+    )
+
+
+class TableAllocatorTest(SimpleTestCase):
+    def test_large_party_not_blocked(self):
+        """Test que verifica que un grupo chico no bloquea la mesa grande"""
+        plan = allocator([2, 6], [np.nan, np.nan], [2, 6], [(0, 10)])
+
+        self.assertEqual(plan.solve(), 8)
+        self.assertEqual(plan.assignments(), {1: 1, 2: 2})
+
+    def test_augmenting_path(self):
+        """Test que verifica que se reubican reservas para sentar a otra"""
+        # La reserva 1 (sin hora) entra en ambos turnos; la 2 solo en el primero.
+        plan = allocator([4, 4], [np.nan, 5], [4], [(0, 10), (10, 20)])
+        plan._place(0)
+        self.assertEqual(plan.assignments(), {1: 1})
+
+        plan._place(1)
+
+        self.assertEqual(plan.seated_covers(), 8)
+        self.assertEqual(plan.assignments(), {1: 2, 2: 1})
+
+    def test_maximizes_covers(self):
+        """Test que verifica el óptimo contra una búsqueda exhaustiva"""
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            sizes = rng.integers(1, 7, size=6)
+            times = rng.choice([np.nan, 5.0, 15.0], size=6)
+            plan = allocator(sizes, times, [2, 4, 6], [(0, 10), (10, 20)])
+            self.assertEqual(plan.solve(), self._brute_force(plan))
+
+    def test_update_booking(self):
+        """Test que verifica la re-planificación incremental de una reserva"""
+        plan = allocator([2, 2], [np.nan, np.nan], [2, 6], [(0, 10)])
+        plan.solve()
+
+        covers = plan.update_booking(1, party_size=6)
+
+        self.assertEqual(covers, 8)
+        self.assertEqual(plan.assignments(), {1: 2, 2: 1})
+
+        covers = plan.update_booking(2, party_size=8)
+        self.assertEqual(covers, 6)
+
+    def _brute_force(self, plan):
+        best = 0
+
+        def search(b, used, covers):
+            nonlocal best
+            if b == len(plan.sizes):
+                best = max(best, covers)
+                return
+            search(b + 1, used, covers)
+            for r in plan._candidates[b].tolist():
+                if r not in used:
+                    search(b + 1, used | {r}, covers + int(plan.sizes[b]))
+
+        search(0, frozenset(), 0)
+        return best
+
+
+class TableAllocatorDatabaseTest(TestCase):
+    def test_for_date_and_save(self):
+        """Test que verifica la carga y el guardado de la asignación de una fecha"""
+        user = User.objects.create_user(username="cliente", password="clave")
+        day = date(2025, 5, 10)
+        small = Booking.objects.create(user=user, code="B1", date=day, time=time(20, 30), party_size=2)
+        large = Booking.objects.create(user=user, code="B2", date=day, time=time(20, 15), party_size=5)
+        slot = TimeSlot.objects.create(
+            start=datetime(2025, 5, 10, 20, tzinfo=dt_timezone.utc),
+            end=datetime(2025, 5, 10, 22, tzinfo=dt_timezone.utc),
+        )
+        big_table = Table.objects.create(capacity=6, description="Ventana", is_reserved=False)
+        small_table = Table.objects.create(capacity=2, description="Barra", is_reserved=False)
+        for table in (big_table, small_table):
+            TableTimeSlot.objects.create(table=table, timeslot=slot)
+
+        with self.assertNumQueries(2):
+            plan = TableAllocator.for_date(day)
+        self.assertEqual(plan.solve(), 7)
+        plan.save()
+
+        self.assertEqual(TableTimeSlot.objects.get(booking=large).table, big_table)
+        self.assertEqual(TableTimeSlot.objects.get(booking=small).table, small_table)
+        self.assertTrue(TimeSlot.objects.get(pk=slot.pk).is_full)
@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from menu_app import archive, forecasting, rollups
+from menu_app.models import (
+    ArchivedNotification,
+    ArchivedOrder,
+    ArchivedRating,
+    DailyProductSales,
+    Notification,
+    Order,
+    OrderProduct,
+    Product,
+    Rating,
+    User,
+    UserNotification,
+)
+
+
+class ArchiveTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="cliente", password="clave")
+        self.product = Product.objects.create(name="Pizza", description="Muzzarella", price=10, quantity=5)
+        self.old_day = timezone.localdate() - timedelta(days=400)
+
+    def _order(self, buy_date, state):
+        order, _ = Order.place(self.user, [self.product], buy_date=buy_date)
+        Order.objects.filter(pk=order.pk).update(state=state)
+        return Order.objects.get(pk=order.pk)
+
+    def test_archive_orders(self):
+        """Test que verifica que solo se archivan pedidos viejos en estado final"""
+        old = self._order(self.old_day, "PREPARACION")
+        old.transition("ENVIADO")
+        old.transition("RECIBIDO")
+        pending = self._order(self.old_day, "PREPARACION")
+        recent = self._order(timezone.localdate(), "RECIBIDO")
+
+        result = archive.archive_all(batch_size=1)
+
+        self.assertEqual(result["orders"], 1)
+        self.assertEqual(set(Order.objects.values_list("pk", flat=True)), {pending.pk, recent.pk})
+        self.assertFalse(OrderProduct.objects.filter(order_id=old.pk).exists())
+        archived = ArchivedOrder.objects.get(pk=old.pk)
+        self.assertEqual(archived.code, old.code)
+        self.assertEqual(list(archived.products), [self.product])
+        self.assertEqual([log[:2] for log in archived.state_log], [["PREPARACION", "ENVIADO"], ["ENVIADO", "RECIBIDO"]])
+        self.assertEqual(archived.unit_prices, ["10.00"])
+        # Los acumulados de ventas no cambian al archivar.
+        self.assertEqual(DailyProductSales.objects.get(day=self.old_day).units, 2)
+
+    def test_rebuild_keeps_archived_days(self):
+        """Test que verifica que recalcular los acumulados no borra las ventas de días archivados"""
+        self._order(self.old_day, "RECIBIDO")
+        recent_day = timezone.localdate() - timedelta(days=1)
+        self._order(recent_day, "RECIBIDO")
+        archive.archive_all()
+
+        result = rollups.rebuild()
+
+        self.assertEqual(result["start"], self.old_day + timedelta(days=1))
+        old = DailyProductSales.objects.get(day=self.old_day)
+        self.assertEqual((old.units, old.revenue), (1, 10))
+        self.assertEqual(DailyProductSales.objects.get(day=recent_day).units, 1)
+
+        rollups.rebuild(self.old_day, self.old_day)
+        self.assertEqual(DailyProductSales.objects.get(day=self.old_day).units, 1)
+
+    def test_forecasting_reads_archived_days(self):
+        """Test que verifica que el pronóstico cuenta las ventas de pedidos archivados"""
+        self._order(self.old_day, "RECIBIDO")
+        self._order(timezone.localdate(), "RECIBIDO")
+        archive.archive_all()
+
+        product_ids, start, sales = forecasting.load_daily_sales(days=730)
+
+        self.assertEqual(list(product_ids), [self.product.pk])
+        self.assertEqual(sales[0, (self.old_day - start).days], 1)
+        self.assertEqual(sales[0, -1], 1)
+        self.assertEqual(sales.sum(), 2)
+
+    def test_non_positive_arguments(self):
+        """Test que verifica que el comando rechaza antigüedades y lotes no positivos"""
+        self._order(self.old_day, "RECIBIDO")
+        for args in (["--days", "0"], ["--days", "-30"], ["--batch-size", "0"]):
+            with self.assertRaises(CommandError):
+                call_command("archive_cold_rows", *args)
+        self.assertFalse(ArchivedOrder.objects.exists())
+
+    def test_transparent_reads(self):
+        """Test que verifica que las lecturas combinan tablas activas y de archivo"""
+        old = self._order(self.old_day, "RECIBIDO")
+        recent = self._order(timezone.localdate(), "RECIBIDO")
+        archive.archive_all()
+
+        self.assertIsInstance(archive.find_order(old.code), ArchivedOrder)
+        self.assertIsInstance(archive.find_order(recent.code), Order)
+        self.assertIsNone(archive.find_order("inexistente"))
+        self.assertEqual([order.pk for order in archive.orders_for(self.user)], [recent.pk, old.pk])
+
+    def test_archive_ratings_and_notifications(self):
+        """Test que verifica el archivado de calificaciones y notificaciones con sus destinatarios"""
+        long_ago = timezone.now() - timedelta(days=400)
+        rating = Rating.objects.create(user=self.user, product=self.product, title="Rica", text="Muy rica", rating=5)
+        Rating.objects.filter(pk=rating.pk).update(created_at=long_ago)
+        Rating.objects.create(user=self.user, product=self.product, title="Nueva", text="Bien", rating=4)
+        notification = Notification.objects.create(title="Promo", message="2x1")
+        UserNotification.objects.create(user=self.user, notification=notification)
+        Notification.objects.filter(pk=notification.pk).update(created_at=long_ago)
+
+        result = archive.archive_all()
+
+        self.assertEqual((result["ratings"], result["notifications"]), (1, 1))
+        self.assertEqual(ArchivedRating.objects.get().title, "Rica")
+        self.assertEqual([r.title for r in archive.ratings_for(self.product)], ["Nueva", "Rica"])
+        self.assertFalse(Notification.objects.exists())
+        self.assertEqual(list(ArchivedNotification.objects.get().users.all()), [self.user])
+        self.assertEqual([n.title for n in archive.notifications_for(self.user)], ["Promo"])
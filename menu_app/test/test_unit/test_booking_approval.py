@@ -0,0 +1,71 @@
+from datetime import date, datetime, time, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from menu_app.models import Booking, Notification, Table, TableTimeSlot, TimeSlot, User, UserNotification
+
+
+class BookingApprovalTest(TestCase):
+    def setUp(self):
+        self.day = date(2025, 6, 7)
+        self.users = [User.objects.create_user(username=f"cliente{i}", password="clave") for i in range(3)]
+        self.bookings = [
+            Booking.objects.create(
+                user=self.users[i % 3], date=self.day, time=time(20, i % 60), party_size=2
+            )
+            for i in range(30)
+        ]
+        start = timezone.make_aware(datetime.combine(self.day, time(20)))
+        slot = TimeSlot.objects.create(start=start, end=start + timedelta(hours=2))
+        self.assigned = Table.objects.create(capacity=2, description="Ventana", is_reserved=False)
+        self.linked = Table.objects.create(
+            capacity=4, description="Barra", is_reserved=False, booking=self.bookings[1]
+        )
+        self.free = Table.objects.create(capacity=4, description="Patio", is_reserved=False)
+        TableTimeSlot.objects.create(table=self.assigned, timeslot=slot, booking=self.bookings[0])
+
+    def test_bulk_approve(self):
+        """Test que verifica que se aprueban las reservas con un número fijo de consultas"""
+        # Lectura, UPDATE, dos bulk_create y mesas, más el savepoint del atomic
+        with self.assertNumQueries(7):
+            approved, skipped = Booking.bulk_approve(Booking.objects.filter(date=self.day))
+
+        self.assertEqual((approved, skipped), (30, 0))
+        self.assertFalse(Booking.objects.filter(approved=False).exists())
+        self.assertEqual(set(Booking.objects.values_list("approval_date", flat=True)), {timezone.localdate()})
+
+        # Una notificación por usuario con sus diez reservas
+        self.assertEqual(Notification.objects.count(), 3)
+        for user in self.users:
+            notification = user.notifications.get()
+            self.assertEqual(notification.title, "Reservas aprobadas")
+            self.assertEqual(len(notification.message.splitlines()), 10)
+
+        reserved = set(Table.objects.filter(is_reserved=True).values_list("pk", flat=True))
+        self.assertEqual(reserved, {self.assigned.pk, self.linked.pk})
+
+    def test_duplicating_queryset(self):
+        """Test que verifica que un queryset con joins que repite reservas no duplica avisos"""
+        Table.objects.create(capacity=2, description="Esquina", is_reserved=False, booking=self.bookings[1])
+        queryset = Booking.objects.filter(tables__capacity__gte=1)
+        self.assertEqual(queryset.count(), 2)
+
+        approved, skipped = Booking.bulk_approve(queryset)
+
+        self.assertEqual((approved, skipped), (1, 0))
+        notification = self.users[1].notifications.get()
+        self.assertEqual(notification.message, f"Reserva {self.bookings[1].code} para el 07/06/2025 a las 20:01.")
+
+    def test_already_approved_skipped(self):
+        """Test que verifica que las reservas ya aprobadas no se vuelven a notificar"""
+        Booking.objects.filter(pk=self.bookings[0].pk).update(approved=True)
+
+        approved, skipped = Booking.bulk_approve(
+            Booking.objects.filter(pk__in=[self.bookings[0].pk, self.bookings[3].pk])
+        )
+
+        self.assertEqual((approved, skipped), (1, 1))
+        self.assertEqual(UserNotification.objects.get().user, self.users[0])
+        self.assertEqual(Notification.objects.get().title, "Reserva aprobada")
+        self.assertEqual(Booking.bulk_approve(Booking.objects.filter(pk=self.bookings[3].pk)), (0, 1))
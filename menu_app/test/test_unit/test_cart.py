@@ -0,0 +1,65 @@
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from menu_app.cart import COOKIE_NAME, Cart, MAX_QUANTITY
+from menu_app.models import DailyProductSales, OrderProduct, Product, User
+
+
+class CartSerializationTest(SimpleTestCase):
+    def test_round_trip(self):
+        """Test que verifica que el carrito se serializa y se lee igual"""
+        cart = Cart()
+        cart.add(3, 2)
+        cart.add(7)
+        cart.add(3)
+        self.assertEqual(cart.dumps(), "3:3|7:1")
+        self.assertEqual(Cart.loads(cart.dumps()).lines, {3: 3, 7: 1})
+        self.assertEqual(len(cart), 4)
+
+    def test_invalid_lines_ignored(self):
+        """Test que verifica que se descartan líneas mal formadas y cantidades excesivas"""
+        cart = Cart.loads("1:2|x:3|4:0|5:-1|6:1000")
+        self.assertEqual(cart.lines, {1: 2, 6: MAX_QUANTITY})
+
+    def test_tampered_cookie(self):
+        """Test que verifica que una cookie sin firma válida da un carrito vacío"""
+        request = RequestFactory().get("/")
+        request.COOKIES[COOKIE_NAME] = "1:5"
+        self.assertEqual(Cart.from_request(request).lines, {})
+
+
+class CartCheckoutTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="cliente", password="clave")
+        self.pizza = Product.objects.create(name="Pizza", description="Muzzarella", price=10, quantity=5)
+        self.salad = Product.objects.create(name="Ensalada", description="Mixta", price=4, quantity=1)
+
+    def test_revalidate_single_query(self):
+        """Test que verifica que la revalidación usa una sola consulta con precios actuales"""
+        cart = Cart({self.pizza.pk: 2, self.salad.pk: 1})
+        Product.objects.filter(pk=self.pizza.pk).update(price=12)
+        with self.assertNumQueries(1):
+            items, errors = cart.revalidate()
+        self.assertEqual(errors, {})
+        self.assertEqual([(p.pk, q, s) for p, q, s in items], [(self.pizza.pk, 2, 24), (self.salad.pk, 1, 4)])
+
+    def test_revalidate_errors(self):
+        """Test que verifica los errores por falta de stock y productos borrados"""
+        cart = Cart({self.salad.pk: 2, 999: 1})
+        _, errors = cart.revalidate()
+        self.assertEqual(set(errors), {self.salad.pk, 999})
+
+    def test_checkout_with_quantities(self):
+        """Test que verifica que el pedido guarda cantidades, importe y acumulados"""
+        order, errors = Cart({self.pizza.pk: 3}).checkout(self.user)
+
+        self.assertIsNone(errors)
+        self.assertEqual(order.amount, 30)
+        self.assertEqual(OrderProduct.objects.get(order=order).quantity, 3)
+        sales = DailyProductSales.objects.get(product=self.pizza)
+        self.assertEqual((sales.orders, sales.units, sales.revenue), (1, 3, 30))
+
+    def test_checkout_empty(self):
+        """Test que verifica que no se confirma un carrito vacío"""
+        order, errors = Cart().checkout(self.user)
+        self.assertIsNone(order)
+        self.assertIn("cart", errors)
@@ -0,0 +1,75 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from menu_app.models import CatalogChange, Category, Product
+
+
+class CatalogChangeTest(TestCase):
+    def setUp(self):
+        self.pizzas = Category.objects.create(name="Pizzas")
+        self.pizza = Product.objects.create(
+            category=self.pizzas, name="Pizza", description="Muzzarella", price=10, quantity=5
+        )
+
+    def _log(self):
+        return list(CatalogChange.objects.values_list("model", "object_id", "action"))
+
+    def test_create_update_delete(self):
+        """Test que verifica que altas, modificaciones y bajas quedan registradas en orden"""
+        self.pizza.update(price=12)
+        pk = self.pizza.pk
+        self.pizza.delete()
+
+        self.assertEqual(self._log(), [
+            ("category", self.pizzas.pk, "upsert"),
+            ("product", pk, "upsert"),
+            ("product", pk, "upsert"),
+            ("product", pk, "delete"),
+        ])
+
+    def test_unchanged_save_not_logged(self):
+        """Test que verifica que guardar sin cambios no agrega entradas"""
+        product = Product.objects.get(pk=self.pizza.pk)
+        before = CatalogChange.objects.count()
+        product.save()
+        self.assertEqual(CatalogChange.objects.count(), before)
+
+    def test_category_delete_logs_products(self):
+        """Test que verifica que borrar una categoría registra la baja de sus productos"""
+        self.pizzas.delete()
+        self.assertIn(("product", self.pizza.pk, "delete"), self._log())
+
+    def test_queryset_delete_logged(self):
+        """Test que verifica que los borrados por queryset quedan registrados"""
+        salad = Product.objects.create(name="Ensalada", description="Mixta", price=4, quantity=1)
+
+        Product.objects.filter(pk__in=[self.pizza.pk, salad.pk]).delete()
+        Category.objects.filter(pk=self.pizzas.pk).delete()
+
+        log = self._log()
+        self.assertIn(("product", self.pizza.pk, "delete"), log)
+        self.assertIn(("product", salad.pk, "delete"), log)
+        self.assertIn(("category", self.pizzas.pk, "delete"), log)
+
+    def test_batch_operations(self):
+        """Test que verifica que new_many y update_many registran sus productos"""
+        (_, salad), = Product.new_many([{"name": "Ensalada", "description": "Mixta", "price": 4}])
+        Product.update_many([{"pk": self.pizza.pk, "price": 11}, {"pk": salad.pk}])
+        log = self._log()
+        self.assertEqual(log.count(("product", salad.pk, "upsert")), 1)
+        self.assertEqual(log.count(("product", self.pizza.pk, "upsert")), 2)
+
+    def test_compact(self):
+        """Test que verifica que la compactación deja solo el último cambio de cada objeto"""
+        self.pizza.update(price=12)
+        self.pizza.update(price=13)
+        out = StringIO()
+        call_command("compact_catalog_changes", stdout=out)
+
+        self.assertIn("2 cambios compactados", out.getvalue())
+        self.assertEqual(self._log(), [
+            ("category", self.pizzas.pk, "upsert"),
+            ("product", self.pizza.pk, "upsert"),
+        ])
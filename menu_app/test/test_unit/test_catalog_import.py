@@ -0,0 +1,118 @@
+import io
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from menu_app import catalog_import
+from menu_app.models import Category, Product
+
+FIXTURE = Path(__file__).resolve().parents[2] / "fixtures" / "products.json"
+
+
+class CatalogImportTest(TestCase):
+    def test_iter_json_small_chunks(self):
+        """Test que verifica la lectura incremental de un array JSON"""
+        stream = io.StringIO('[{"name": "A", "n": [1, 2]}, {"name": "B"}]')
+
+        rows = list(catalog_import.iter_json(stream, chunk_size=4))
+
+        self.assertEqual(rows, [{"name": "A", "n": [1, 2]}, {"name": "B"}])
+
+    def test_iter_json_lines(self):
+        """Test que verifica la lectura de JSON Lines"""
+        stream = io.StringIO('{"name": "A"}\n{"name": "B"}\n')
+
+        self.assertEqual([row["name"] for row in catalog_import.iter_json(stream)], ["A", "B"])
+
+    def test_malformed_records_are_row_errors(self):
+        """Test que verifica que un registro mal formado o que no es un objeto no corta la importación"""
+        stream = io.StringIO(
+            '{"name": "A", "description": "a", "price": 10}\n'
+            '"texto"\n'
+            '{"name": "B", "price": }\n'
+            '{"name": "C", "description": "c", "price": 20}\n'
+        )
+
+        result = catalog_import.import_catalog(catalog_import.iter_json(stream, chunk_size=8))
+
+        self.assertEqual(result["imported"], 2)
+        self.assertEqual([number for number, _ in result["errors"]], [2, 3])
+        self.assertEqual(result["errors"][0][1], {"row": "Se esperaba un objeto"})
+        self.assertIn("JSON inválido", result["errors"][1][1]["row"])
+        self.assertEqual(sorted(Product.objects.values_list("name", flat=True)), ["A", "C"])
+
+    def test_import_fixture(self):
+        """Test que verifica la importación del fixture de productos"""
+        with FIXTURE.open(encoding="utf-8") as stream:
+            result = catalog_import.import_catalog(catalog_import.iter_json(stream))
+
+        self.assertEqual(result["errors"], [])
+        self.assertEqual(result["imported"], 3)
+        self.assertEqual(Product.objects.get(pk=1).name, "Pizza Margherita")
+
+    def test_import_csv_upsert_and_errors(self):
+        """Test que verifica que se actualiza por nombre y se reportan filas inválidas"""
+        Product.objects.create(name="Pizza", description="Vieja", price=100, quantity=1)
+        stream = io.StringIO(
+            "name,description,price,quantity,category\n"
+            "Pizza,Muzzarella,500,10,Pizzas\n"
+            ",Sin nombre,300,1,Pizzas\n"
+            "Fugazza,Cebolla,abc,3,Pizzas\n"
+            "Ensalada,César,350,5,Ensaladas\n"
+        )
+
+        result = catalog_import.import_catalog(catalog_import.iter_csv(stream), batch_size=2)
+
+        self.assertEqual(result["imported"], 2)
+        self.assertEqual([number for number, _ in result["errors"]], [2, 3])
+        self.assertIn("name", result["errors"][0][1])
+        self.assertIn("price", result["errors"][1][1])
+        self.assertEqual(Product.objects.count(), 2)
+        pizza = Product.objects.get(name="Pizza")
+        self.assertEqual((pizza.description, pizza.quantity), ("Muzzarella", 10))
+        self.assertEqual(pizza.category, Category.objects.get(name="Pizzas"))
+        self.assertEqual(Category.objects.count(), 2)
+
+    def test_invalid_price_and_category(self):
+        """Test que verifica que precios no finitos y categorías no escalares son errores de fila"""
+        stream = io.StringIO(
+            '{"name": "A", "description": "a", "price": "NaN", "category": "Nueva"}\n'
+            '{"name": "B", "description": "b", "price": "Infinity"}\n'
+            '{"name": "C", "description": "c", "price": 10, "category": ["Pizzas"]}\n'
+            '{"name": "D", "description": "d", "price": 10, "category": true}\n'
+            '{"name": "E", "description": "e", "price": 10, "quantity": Infinity}\n'
+            '{"name": "F", "description": "f", "price": 10}\n'
+        )
+
+        result = catalog_import.import_catalog(catalog_import.iter_json(stream))
+
+        self.assertEqual(result["imported"], 1)
+        self.assertEqual([number for number, _ in result["errors"]], [1, 2, 3, 4, 5])
+        self.assertEqual([list(errors) for _, errors in result["errors"]][:4], [["price"], ["price"], ["category"], ["category"]])
+        self.assertFalse(Category.objects.exists())
+
+    def test_csv_category_id(self):
+        """Test que verifica que en CSV una categoría numérica se toma como id"""
+        pizzas = Category.objects.create(name="Pizzas")
+        stream = io.StringIO(
+            "name,description,price,quantity,category\n"
+            f"Pizza,Muzzarella,500,10, {pizzas.pk}\n"
+            "Fugazza,Cebolla,400,3,999\n"
+        )
+
+        result = catalog_import.import_catalog(catalog_import.iter_csv(stream))
+
+        self.assertEqual(result["imported"], 1)
+        self.assertEqual(result["errors"], [(2, {"category": "Categoría inexistente: 999"})])
+        self.assertEqual(Product.objects.get().category, pizzas)
+        self.assertEqual(Category.objects.count(), 1)
+
+    def test_command(self):
+        """Test que verifica el comando import_catalog"""
+        out = io.StringIO()
+
+        call_command("import_catalog", str(FIXTURE), stdout=out, stderr=io.StringIO())
+
+        self.assertIn("3 productos importados", out.getvalue())
+        self.assertEqual(Product.objects.count(), 3)
@@ -0,0 +1,140 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.views import View
+from django.http import HttpResponse
+
+from menu_app.coalesce import get_or_compute
+from menu_app.models import Product
+from menu_app.ratelimit import RateLimitMixin, take_token
+
+
+class GetOrComputeTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_hit_after_first_compute(self):
+        """Test que verifica que la segunda lectura no vuelve a calcular"""
+        compute = mock.Mock(return_value="pagina")
+        self.assertEqual(get_or_compute("k", compute, ttl=30), "pagina")
+        self.assertEqual(get_or_compute("k", compute, ttl=30), "pagina")
+        self.assertEqual(compute.call_count, 1)
+
+    def test_stale_served_while_other_revalidates(self):
+        """Test que verifica que una entrada vencida se sirve mientras otro la recalcula"""
+        cache.set("k", ("vieja", time.time() - 1), 300)
+        cache.add("k:lock", 1, 10)  # otro request está revalidando
+        compute = mock.Mock(return_value="nueva")
+
+        self.assertEqual(get_or_compute("k", compute, ttl=30), "vieja")
+        compute.assert_not_called()
+
+    def test_stale_revalidated_by_lock_holder(self):
+        """Test que verifica que el request que toma el lock recalcula la entrada vencida"""
+        cache.set("k", ("vieja", time.time() - 1), 300)
+        self.assertEqual(get_or_compute("k", lambda: "nueva", ttl=30), "nueva")
+        self.assertEqual(get_or_compute("k", lambda: "otra", ttl=30), "nueva")
+
+    def test_concurrent_misses_compute_once(self):
+        """Test que verifica que requests simultáneos sobre una clave vacía calculan una sola vez"""
+        calls = []
+        started = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return "pagina"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_compute("k", compute, ttl=30)))
+            for _ in range(8)
+        ]
+        threads[0].start()
+        started.wait(1)
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["pagina"] * 8)
+
+
+@override_settings(PAGE_CACHE_TTL=30)
+class CoalescedPageTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.product = Product.objects.create(name="Pizza", description="Muzzarella", price=10, quantity=5)
+
+    def test_detail_page_cached(self):
+        """Test que verifica que el detalle de producto se sirve del cache sin consultas"""
+        url = reverse("product_detail", args=[self.product.pk])
+        first = self.client.get(url)
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(first.content, second.content)
+        self.assertContains(second, "Pizza")
+
+    def test_unused_query_params_share_entry(self):
+        """Test que verifica que parámetros que la vista no usa no generan otra entrada"""
+        url = reverse("product_detail", args=[self.product.pk])
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            self.client.get(f"{url}?x=1")
+            self.client.get(f"{url}?x=2&y=3")
+
+    def test_missing_product_not_cached(self):
+        """Test que verifica que un 404 no se guarda en el cache"""
+        url = reverse("product_detail", args=[self.product.pk + 1])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        Product.objects.create(id=self.product.pk + 1, name="Empanada", description="Carne", price=2, quantity=5)
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+
+class RateLimitTest(SimpleTestCase):
+    class WriteView(RateLimitMixin, View):
+        rate_limit = (2, 1)
+
+        def post(self, request):
+            return HttpResponse("ok")
+
+        def get(self, request):
+            return HttpResponse("ok")
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.factory = RequestFactory()
+
+    def _request(self, method="post"):
+        request = getattr(self.factory, method)("/", REMOTE_ADDR="10.0.0.1")
+        request.user = mock.Mock(is_authenticated=False)
+        return self.WriteView.as_view()(request)
+
+    def test_bucket_refills(self):
+        """Test que verifica que el bucket se vacía y se recarga con el tiempo"""
+        self.assertEqual(take_token("b", 2, 1, now=100), (True, 0))
+        self.assertEqual(take_token("b", 2, 1, now=100), (True, 0))
+        self.assertEqual(take_token("b", 2, 1, now=100), (False, 1))
+        self.assertEqual(take_token("b", 2, 1, now=101), (True, 0))
+
+    def test_view_returns_429(self):
+        """Test que verifica que la vista responde 429 con Retry-After al agotar el bucket"""
+        self.assertEqual(self._request().status_code, 200)
+        self.assertEqual(self._request().status_code, 200)
+        response = self._request()
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+
+    def test_reads_not_limited(self):
+        """Test que verifica que los GET no consumen tokens"""
+        for _ in range(5):
+            self.assertEqual(self._request("get").status_code, 200)
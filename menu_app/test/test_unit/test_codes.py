@@ -0,0 +1,92 @@
+from datetime import date
+from unittest import mock
+
+from django.db import DatabaseError, transaction
+from django.test import SimpleTestCase, TestCase
+
+from menu_app import codes
+from menu_app.models import Booking, CodeSequence, Order, Product, User
+
+
+class EncodeTest(SimpleTestCase):
+    def test_encode_fixed_width(self):
+        """Test que verifica que la codificación tiene ancho fijo y respeta el orden"""
+        self.assertEqual(codes.encode(0, 4), "0000")
+        self.assertEqual(codes.encode(32, 4), "0010")
+        self.assertLess(codes.encode(31, 4), codes.encode(32, 4))
+        with self.assertRaises(ValueError):
+            codes.encode(32 ** 4, 4)
+
+
+class CodeAllocatorTest(TestCase):
+    def test_codes_unique_and_sorted(self):
+        """Test que verifica que los códigos son únicos y crecientes"""
+        allocator = codes.CodeAllocator("test", "T", block_size=100)
+        generated = [allocator.next_code() for _ in range(1000)]
+
+        self.assertEqual(len(set(generated)), 1000)
+        self.assertEqual(generated, sorted(generated))
+        self.assertEqual(len(generated[0]), 1 + codes.TIME_DIGITS + codes.SEQUENCE_DIGITS)
+        self.assertEqual(CodeSequence.objects.get(name="test").next_value, 1000)
+
+    def test_one_query_batch_per_block(self):
+        """Test que verifica que solo se consulta la BD al reservar un bloque nuevo"""
+        allocator = codes.CodeAllocator("test", "T", block_size=50)
+        allocator.next_code()
+        with self.assertNumQueries(0):
+            for _ in range(49):
+                allocator.next_code()
+
+    def test_processes_get_disjoint_blocks(self):
+        """Test que verifica que dos procesos no reparten el mismo bloque"""
+        parent = codes.CodeAllocator("test", "T", block_size=10)
+        parent.next_code()
+        with mock.patch("menu_app.codes.os.getpid", return_value=-1):
+            child = parent.next_code()
+        self.assertEqual(child[-codes.SEQUENCE_DIGITS:], codes.encode(10, codes.SEQUENCE_DIGITS))
+
+    def test_rolled_back_block_is_discarded(self):
+        """Test que verifica que un bloque reservado en una transacción revertida no se reparte"""
+        allocator = codes.CodeAllocator("test", "T", block_size=10)
+        with self.assertRaises(DatabaseError):
+            with transaction.atomic():
+                allocator.next_code()
+                raise DatabaseError("rollback")
+        # Otro proceso recibe el mismo bloque que la BD volvió a entregar.
+        other = codes.CodeAllocator("test", "T", block_size=10)
+        self.assertEqual(other.next_code()[-codes.SEQUENCE_DIGITS:], codes.encode(0, codes.SEQUENCE_DIGITS))
+
+        code = allocator.next_code()
+
+        self.assertEqual(code[-codes.SEQUENCE_DIGITS:], codes.encode(10, codes.SEQUENCE_DIGITS))
+        self.assertEqual(CodeSequence.objects.get(name="test").next_value, 20)
+
+    def test_clock_going_back(self):
+        """Test que verifica que el prefijo de tiempo no retrocede si el reloj lo hace"""
+        allocator = codes.CodeAllocator("test", "T")
+        with mock.patch("menu_app.codes.time.time", return_value=2000.0):
+            first = allocator.next_code()
+        with mock.patch("menu_app.codes.time.time", return_value=1000.0):
+            second = allocator.next_code()
+        self.assertLess(first, second)
+
+
+class ModelCodesTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="cliente", password="clave")
+
+    def test_order_place_generates_code(self):
+        """Test que verifica que Order.place genera el código si no se indica"""
+        product = Product.objects.create(name="Pizza", description="Muzzarella", price=10, quantity=5)
+        order, errors = Order.place(self.user, [product])
+
+        self.assertIsNone(errors)
+        self.assertTrue(order.code.startswith("P"))
+
+    def test_booking_default_code(self):
+        """Test que verifica que las reservas reciben un código por defecto"""
+        first = Booking.objects.create(user=self.user, date=date(2025, 5, 1))
+        second = Booking.objects.create(user=self.user, date=date(2025, 5, 1))
+
+        self.assertTrue(first.code.startswith("R"))
+        self.assertLess(first.code, second.code)
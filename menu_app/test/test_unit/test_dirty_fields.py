@@ -0,0 +1,65 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from menu_app.models import Product
+
+
+class DirtyFieldsTest(TestCase):
+    def setUp(self):
+        Product.objects.create(
+            name="Pizza", description="Muzzarella", price=10, quantity=5, image="products/pizza.jpg"
+        )
+        self.product = Product.objects.get(name="Pizza")
+
+    def _updates(self, ctx):
+        return [query["sql"] for query in ctx.captured_queries if query["sql"].startswith("UPDATE")]
+
+    def test_save_writes_only_changed_columns(self):
+        """Test que verifica que el UPDATE incluye solo las columnas modificadas"""
+        self.product.quantity = 3
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.product.save()
+
+        updates = self._updates(ctx)
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"quantity"', updates[0])
+        for column in ('"name"', '"description"', '"price"', '"image"', '"category_id"'):
+            self.assertNotIn(column, updates[0])
+
+    def test_save_without_changes_skips_update(self):
+        """Test que verifica que no se ejecuta ningún UPDATE si no hubo cambios"""
+        self.product.name = "Pizza"
+
+        with self.assertNumQueries(0):
+            self.product.save()
+
+    def test_update_does_not_clobber_stock(self):
+        """Test que verifica que update no pisa cambios de stock concurrentes"""
+        Product.objects.filter(pk=self.product.pk).update(quantity=1)
+
+        self.product.update(name="Pizza grande")
+
+        product = Product.objects.get(pk=self.product.pk)
+        self.assertEqual((product.name, product.quantity), ("Pizza grande", 1))
+
+    def test_snapshot_reset_after_save(self):
+        """Test que verifica que después de guardar no quedan campos sucios"""
+        self.product.price = 12
+        self.product.save()
+
+        self.assertEqual(self.product.get_dirty_fields(), [])
+        with self.assertNumQueries(0):
+            self.product.save()
+
+    def test_explicit_update_fields(self):
+        """Test que verifica que update_fields explícito se respeta"""
+        self.product.name = "Otro"
+        self.product.quantity = 9
+
+        self.product.save(update_fields=["quantity"])
+
+        product = Product.objects.get(pk=self.product.pk)
+        self.assertEqual((product.name, product.quantity), ("Pizza", 9))
+        self.assertEqual(self.product.get_dirty_fields(), ["name"])
@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+from io import StringIO
+
+import numpy as np
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+
+from menu_app import forecasting
+from menu_app.models import Order, Product, User
+
+
+class ForecastMathTest(SimpleTestCase):
+    def test_moving_average(self):
+        """Test que verifica la media móvil vectorizada"""
+        sales = np.array([[1, 2, 3, 4, 5], [0, 0, 0, 0, 10]], dtype=float)
+
+        result = forecasting.moving_average(sales, 2)
+
+        np.testing.assert_allclose(result[0], [1, 1.5, 2.5, 3.5, 4.5])
+        np.testing.assert_allclose(result[1], [0, 0, 0, 0, 5])
+
+    def test_weekday_seasonality(self):
+        """Test que verifica el índice semanal cuando solo se vende los lunes"""
+        start = date(2025, 5, 5)  # lunes
+        sales = np.zeros((2, 28))
+        sales[0, ::7] = 7
+
+        season = forecasting.weekday_seasonality(sales, start)
+
+        self.assertAlmostEqual(season[0, 0], 7.0)
+        self.assertAlmostEqual(season[0, 1], 0.0)
+        np.testing.assert_allclose(season[1], np.ones(7))
+
+    def test_forecast_reorder_point(self):
+        """Test que verifica que la demanda constante no agrega stock de seguridad"""
+        sales = np.full((1, 56), 3.0)
+
+        result = forecasting.forecast(sales, date(2025, 5, 5), window=28, lead_time=2)
+
+        self.assertAlmostEqual(result["demand"][0], 6.0)
+        self.assertAlmostEqual(result["reorder_point"][0], 6.0)
+
+
+class ReorderSuggestionsTest(TestCase):
+    def test_reorder_suggestions(self):
+        """Test que verifica las sugerencias de reposición a partir de los pedidos"""
+        user = User.objects.create_user(username="cliente", password="clave")
+        pizza = Product.objects.create(name="Pizza", description="Muzzarella", price=500, quantity=100)
+        salad = Product.objects.create(name="Ensalada", description="César", price=350, quantity=50)
+        end = date(2025, 5, 31)
+        for i in range(28):
+            Order.place(user, [pizza, salad], f"A{i}", buy_date=end - timedelta(days=i))
+        # Los pedidos descuentan stock: se fija el stock actual después del historial.
+        Product.objects.filter(pk=pizza.pk).update(quantity=1)
+        Product.objects.filter(pk=salad.pk).update(quantity=50)
+
+        suggestions = forecasting.reorder_suggestions(days=56, window=28, lead_time=2, end=end)
+
+        self.assertEqual([row["name"] for row in suggestions], ["Pizza"])
+        self.assertEqual(suggestions[0]["reorder_point"], 2)
+        self.assertEqual(suggestions[0]["suggested"], 1)
+
+    def test_non_positive_arguments(self):
+        """Test que verifica que días, ventana y reposición deben ser positivos"""
+        with self.assertRaises(ValueError):
+            forecasting.reorder_suggestions(window=0)
+        with self.assertRaises(CommandError):
+            call_command("forecast_stock", "--window", "0", stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command("forecast_stock", "--days", "-1", stdout=StringIO())
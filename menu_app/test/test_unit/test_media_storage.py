@@ -0,0 +1,105 @@
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from menu_app.media_storage import is_content_addressed, parse_range, release
+from menu_app.models import Product
+
+
+class ParseRangeTest(SimpleTestCase):
+    def test_parse_range(self):
+        """Test que verifica la interpretación del header Range"""
+        self.assertEqual(parse_range("bytes=0-99", 1000), (0, 99))
+        self.assertEqual(parse_range("bytes=900-", 1000), (900, 999))
+        self.assertEqual(parse_range("bytes=-100", 1000), (900, 999))
+        self.assertEqual(parse_range("bytes=990-2000", 1000), (990, 999))
+        self.assertIsNone(parse_range(None, 1000))
+        self.assertIsNone(parse_range("bytes=0-1,5-9", 1000))
+        self.assertFalse(parse_range("bytes=1000-", 1000))
+        self.assertFalse(parse_range("bytes=-0", 1000))
+
+
+class ContentAddressedStorageTest(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.root = Path(media.name)
+        settings = override_settings(MEDIA_ROOT=media.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def _files(self):
+        return sorted(path for path in self.root.rglob("*") if path.is_file())
+
+    def test_same_content_stored_once(self):
+        """Test que verifica que la misma foto subida dos veces ocupa un solo archivo"""
+        first = default_storage.save("products/pizza.JPG", ContentFile(b"foto"))
+        second = default_storage.save("products/otra.jpg", ContentFile(b"foto"))
+        other = default_storage.save("products/pizza.jpg", ContentFile(b"otra foto"))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertTrue(is_content_addressed(first))
+        self.assertTrue(first.endswith(".jpg"))
+        self.assertEqual(len(self._files()), 2)
+        self.assertEqual(default_storage.url(first), f"/media/{first}")
+        self.assertEqual(default_storage.url("/static/images/pizza.jpg"), "/static/images/pizza.jpg")
+
+    def test_image_released_when_unreferenced(self):
+        """Test que verifica que la imagen se borra recién cuando ningún producto la usa"""
+        products = [
+            Product.objects.create(
+                name=f"Pizza {i}", description="Muzzarella", price=10, quantity=1,
+                image=SimpleUploadedFile("pizza.jpg", b"foto", content_type="image/jpeg"),
+            )
+            for i in range(2)
+        ]
+        self.assertEqual(products[0].image.name, products[1].image.name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            products[0].delete()
+        self.assertEqual(len(self._files()), 1)
+
+        product = Product.objects.get(pk=products[1].pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            product.image = SimpleUploadedFile("nueva.jpg", b"nueva foto", content_type="image/jpeg")
+            product.save()
+        self.assertEqual([path.name for path in self._files()], [Path(product.image.name).name])
+
+    def test_release_restores_file_adopted_meanwhile(self):
+        """Test que verifica que release no borra un archivo que un alta empezó a usar al liberarlo"""
+        name = default_storage.save("pizza.jpg", ContentFile(b"foto"))
+        in_use = mock.Mock(side_effect=[False, True])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            release(name, in_use)
+
+        self.assertEqual(in_use.call_count, 2)
+        self.assertEqual([path.name for path in self._files()], [Path(name).name])
+
+    def test_reused_file_rewritten_if_released(self):
+        """Test que verifica que un alta que reutilizó un archivo lo reescribe si se borró antes de confirmar"""
+        name = default_storage.save("pizza.jpg", ContentFile(b"foto"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(default_storage.save("otra.jpg", ContentFile(b"foto")), name)
+            default_storage.delete(name)
+
+        self.assertEqual(Path(default_storage.path(name)).read_bytes(), b"foto")
+
+    def test_queryset_delete_releases_image(self):
+        """Test que verifica que un borrado por queryset (como el del admin) también libera la imagen"""
+        Product.objects.create(
+            name="Pizza", description="Muzzarella", price=10, quantity=1,
+            image=SimpleUploadedFile("pizza.jpg", b"foto", content_type="image/jpeg"),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.filter(name="Pizza").delete()
+
+        self.assertEqual(self._files(), [])
@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from menu_app import metrics
+
+
+class MetricsTestMixin:
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        settings = override_settings(METRICS_DIR=directory.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        metrics._totals.clear()
+        metrics._pending().clear()
+        if metrics._timer is not None:
+            metrics._timer.cancel()
+            metrics._timer = None
+
+
+class MetricsRenderTest(MetricsTestMixin, SimpleTestCase):
+    def test_counter_and_histogram(self):
+        """Test que verifica el formato de texto de contadores e histogramas"""
+        counter = metrics.Counter("test_total", "Contador de prueba.", ["kind"])
+        histogram = metrics.Histogram("test_seconds", "Histograma de prueba.", buckets=(0.1, 1.0))
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(3)
+
+        text = metrics.render()
+
+        self.assertIn("# TYPE test_total counter", text)
+        self.assertIn('test_total{kind="a"} 3', text)
+        self.assertIn('test_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('test_seconds_bucket{le="1.0"} 2', text)
+        self.assertIn('test_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("test_seconds_count 3", text)
+
+    def test_aggregates_other_workers(self):
+        """Test que verifica la suma de los archivos de otros procesos"""
+        counter = metrics.Counter("worker_total", "Contador por worker.")
+        counter.inc(2)
+        (self.directory).mkdir(exist_ok=True)
+        (self.directory / "999999.json").write_text(json.dumps([["worker_total", [], 5]]))
+
+        self.assertIn("worker_total 7", metrics.render())
+
+    def test_remove_process_keeps_counters(self):
+        """Test que verifica que los totales de un worker que terminó se conservan en el acumulado"""
+        metrics.Counter("worker_total", "Contador por worker.")
+        for pid, value in ((111, 5), (222, 3)):
+            (self.directory / f"{pid}.json").write_text(json.dumps([["worker_total", [], value]]))
+
+        metrics.remove_process(111)
+        self.assertEqual(sorted(path.name for path in self.directory.iterdir()), ["222.json", "aggregate.json"])
+        self.assertIn("worker_total 8", metrics.render())
+
+        metrics.remove_process(222)
+        self.assertIn("worker_total 8", metrics.render())
+        metrics.clear()
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+    def test_idle_worker_writes_after_interval(self):
+        """Test que verifica que lo acumulado después de una escritura se escribe al cumplirse el intervalo"""
+        counter = metrics.Counter("idle_total", "Contador de un worker inactivo.")
+        metrics.flush(force=True)
+        counter.inc()
+        with patch.object(metrics, "WRITE_INTERVAL", 0.3):
+            metrics.flush()
+            path = self.directory / f"{os.getpid()}.json"
+            self.assertNotIn("idle_total", path.read_text())
+            metrics._timer.join()
+
+        self.assertEqual(json.loads(path.read_text()), [["idle_total", [], 1]])
+
+
+class MetricsEndpointTest(MetricsTestMixin, TestCase):
+    def test_metrics_endpoint_records_views(self):
+        """Test que verifica que /metrics expone la latencia de las vistas"""
+        self.client.get(reverse("menu"))
+
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        text = response.content.decode()
+        self.assertIn('http_requests_total{view="menu",method="GET",status="200"} 1', text)
+        self.assertIn('http_request_duration_seconds_count{view="menu"} 1', text)
+        self.assertIn('db_queries_total{view="menu"} 1', text)
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.1"], METRICS_TOKEN="secreto")
+    def test_metrics_endpoint_requires_ip_or_token(self):
+        """Test que verifica que /metrics solo responde a IPs permitidas o con el token"""
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+        self.assertEqual(
+            self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer otro").status_code, 403
+        )
+        self.assertEqual(
+            self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secreto").status_code, 200
+        )
+        self.assertEqual(self.client.get(reverse("metrics"), REMOTE_ADDR="10.0.0.1").status_code, 200)
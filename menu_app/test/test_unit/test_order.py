@@ -0,0 +1,94 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from menu_app.models import Category, DailyStateSales, Order, OrderStateLog, Product, User
+
+
+class OrderStateTransitionTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="cliente", password="clave")
+
+    def _order(self, code, state="PREPARACION"):
+        return Order.objects.create(
+            user=self.user, buy_date=date(2025, 5, 1), code=code, amount=100, state=state
+        )
+
+    def test_transition_valid(self):
+        """Test que verifica una transición válida y su registro"""
+        order = self._order("A1")
+
+        success, errors = order.transition("ENVIADO")
+
+        self.assertTrue(success)
+        self.assertIsNone(errors)
+        self.assertEqual(Order.objects.get(pk=order.pk).state, "ENVIADO")
+        log = OrderStateLog.objects.get(order=order)
+        self.assertEqual((log.from_state, log.to_state), ("PREPARACION", "ENVIADO"))
+
+    def test_transition_invalid(self):
+        """Test que verifica que no se permiten transiciones inválidas"""
+        order = self._order("A1", state="RECIBIDO")
+
+        success, errors = order.transition("PREPARACION")
+
+        self.assertFalse(success)
+        self.assertIn("state", errors)
+        self.assertEqual(Order.objects.get(pk=order.pk).state, "RECIBIDO")
+        self.assertFalse(OrderStateLog.objects.exists())
+
+    def test_transition_stale_instance(self):
+        """Test que verifica que no se pisa un cambio hecho por otro proceso"""
+        order = self._order("A1")
+        Order.objects.filter(pk=order.pk).update(state="CANCELADO")
+
+        success, errors = order.transition("ENVIADO")
+
+        self.assertFalse(success)
+        self.assertEqual(Order.objects.get(pk=order.pk).state, "CANCELADO")
+
+    def test_bulk_transition(self):
+        """Test que verifica la transición masiva con un único UPDATE"""
+        for i in range(3):
+            self._order(f"P{i}")
+        self._order("R1", state="RECIBIDO")
+
+        with CaptureQueriesContext(connection) as ctx:
+            transitioned, rejected = Order.bulk_transition(Order.objects.all(), "ENVIADO")
+
+        sql = [query["sql"] for query in ctx.captured_queries]
+        self.assertEqual(len([q for q in sql if q.startswith('UPDATE "menu_app_order"')]), 1)
+        self.assertEqual(len([q for q in sql if q.startswith('INSERT INTO "menu_app_orderstatelog"')]), 1)
+
+        self.assertEqual((transitioned, rejected), (3, 1))
+        self.assertEqual(Order.objects.filter(state="ENVIADO").count(), 3)
+        self.assertEqual(OrderStateLog.objects.filter(to_state="ENVIADO").count(), 3)
+
+    def test_bulk_transition_joined_queryset(self):
+        """Test que verifica que un queryset con joins no registra dos veces el mismo pedido"""
+        category = Category.objects.create(name="Pizzas")
+        products = [
+            Product.objects.create(category=category, name=name, description="Rica", price=10, quantity=5)
+            for name in ("Pizza", "Fugazza")
+        ]
+        order, _ = Order.place(self.user, products, buy_date=date(2025, 5, 1))
+
+        transitioned, rejected = Order.bulk_transition(
+            Order.objects.filter(products__category=category), "CANCELADO"
+        )
+
+        self.assertEqual((transitioned, rejected), (1, 0))
+        self.assertEqual(OrderStateLog.objects.filter(order=order).count(), 1)
+        self.assertEqual(
+            list(DailyStateSales.objects.filter(state="CANCELADO").values_list("orders", flat=True)), [1]
+        )
+        self.assertEqual(
+            sorted(Product.objects.values_list("quantity", flat=True)), [5, 5]
+        )
+
+    def test_bulk_transition_unknown_state(self):
+        """Test que verifica que se rechaza un estado inexistente"""
+        with self.assertRaises(ValueError):
+            Order.bulk_transition(Order.objects.all(), "PERDIDO")
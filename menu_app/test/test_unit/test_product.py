@@ -139,3 +139,60 @@ class ProductModelTest(TestCase):
         self.assertEqual(updated_product.description, new_description)
         self.assertEqual(updated_product.price, original_price)
         self.assertEqual(updated_product.quantity, original_quantity)
+
+
+class ProductBatchTest(TestCase):
+    def test_validate_many(self):
+        """Test que verifica la validación por lotes por índice"""
+        errors = Product.validate_many([
+            {"name": "Pizza", "description": "Muzzarella", "price": 10},
+            {"name": "", "description": "Sin nombre", "price": 0},
+        ])
+
+        self.assertEqual(errors[0], {})
+        self.assertEqual(set(errors[1]), {"name", "price"})
+
+    def test_new_many(self):
+        """Test que verifica la creación por lotes con un solo INSERT (más el del registro de cambios)"""
+        with self.assertNumQueries(2):
+            results = Product.new_many([
+                {"name": "Pizza", "description": "Muzzarella", "price": 10, "quantity": 5},
+                {"name": "", "description": "Sin nombre", "price": 10},
+                {"name": "Fugazza", "description": "Cebolla", "price": 12},
+            ])
+
+        self.assertEqual([success for success, _ in results], [True, False, True])
+        self.assertIn("name", results[1][1])
+        self.assertEqual(Product.objects.count(), 2)
+        self.assertEqual(Product.objects.get(name="Fugazza").quantity, 0)
+
+    def test_update_many(self):
+        """Test que verifica que solo se actualizan los campos que cambiaron"""
+        pizza = Product.objects.create(name="Pizza", description="Muzzarella", price=10, quantity=5)
+        salad = Product.objects.create(name="Ensalada", description="César", price=8, quantity=5)
+
+        with self.assertNumQueries(5):
+            # SELECT, SAVEPOINT, UPDATE (un solo grupo de campos), INSERT en CatalogChange, RELEASE
+            results = Product.update_many([
+                {"pk": pizza.pk, "price": 12, "name": "Pizza"},
+                {"pk": salad.pk, "price": 9},
+                {"pk": 999, "price": 1},
+                {"pk": pizza.pk, "name": ""},
+            ])
+
+        self.assertEqual(results[0], (True, ["price"]))
+        self.assertEqual(results[1], (True, ["price"]))
+        self.assertFalse(results[2][0])
+        self.assertEqual(results[3], (False, {"name": "Por favor ingrese un nombre"}))
+        self.assertEqual(Product.objects.get(pk=pizza.pk).price, 12)
+        self.assertEqual(Product.objects.get(pk=pizza.pk).name, "Pizza")
+        self.assertEqual(Product.objects.get(pk=salad.pk).price, 9)
+
+    def test_update_many_nothing_changed(self):
+        """Test que verifica que no se escribe si no hay cambios"""
+        pizza = Product.objects.create(name="Pizza", description="Muzzarella", price=10, quantity=5)
+
+        with self.assertNumQueries(3):
+            results = Product.update_many([{"pk": pizza.pk, "price": 10, "quantity": 5}])
+
+        self.assertEqual(results, [(True, [])])
@@ -0,0 +1,36 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from menu_app.models import Order, Product
+from menu_app.query_plans import CANONICAL_QUERIES, audit
+
+
+class QueryPlanAuditTest(TestCase):
+    def test_canonical_queries_use_indexes(self):
+        """Test que verifica que ninguna consulta habitual recorre una tabla completa"""
+        failures = {name: problems for name, _, problems in audit() if problems}
+        self.assertEqual(failures, {})
+
+    def test_detects_full_scan(self):
+        """Test que verifica que se detecta un filtro sin índice"""
+        (name, _, problems), = audit({"por monto": lambda: Order.objects.filter(amount=10)})
+        self.assertTrue(problems)
+
+    def test_detects_sort_in_memory(self):
+        """Test que verifica que se detecta un ordenamiento sin índice"""
+        (name, _, problems), = audit({"por descripción": lambda: Product.objects.order_by("description")})
+        self.assertTrue(problems)
+
+    def test_command_fails_on_problems(self):
+        """Test que verifica que el comando falla si alguna consulta no usa índices"""
+        out = StringIO()
+        call_command("audit_query_plans", stdout=out)
+        self.assertIn("OK", out.getvalue())
+
+        extra = {"por monto": lambda: Order.objects.filter(amount=10)}
+        with mock.patch.dict(CANONICAL_QUERIES, extra), self.assertRaises(CommandError):
+            call_command("audit_query_plans", stdout=StringIO())
@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from menu_app import archive, recommendations
+from menu_app.models import (
+    Order,
+    OrderProduct,
+    Product,
+    ProductPair,
+    ProductRecommendation,
+    RecommendationCursor,
+    User,
+)
+
+
+class OrderPairsTest(SimpleTestCase):
+    def test_order_pairs_and_top_k(self):
+        """Test que verifica el conteo de pares por pedido y la selección de los K mejores"""
+        # Pedido 1: {1, 2, 3}; pedido 2: {1, 2} (con el 2 repetido); pedido 3: {4}
+        products, others, counts = recommendations.order_pairs(
+            [1, 1, 1, 2, 2, 2, 3], [1, 2, 3, 2, 1, 2, 4]
+        )
+        pairs = dict(zip(zip(products.tolist(), others.tolist()), counts.tolist()))
+        self.assertEqual(pairs, {(1, 2): 2, (2, 1): 2, (1, 3): 1, (3, 1): 1, (2, 3): 1, (3, 2): 1})
+
+        products, others, counts, ranks = recommendations.top_k(products, others, counts, k=1)
+        self.assertEqual(list(zip(products.tolist(), others.tolist(), ranks.tolist())), [(1, 2, 0), (2, 1, 0), (3, 1, 0)])
+
+
+class RecommendationsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="cliente", password="clave")
+        self.pizza, self.fugazza, self.beer, self.flan = [
+            Product.objects.create(name=name, description="Rico", price=10, quantity=100)
+            for name in ("Pizza", "Fugazza", "Cerveza", "Flan")
+        ]
+
+    def _order(self, *products):
+        Order.place(self.user, products)
+
+    def _recommended(self, product):
+        return list(
+            ProductRecommendation.objects.filter(product=product).values_list("recommended__name", "orders")
+        )
+
+    def test_incremental_refresh_matches_full(self):
+        """Test que verifica que la actualización incremental por lotes da lo mismo que recontar todo"""
+        self._order(self.pizza, self.beer)
+        self._order(self.pizza, self.beer, self.flan)
+        recommendations.refresh(batch_size=2)
+        self._order(self.pizza, self.fugazza)
+        self._order(self.fugazza, self.beer)
+        result = recommendations.refresh(batch_size=2)
+
+        self.assertEqual(result["orders"], 2)
+        self.assertEqual(self._recommended(self.pizza), [("Cerveza", 2), ("Fugazza", 1), ("Flan", 1)])
+        incremental = set(ProductPair.objects.values_list("product", "other", "orders"))
+
+        recommendations.refresh(full=True)
+        self.assertEqual(set(ProductPair.objects.values_list("product", "other", "orders")), incremental)
+        self.assertEqual(recommendations.refresh(), {"orders": 0, "products": 0})
+
+    def test_late_commit_counted(self):
+        """Test que verifica que un pedido confirmado después de otro con id mayor igual se cuenta"""
+        late, _ = Order.place(self.user, [self.pizza, self.beer])
+        other, _ = Order.place(self.user, [self.pizza, self.flan])
+        # Las líneas del primer pedido todavía no están visibles al contar.
+        lines = list(OrderProduct.objects.filter(order=late))
+        OrderProduct.objects.filter(order=late).delete()
+        self.assertEqual(recommendations.refresh()["orders"], 1)
+
+        OrderProduct.objects.bulk_create(lines)
+        result = recommendations.refresh()
+
+        self.assertEqual(result["orders"], 1)
+        self.assertEqual(self._recommended(self.pizza), [("Cerveza", 1), ("Flan", 1)])
+        self.assertEqual(recommendations.refresh(), {"orders": 0, "products": 0})
+        self.assertEqual(RecommendationCursor.objects.get().recent, [late.pk, other.pk])
+
+    def test_full_refresh_counts_archived_orders(self):
+        """Test que verifica que recontar todo incluye los pedidos archivados"""
+        old_day = timezone.localdate() - timedelta(days=400)
+        Order.place(self.user, [self.pizza, self.beer], buy_date=old_day)
+        Order.place(self.user, [self.pizza, self.flan], buy_date=old_day)
+        Order.objects.update(state="RECIBIDO")
+        self._order(self.pizza, self.beer)
+        recommendations.refresh()
+        archive.archive_all()
+        self.flan.delete()
+
+        result = recommendations.refresh(full=True)
+
+        self.assertEqual(result["orders"], 3)
+        self.assertEqual(self._recommended(self.pizza), [("Cerveza", 2)])
+
+    def test_detail_page_recommendations(self):
+        """Test que verifica que la página de detalle muestra las recomendaciones con una consulta extra"""
+        self._order(self.pizza, self.beer)
+        recommendations.refresh()
+        url = reverse("product_detail", args=[self.pizza.pk])
+        self.client.get(url)
+
+        # Producto y recomendaciones (el stock sale del cache)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertContains(response, "Los clientes también pidieron")
+        self.assertEqual(response.context["recommendations"], [self.beer])
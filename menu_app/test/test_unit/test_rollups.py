@@ -0,0 +1,151 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from menu_app import rollups
+from menu_app.test.seeding import SeededTestCase
+from menu_app.models import (
+    Category,
+    DailyCategorySales,
+    DailyProductSales,
+    DailyStateSales,
+    Order,
+    Product,
+    User,
+)
+
+
+class SalesRollupTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="cliente", password="clave")
+        self.pizzas = Category.objects.create(name="Pizzas")
+        self.pizza = Product.objects.create(
+            category=self.pizzas, name="Pizza", description="Muzzarella", price=500, quantity=10
+        )
+        self.fugazza = Product.objects.create(
+            category=self.pizzas, name="Fugazza", description="Cebolla", price=450, quantity=10
+        )
+        self.salad = Product.objects.create(
+            name="Ensalada", description="César", price=350, quantity=10
+        )
+        self.day = date(2025, 5, 1)
+
+    def _snapshot(self):
+        return (
+            sorted(DailyProductSales.objects.filter(units__gt=0).values_list("day", "product_id", "orders", "units", "revenue")),
+            sorted(DailyCategorySales.objects.filter(units__gt=0).values_list("day", "category_id", "orders", "units", "revenue"), key=str),
+            sorted(DailyStateSales.objects.filter(orders__gt=0).values_list("day", "state", "orders", "revenue")),
+        )
+
+    def test_place_updates_rollups(self):
+        """Test que verifica que crear un pedido actualiza los acumulados"""
+        Order.place(self.user, [self.pizza, self.fugazza], "A1", buy_date=self.day)
+        Order.place(self.user, [self.pizza], "A2", buy_date=self.day)
+
+        pizza = DailyProductSales.objects.get(day=self.day, product=self.pizza)
+        self.assertEqual((pizza.orders, pizza.units, pizza.revenue), (2, 2, Decimal("1000")))
+        category = DailyCategorySales.objects.get(day=self.day, category=self.pizzas)
+        self.assertEqual((category.orders, category.units), (2, 3))
+        state = DailyStateSales.objects.get(day=self.day, state="PREPARACION")
+        self.assertEqual((state.orders, state.revenue), (2, Decimal("1450")))
+
+    def test_cancel_subtracts_from_rollups(self):
+        """Test que verifica que cancelar un pedido descuenta sus ventas"""
+        order, _ = Order.place(self.user, [self.pizza, self.salad], "A1", buy_date=self.day)
+        Order.place(self.user, [self.pizza], "A2", buy_date=self.day)
+
+        order.transition("CANCELADO")
+
+        pizza = DailyProductSales.objects.get(day=self.day, product=self.pizza)
+        self.assertEqual(pizza.units, 1)
+        salad = DailyCategorySales.objects.get(day=self.day, category=None)
+        self.assertEqual(salad.units, 0)
+        self.assertEqual(DailyStateSales.objects.get(day=self.day, state="CANCELADO").orders, 1)
+        self.assertEqual(DailyStateSales.objects.get(day=self.day, state="PREPARACION").orders, 1)
+
+    def test_rebuild_matches_incremental(self):
+        """Test que verifica que la reconstrucción coincide con la actualización incremental"""
+        order, _ = Order.place(self.user, [self.pizza, self.salad], "A1", buy_date=self.day)
+        Order.place(self.user, [self.pizza, self.fugazza], "A2", buy_date=self.day)
+        Order.place(self.user, [self.fugazza], "A3", buy_date=date(2025, 5, 2))
+        Order.bulk_transition(Order.objects.filter(code="A1"), "CANCELADO")
+        Order.bulk_transition(Order.objects.filter(code="A2"), "ENVIADO")
+        incremental = self._snapshot()
+
+        call_command("rebuild_sales_rollups", stdout=StringIO())
+
+        self.assertEqual(self._snapshot(), incremental)
+        self.assertEqual(len(incremental[0]), 3)
+
+    def test_price_change_keeps_order_price(self):
+        """Test que verifica que cancelar y reconstruir usan el precio del momento del pedido"""
+        order, _ = Order.place(self.user, [self.pizza], "A1", buy_date=self.day)
+        Order.place(self.user, [self.pizza], "A2", buy_date=self.day)
+        self.pizza.update(price=800)
+
+        order.transition("CANCELADO")
+
+        pizza = DailyProductSales.objects.get(day=self.day, product=self.pizza)
+        self.assertEqual((pizza.units, pizza.revenue), (1, Decimal("500")))
+        incremental = self._snapshot()
+        rollups.rebuild()
+        self.assertEqual(self._snapshot(), incremental)
+
+    def test_accumulate_concurrent_create(self):
+        """Test que verifica que si otro proceso crea la fila del día se suma en lugar de fallar"""
+        update = QuerySet.update
+        raced = []
+
+        def racing_update(queryset, **kwargs):
+            if not raced:
+                # Otro proceso inserta la fila entre el UPDATE y el INSERT.
+                raced.append(True)
+                DailyStateSales.objects.create(day=self.day, state="ENVIADO", orders=1, revenue=10)
+                return 0
+            return update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, "update", racing_update):
+            DailyStateSales.accumulate({"day": self.day, "state": "ENVIADO"}, orders=1, revenue=5)
+
+        row = DailyStateSales.objects.get(day=self.day, state="ENVIADO")
+        self.assertEqual((row.orders, row.revenue), (2, Decimal("15")))
+
+    def test_top_products(self):
+        """Test que verifica el ranking de productos por rango de fechas"""
+        Order.place(self.user, [self.pizza, self.fugazza], "A1", buy_date=self.day)
+        Order.place(self.user, [self.pizza], "A2", buy_date=date(2025, 5, 3))
+        Order.place(self.user, [self.salad], "A3", buy_date=date(2025, 6, 1))
+
+        top = rollups.top_products(date(2025, 5, 1), date(2025, 5, 31))
+
+        self.assertEqual([row["product__name"] for row in top], ["Pizza", "Fugazza"])
+        self.assertEqual(top[0]["units"], 2)
+
+    def test_place_without_products(self):
+        """Test que verifica que no se crean pedidos vacíos"""
+        order, errors = Order.place(self.user, [], "A1")
+
+        self.assertIsNone(order)
+        self.assertIn("products", errors)
+        self.assertFalse(Order.objects.exists())
+
+
+class SeededRollupTest(SeededTestCase):
+    seeds = ("order_history",)
+
+    def _snapshot(self):
+        return SalesRollupTest._snapshot(self)
+
+    def test_incremental_matches_rebuild(self):
+        """Test que verifica que los acumulados incrementales coinciden con la reconstrucción"""
+        incremental = self._snapshot()
+        self.assertTrue(incremental[0])
+
+        rollups.rebuild()
+
+        self.assertEqual(self._snapshot(), incremental)
@@ -0,0 +1,37 @@
+from menu_app.models import Category, Product
+from menu_app.test.seeding import SeededTestCase, seed
+
+calls = []
+
+
+@seed("test_catalog")
+def test_catalog():
+    calls.append(1)
+    category = Category.objects.create(name="Pizzas")
+    Product.objects.bulk_create(
+        Product(category=category, name=f"Pizza {i}", description="Rica", price=10, quantity=i)
+        for i in range(30)
+    )
+
+
+class SeededFirstTest(SeededTestCase):
+    seeds = ("test_catalog",)
+
+    def test_seed_loaded(self):
+        """Test que verifica que la seed se cargó y se ejecutó una sola vez por proceso"""
+        self.assertEqual(Product.objects.filter(category__name="Pizzas").count(), 30)
+        self.assertEqual(len(calls), 1)
+
+
+class SeededSecondTest(SeededTestCase):
+    seeds = ("test_catalog",)
+
+    def test_seed_restored(self):
+        """Test que verifica que la foto restaura los mismos datos sin volver a ejecutar la seed"""
+        self.assertEqual(Product.objects.filter(category__name="Pizzas").count(), 30)
+        self.assertEqual(len(calls), 1)
+
+    def test_new_rows_after_restore(self):
+        """Test que verifica que se pueden crear filas nuevas después de restaurar"""
+        product = Product.objects.create(name="Fugazza", description="Cebolla", price=12, quantity=1)
+        self.assertGreater(product.pk, Product.objects.exclude(pk=product.pk).order_by("-pk")[0].pk)
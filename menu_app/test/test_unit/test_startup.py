@@ -0,0 +1,45 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from menu_app.management.commands.profile_startup import parse_importtime
+from menu_app.warmup import warm_up
+
+IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     c
+import time:       200 |        300 |   b
+import time:        50 |         50 |   d
+import time:      1000 |       1350 | a
+import time:        10 |         10 | e
+"""
+
+
+class ImportTimeParserTest(SimpleTestCase):
+    def test_parse_importtime_tree(self):
+        """Test que verifica el armado del árbol a partir de -X importtime"""
+        roots = parse_importtime(IMPORTTIME)
+
+        self.assertEqual([root["name"] for root in roots], ["a", "e"])
+        self.assertEqual(roots[0]["cumulative"], 1.35)
+        self.assertEqual([child["name"] for child in roots[0]["children"]], ["b", "d"])
+        self.assertEqual(roots[0]["children"][0]["children"][0]["name"], "c")
+
+
+class WarmUpTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_warm_up(self):
+        """Test que verifica que el warm-up solo ejecuta una consulta trivial"""
+        with self.assertNumQueries(1):
+            warm_up()
+
+    @override_settings(PAGE_CACHE_TTL=30)
+    def test_warm_up_primes_pages(self):
+        """Test que verifica que el warm-up deja el menú en el cache de páginas"""
+        warm_up()
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("menu"))
+        self.assertEqual(response.status_code, 200)
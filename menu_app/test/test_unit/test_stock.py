@@ -0,0 +1,135 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from menu_app import catalog_version, stock
+from menu_app.models import CatalogChange, Category, Order, OutOfStock, Product, User
+
+
+class StockTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="cliente", password="secreta")
+        category = Category.objects.create(name="Pizzas")
+        self.pizza = Product.objects.create(
+            category=category, name="Pizza", description="Muzzarella", price=10, quantity=5
+        )
+        self.fugazza = Product.objects.create(
+            category=category, name="Fugazza", description="Cebolla", price=12, quantity=1
+        )
+
+    def test_get_many_loads_once(self):
+        """Test que verifica que el stock se carga de la BD una vez y luego sale del cache"""
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                stock.get_many([self.pizza.pk, self.fugazza.pk]),
+                {self.pizza.pk: 5, self.fugazza.pk: 1},
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual(stock.get(self.pizza.pk), 5)
+
+    def test_order_moves_counter_and_database(self):
+        """Test que verifica que un pedido descuenta el stock en la BD y en el contador"""
+        stock.get_many([self.pizza.pk, self.fugazza.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            order, _ = Order.place(
+                self.user, [self.pizza, self.fugazza], quantities={self.pizza.pk: 2}
+            )
+
+        self.pizza.refresh_from_db()
+        self.assertEqual(self.pizza.quantity, 3)
+        with self.assertNumQueries(0):
+            self.assertEqual(stock.get(self.pizza.pk), 3)
+            self.assertFalse(stock.is_available(self.fugazza.pk))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            order.transition("CANCELADO")
+        self.assertEqual(stock.get(self.pizza.pk), 5)
+        self.assertTrue(stock.is_available(self.fugazza.pk))
+
+    def test_order_without_enough_stock(self):
+        """Test que verifica que un pedido sin stock suficiente no descuenta nada ni se crea"""
+        stock.get_many([self.pizza.pk, self.fugazza.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            order, errors = Order.place(
+                self.user, [self.pizza, self.fugazza], quantities={self.pizza.pk: 2, self.fugazza.pk: 2}
+            )
+
+        self.assertIsNone(order)
+        self.assertEqual(errors, {self.fugazza.pk: "No quedan unidades suficientes de Fugazza"})
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual(
+            dict(Product.objects.values_list("pk", "quantity")), {self.pizza.pk: 5, self.fugazza.pk: 1}
+        )
+        self.assertEqual(stock.get(self.pizza.pk), 5)
+
+    def test_move_stock_raises(self):
+        """Test que verifica que move_stock no deja el stock negativo"""
+        with self.assertRaises(OutOfStock) as raised:
+            Product.move_stock({self.pizza.pk: -6, self.fugazza.pk: -1, 999: -1})
+
+        self.assertEqual(raised.exception.product_ids, [self.pizza.pk, 999])
+        self.assertEqual(Product.objects.get(pk=self.fugazza.pk).quantity, 1)
+
+    @override_settings(STOCK_CACHE_TTL=60)
+    def test_counters_expire(self):
+        """Test que verifica que los contadores se guardan con vencimiento y no para siempre"""
+        with mock.patch.object(cache, "add", wraps=cache.add) as add, \
+                mock.patch.object(cache, "set_many", wraps=cache.set_many) as set_many:
+            stock.get(self.pizza.pk)
+            stock.reconcile()
+
+        self.assertEqual([call.kwargs["timeout"] for call in add.call_args_list], [60])
+        self.assertEqual([call.kwargs["timeout"] for call in set_many.call_args_list], [60])
+
+    def test_load_keeps_concurrent_counter(self):
+        """Test que verifica que cargar el stock no pisa un contador que otro proceso ya movió"""
+        add = cache.add
+
+        def concurrent_add(key, value, timeout):
+            # Otro worker cargó el contador y vendió tres unidades entre la lectura y el add.
+            cache.set(key, 2)
+            return add(key, value, timeout=timeout)
+
+        with mock.patch.object(cache, "add", side_effect=concurrent_add):
+            self.assertEqual(stock.get(self.pizza.pk), 2)
+        self.assertEqual(stock.get(self.pizza.pk), 2)
+
+    def test_orders_keep_catalog_version(self):
+        """Test que verifica que solo agotar o reponer un producto cambia la versión del catálogo"""
+        version = catalog_version.current()
+        before = CatalogChange.objects.count()
+        with self.captureOnCommitCallbacks(execute=True):
+            Order.place(self.user, [self.pizza])
+        self.assertEqual(catalog_version.current(), version)
+        self.assertEqual(CatalogChange.objects.count(), before)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            order, _ = Order.place(self.user, [self.fugazza])
+        self.assertNotEqual(catalog_version.current(), version)
+        self.assertEqual(list(CatalogChange.objects.values_list("object_id", flat=True)[before:]), [self.fugazza.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            order.transition("CANCELADO")
+        self.assertEqual(CatalogChange.objects.count(), before + 2)
+
+    def test_admin_edit_forgets_counter(self):
+        """Test que verifica que editar la cantidad descarta el contador y se recarga"""
+        stock.get(self.pizza.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pizza.update(quantity=40)
+        self.assertEqual(stock.get(self.pizza.pk), 40)
+
+    def test_reconcile(self):
+        """Test que verifica que reconcile corrige los contadores desalineados"""
+        stock.get_many([self.pizza.pk, self.fugazza.pk])
+        Product.objects.filter(pk=self.pizza.pk).update(quantity=0)
+
+        out = StringIO()
+        call_command("reconcile_stock", stdout=out, stderr=StringIO())
+
+        self.assertIn("1 contadores corregidos", out.getvalue())
+        self.assertFalse(stock.is_available(self.pizza.pk))
@@ -0,0 +1,33 @@
+from django.template import RequestContext, Template
+from django.test import RequestFactory, SimpleTestCase
+
+from menu_app.templatetags import navbar_link
+
+
+class NavbarLinkTest(SimpleTestCase):
+    def _render(self, path, source="{% navbar_link 'menu' 'Menu' %}"):
+        request = RequestFactory().get(path)
+        template = Template("{% load navbar_link %}" + source)
+        return template.render(RequestContext(request))
+
+    def test_navbar_link_active(self):
+        """Test que verifica el link activo según la ruta"""
+        self.assertIn("nav-link active", self._render("/menu/"))
+        self.assertNotIn("active", self._render("/"))
+
+    def test_navbar_active_section(self):
+        """Test que verifica que la clave de la barra es la sección activa y no el path"""
+        source = "{% navbar_active 'menu' 'cart' as section %}[{{ section }}]"
+        self.assertEqual(self._render("/menu/", source), "[menu]")
+        self.assertEqual(self._render("/no-existe/1/", source), "[]")
+        self.assertEqual(self._render("/no-existe/2/", source), "[]")
+
+    def test_reverse_is_memoized(self):
+        """Test que verifica que reverse se resuelve una sola vez por ruta"""
+        navbar_link._reverse_static.cache_clear()
+
+        self._render("/")
+        self._render("/menu/")
+
+        info = navbar_link._reverse_static.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
@@ -0,0 +1,71 @@
+from datetime import date, datetime, time, timezone as dt_timezone
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from menu_app import timeslots
+from menu_app.models import Table, TableTimeSlot, TimeSlot
+
+
+class TimeSlotCalendarTest(TestCase):
+    def setUp(self):
+        self.tables = [
+            Table.objects.create(capacity=4, description=f"Mesa {i}", is_reserved=False)
+            for i in range(3)
+        ]
+
+    def test_iter_slots_crosses_midnight(self):
+        """Test que verifica que un cierre a medianoche termina al día siguiente"""
+        slots = list(timeslots.iter_slots(date(2025, 5, 5), 1, [(time(20), time(0))], 120))
+
+        self.assertEqual(len(slots), 2)
+        self.assertEqual(slots[-1][1], datetime(2025, 5, 6, 0, tzinfo=dt_timezone.utc))
+
+    def test_non_positive_slot_minutes(self):
+        """Test que verifica que una duración de intervalo no positiva se rechaza"""
+        with self.assertRaises(ValueError):
+            list(timeslots.iter_slots(date(2025, 5, 5), 1, slot_minutes=0))
+        with self.assertRaises(CommandError):
+            call_command("generate_timeslots", "--slot-minutes", "-5")
+        self.assertFalse(TimeSlot.objects.exists())
+
+    def test_generate_is_idempotent(self):
+        """Test que verifica que generar dos veces no duplica intervalos ni vínculos"""
+        result = timeslots.generate(date(2025, 5, 5), 1, batch_size=7)
+        timeslots.generate(date(2025, 5, 5), 1, batch_size=7)
+
+        # 2 intervalos de almuerzo + 2 de cena por día
+        self.assertEqual(result, (28, 84))
+        self.assertEqual(TimeSlot.objects.count(), 28)
+        self.assertEqual(TableTimeSlot.objects.count(), 84)
+
+    def test_generate_unordered_hours(self):
+        """Test que verifica que los horarios no necesitan estar en orden cronológico"""
+        hours = [(time(20), time(0)), (time(12), time(16))]
+
+        result = timeslots.generate(date(2025, 5, 5), 1, hours=hours)
+
+        self.assertEqual(result, (28, 84))
+        self.assertEqual(TableTimeSlot.objects.count(), 84)
+
+    def test_purge(self):
+        """Test que verifica la purga por lotes de intervalos pasados"""
+        timeslots.generate(date(2025, 5, 5), 1)
+
+        deleted = timeslots.purge(datetime(2025, 5, 8, tzinfo=dt_timezone.utc), batch_size=5)
+
+        # El último intervalo del 7 termina justo a la medianoche del 8 y se conserva
+        self.assertEqual(deleted, 11)
+        self.assertEqual(TimeSlot.objects.count(), 17)
+        self.assertEqual(TableTimeSlot.objects.count(), 51)
+        self.assertFalse(
+            TimeSlot.objects.filter(end__lt=datetime(2025, 5, 8, tzinfo=dt_timezone.utc)).exists()
+        )
+
+    def test_purge_non_positive_arguments(self):
+        """Test que verifica que el comando de purga rechaza días y lotes no positivos"""
+        timeslots.generate(date(2025, 5, 5), 1)
+        for args in (["--keep-days", "-1"], ["--keep-days", "0"], ["--batch-size", "0"]):
+            with self.assertRaises(CommandError):
+                call_command("purge_timeslots", *args)
+        self.assertEqual(TimeSlot.objects.count(), 28)
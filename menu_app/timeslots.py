@@ -0,0 +1,109 @@
+from datetime import datetime, time, timedelta
+from itertools import islice, product
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Table, TableTimeSlot, TimeSlot
+
+
+# -------------------------------------------------------
+# timeslots.py
+# Generación masiva del calendario de intervalos (TimeSlot)
+# y su vínculo con las mesas (TableTimeSlot), más la purga
+# por lotes de los intervalos pasados.
+# -------------------------------------------------------
+
+# Horario por defecto: almuerzo y cena
+DEFAULT_HOURS = [(time(12), time(16)), (time(20), time(0))]
+
+
+def parse_hours(value):
+    """Convierte 'HH:MM-HH:MM' en una tupla (apertura, cierre)."""
+    opening, closing = value.split('-')
+    return time.fromisoformat(opening), time.fromisoformat(closing)
+
+
+def iter_slots(first_day, days, hours=None, slot_minutes=120):
+    """
+    Genera tuplas (start, end) para cada día a partir de `first_day`.
+    Un cierre menor o igual a la apertura corresponde al día siguiente.
+    """
+    if slot_minutes < 1:
+        raise ValueError("slot_minutes debe ser mayor a 0")
+    tz = timezone.get_current_timezone()
+    step = timedelta(minutes=slot_minutes)
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        for opening, closing in hours or DEFAULT_HOURS:
+            start = datetime.combine(day, opening, tzinfo=tz)
+            end = datetime.combine(day, closing, tzinfo=tz)
+            if end <= start:
+                end += timedelta(days=1)
+            while start + step <= end:
+                yield start, start + step
+                start += step
+
+
+def generate(first_day, weeks, hours=None, slot_minutes=120, tables=None, batch_size=500):
+    """
+    Crea los intervalos de `weeks` semanas y los vincula con `tables`
+    (por defecto, todas las mesas). Es idempotente: los intervalos y
+    vínculos existentes se ignoran gracias a sus restricciones únicas.
+    Devuelve (intervalos, vínculos) del rango, existentes o nuevos.
+    """
+    slots = list(iter_slots(first_day, weeks * 7, hours, slot_minutes))
+    if not slots:
+        return 0, 0
+
+    with transaction.atomic():
+        TimeSlot.objects.bulk_create(
+            (TimeSlot(start=start, end=end) for start, end in slots),
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        wanted = set(slots)
+        # Los horarios pueden venir en cualquier orden: el rango sale de los extremos.
+        starts = [start for start, _ in slots]
+        slot_ids = [
+            pk
+            for pk, start, end in TimeSlot.objects.filter(
+                start__gte=min(starts), start__lte=max(starts)
+            ).values_list('pk', 'start', 'end')
+            if (start, end) in wanted
+        ]
+
+    table_ids = (
+        [table.pk for table in tables]
+        if tables is not None
+        else list(Table.objects.values_list('pk', flat=True))
+    )
+    links = product(table_ids, slot_ids)
+    while True:
+        chunk = list(islice(links, batch_size))
+        if not chunk:
+            break
+        # Cada lote en su propia transacción para no retener el lock de escritura.
+        with transaction.atomic():
+            TableTimeSlot.objects.bulk_create(
+                (TableTimeSlot(table_id=table_id, timeslot_id=slot_id) for table_id, slot_id in chunk),
+                ignore_conflicts=True,
+            )
+    return len(slot_ids), len(slot_ids) * len(table_ids)
+
+
+def purge(before, batch_size=1000):
+    """
+    Borra por lotes los intervalos que terminaron antes de `before`
+    junto con sus vínculos a mesas. Devuelve la cantidad de intervalos borrados.
+    """
+    deleted = 0
+    while True:
+        ids = list(
+            TimeSlot.objects.filter(end__lt=before).order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        with transaction.atomic():
+            TableTimeSlot.objects.filter(timeslot_id__in=ids).delete()
+            deleted += TimeSlot.objects.filter(pk__in=ids).delete()[1].get(TimeSlot._meta.label, 0)
@@ -1,8 +1,30 @@
 from django.urls import path
-from .views import HomeView, MenuListView, ProductDetailView
+
+from .api import AvailabilityAPIView, CatalogChangesAPIView, CategoryListAPIView, ProductListAPIView
+from .views import (
+    AccountView,
+    CartUpdateView,
+    CartView,
+    CheckoutView,
+    HomeView,
+    MediaView,
+    MenuListView,
+    MetricsView,
+    ProductDetailView,
+)
 
 urlpatterns = [
     path("", HomeView.as_view(), name="home"),
     path("menu/", MenuListView.as_view(), name="menu"),
     path("menu/<int:pk>/", ProductDetailView.as_view(), name="product_detail"),
+    path("menu/changes/", CatalogChangesAPIView.as_view(), name="menu_changes"),
+    path("cart/", CartView.as_view(), name="cart"),
+    path("cart/<int:pk>/", CartUpdateView.as_view(), name="cart_update"),
+    path("cart/checkout/", CheckoutView.as_view(), name="checkout"),
+    path("account/", AccountView.as_view(), name="account"),
+    path("api/products/", ProductListAPIView.as_view(), name="api_products"),
+    path("api/categories/", CategoryListAPIView.as_view(), name="api_categories"),
+    path("api/availability/", AvailabilityAPIView.as_view(), name="api_availability"),
+    path("media/<path:name>", MediaView.as_view(), name="media"),
+    path("metrics", MetricsView.as_view(), name="metrics"),
 ]
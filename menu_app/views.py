@@ -1,12 +1,75 @@
+import mimetypes
+import os
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.files.storage import default_storage
+from django.db.models import Prefetch
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseForbidden, HttpResponseNotModified
+from django.middleware.csrf import get_token
+from django.shortcuts import redirect
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+from django.utils.http import parse_etags, urlencode
+from django.views import View
 from django.views.generic import TemplateView, ListView, DetailView
-from .models import Product
+
+from . import media_storage, metrics
+from .cart import Cart
+from .coalesce import get_or_compute
+from .ratelimit import RateLimitMixin, client_ip
+from .models import Booking, Notification, Order, Product, ProductRecommendation, TableTimeSlot
+
+
+class CoalescedPageMixin:
+    """
+    Cachea la página renderizada por URL con get_or_compute: ante muchos
+    requests simultáneos solo uno consulta la BD y renderiza.
+    Con PAGE_CACHE_TTL = 0 la vista se comporta como siempre.
+
+    La página compartida no lleva el token CSRF del visitante: cada request
+    se asegura de que tenga la cookie csrftoken y csrf.js la copia a los
+    formularios.
+
+    La clave es el path más solo los parámetros de `cache_query_params`:
+    los demás no cambian la página y agregarlos (?x=random) no debe
+    saltear el cache.
+    """
+    cache_query_params = ()
+
+    def page_cache_key(self, request):
+        params = [
+            (name, value)
+            for name in sorted(self.cache_query_params)
+            for value in request.GET.getlist(name)
+        ]
+        query = urlencode(params)
+        return f"page:{request.path}?{query}" if query else f"page:{request.path}"
+
+    def get(self, request, *args, **kwargs):
+        get_token(request)
+        if not settings.PAGE_CACHE_TTL:
+            return super().get(request, *args, **kwargs)
+
+        def render():
+            response = super(CoalescedPageMixin, self).get(request, *args, **kwargs)
+            response.render()
+            return response.status_code, response.content, response["Content-Type"]
+
+        status, content, content_type = get_or_compute(
+            self.page_cache_key(request),
+            render,
+            ttl=settings.PAGE_CACHE_TTL,
+            stale_ttl=settings.PAGE_CACHE_STALE,
+        )
+        return HttpResponse(content, status=status, content_type=content_type)
 
 
 class HomeView(TemplateView):
     template_name = "home.html"
 
 
-class MenuListView(ListView):
+class MenuListView(CoalescedPageMixin, ListView):
     model = Product
     template_name = "menu_app/menu.html"
     context_object_name = "menu_items"
@@ -19,7 +82,184 @@ class MenuListView(ListView):
         return context
 
 
-class ProductDetailView(DetailView):
+class ProductDetailView(CoalescedPageMixin, DetailView):
     model = Product
     template_name = "menu_app/product_detail.html"
     context_object_name = "product"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # Una consulta por el índice (product, rank) de la tabla precalculada
+        context["recommendations"] = [
+            row.recommended
+            for row in ProductRecommendation.objects.filter(product_id=self.object.pk)
+            .select_related("recommended")
+            .only("recommended__id", "recommended__name", "recommended__price", "recommended__image")
+        ]
+        return context
+
+
+class AccountView(LoginRequiredMixin, TemplateView):
+    """
+    Panel del usuario: pedidos recientes con sus productos, próximas
+    reservas con mesa e intervalo y notificaciones sin leer.
+    Usa una cantidad fija de consultas sin importar el historial.
+    """
+    template_name = "menu_app/account.html"
+    orders_per_page = 10
+    notifications_limit = 20
+
+    def get_page(self):
+        try:
+            return max(int(self.request.GET.get("page", 1)), 1)
+        except ValueError:
+            return 1
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        user = self.request.user
+        page = self.get_page()
+        offset = (page - 1) * self.orders_per_page
+
+        # Se pide un pedido de más para saber si hay otra página sin un COUNT.
+        orders = list(
+            Order.objects.filter(user=user)
+            .only("code", "buy_date", "amount", "state")
+            .order_by("-buy_date", "-pk")
+            .prefetch_related(Prefetch("products", queryset=Product.objects.only("name", "price")))
+            [offset:offset + self.orders_per_page + 1]
+        )
+        context["orders"] = orders[:self.orders_per_page]
+        context["page"] = page
+        context["has_next"] = len(orders) > self.orders_per_page
+
+        context["bookings"] = (
+            Booking.objects.filter(user=user, date__gte=timezone.localdate())
+            .only("code", "date", "time", "party_size", "approved")
+            .order_by("date", "time")
+            .prefetch_related(Prefetch(
+                "assignments",
+                queryset=TableTimeSlot.objects.select_related("table", "timeslot").only(
+                    "booking", "table", "table__capacity", "table__description",
+                    "timeslot", "timeslot__start", "timeslot__end",
+                ),
+            ))
+        )
+        context["notifications"] = (
+            Notification.objects.filter(users=user, is_read=False)
+            .only("title", "message", "created_at")
+            .order_by("-created_at")[:self.notifications_limit]
+        )
+        return context
+
+
+class CartView(TemplateView):
+    """Muestra el carrito con precios y stock revalidados en una sola consulta."""
+    template_name = "menu_app/cart.html"
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        items, errors = Cart.from_request(self.request).revalidate()
+        context["items"] = items
+        context["errors"] = {**errors, **kwargs.get("errors", {})}
+        context["total"] = sum(subtotal for _, _, subtotal in items)
+        return context
+
+
+class CartUpdateView(View):
+    """Agrega (quantity > 0) o quita (quantity = 0) un producto del carrito."""
+
+    def post(self, request, pk):
+        cart = Cart.from_request(request)
+        try:
+            quantity = int(request.POST.get("quantity", 1))
+        except ValueError:
+            quantity = 1
+        if quantity > 0:
+            cart.add(pk, quantity)
+        else:
+            cart.remove(pk)
+        response = redirect("cart")
+        cart.save(response)
+        return response
+
+
+class CheckoutView(LoginRequiredMixin, RateLimitMixin, CartView):
+    """Confirma el carrito como un pedido del usuario."""
+    rate_limit_scope = "checkout"
+
+    def post(self, request):
+        cart = Cart.from_request(request)
+        order, errors = cart.checkout(request.user)
+        if errors:
+            return self.render_to_response(self.get_context_data(errors=errors))
+        cart.clear()
+        response = redirect("account")
+        cart.save(response)
+        return response
+
+
+class MetricsView(View):
+    """
+    Métricas agregadas de todos los workers en formato Prometheus. Solo
+    responde a las IPs de METRICS_ALLOWED_IPS o a quien envíe METRICS_TOKEN
+    como "Authorization: Bearer <token>".
+    """
+
+    def get(self, request):
+        token = settings.METRICS_TOKEN
+        scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+        authorized = bool(token) and scheme.lower() == "bearer" and constant_time_compare(credentials, token)
+        if not authorized and client_ip(request) not in settings.METRICS_ALLOWED_IPS:
+            return HttpResponseForbidden()
+        return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+class MediaView(View):
+    """
+    Sirve las imágenes direccionadas por contenido. El archivo se entrega
+    con FileResponse (sendfile si el servidor WSGI lo ofrece), con soporte
+    de Range de un solo rango, ETag igual al SHA-256 e If-None-Match. El
+    nombre cambia si cambia el contenido: se cachea como inmutable.
+    """
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def get(self, request, name):
+        digest = media_storage.digest_of(name)
+        if digest is None:
+            raise Http404
+        etag = f'"{digest}"'
+        if {etag, "*"} & set(parse_etags(request.headers.get("If-None-Match", ""))):
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            response["Cache-Control"] = self.CACHE_CONTROL
+            return response
+
+        try:
+            file = open(default_storage.path(name), "rb")
+        except FileNotFoundError:
+            raise Http404
+        size = os.fstat(file.fileno()).st_size
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+        byte_range = None
+        if request.headers.get("If-Range", etag) == etag:
+            byte_range = media_storage.parse_range(request.headers.get("Range"), size)
+        if byte_range is False:
+            file.close()
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+        elif byte_range is None:
+            response = FileResponse(file, content_type=content_type)
+        else:
+            start, end = byte_range
+            file.seek(start)
+            response = FileResponse(
+                media_storage.FileRange(file, end - start + 1), status=206, content_type=content_type
+            )
+            response["Content-Length"] = end - start + 1
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Accept-Ranges"] = "bytes"
+        response["ETag"] = etag
+        response["Cache-Control"] = self.CACHE_CONTROL
+        return response
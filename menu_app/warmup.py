@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import connections
+from django.http import HttpRequest
+from django.template.loader import get_template
+from django.urls import get_resolver, resolve, reverse
+
+from .templatetags.navbar_link import reverse_static
+
+
+# -------------------------------------------------------
+# warmup.py
+# Precalentamiento del worker antes de aceptar tráfico:
+# carga el URLconf (y con él las vistas y el admin),
+# compila los templates principales en el loader cacheado,
+# memoiza las rutas de la barra, abre la conexión a la BD y
+# deja en el cache las páginas cacheadas más visitadas.
+# -------------------------------------------------------
+
+TEMPLATES = [
+    'base.html',
+    'home.html',
+    'menu_app/menu.html',
+    'menu_app/product_detail.html',
+]
+ROUTES = ['home', 'menu']
+# Páginas con CoalescedPageMixin que se renderizan al arrancar
+PAGES = ['menu']
+
+
+def warm_up(connect=True):
+    """
+    Deja el proceso listo para el primer request. Con un servidor que hace
+    fork después de cargar la app (gunicorn --preload) usar connect=False,
+    o llamarlo desde el hook post_fork, para no compartir la conexión.
+    Sin conexión tampoco se renderizan las páginas de PAGES.
+    """
+    get_resolver().url_patterns
+    for name in ROUTES:
+        reverse_static(name)
+    for name in TEMPLATES:
+        get_template(name)
+    if connect:
+        with connections['default'].cursor() as cursor:
+            cursor.execute('SELECT 1')
+        prime_pages()
+
+
+def prime_pages():
+    """
+    Renderiza las páginas de PAGES como un visitante anónimo para que
+    queden en el cache de páginas (y con ellas los fragmentos cacheados
+    de base.html). Si otro worker ya las dejó en un cache compartido no
+    se vuelven a renderizar. Con PAGE_CACHE_TTL = 0 no hace nada.
+    """
+    if not settings.PAGE_CACHE_TTL:
+        return
+    for name in PAGES:
+        request = HttpRequest()
+        request.method = 'GET'
+        request.path = request.path_info = reverse(name)
+        request.user = AnonymousUser()
+        match = resolve(request.path_info)
+        match.func(request, *match.args, **match.kwargs)
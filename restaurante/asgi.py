@@ -14,3 +14,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'restaurante.settings')
 
 application = get_asgi_application()
+
+# DJANGO_WARMUP=1 precalienta URLs, templates y la conexión a la BD
+# antes de que el worker acepte el primer request.
+if os.environ.get('DJANGO_WARMUP') == '1':
+    from menu_app.warmup import warm_up
+
+    warm_up()
@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 from pathlib import Path
 import os
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -23,17 +25,22 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = 'django-insecure-djn8$nd8*%*+hunfd9(df5-m9@i#_=+i1org!!88x$$*r2aeqt'
 
+# Perfil de producción: DJANGO_ENV=production
+PRODUCTION = os.environ.get('DJANGO_ENV') == 'production'
+
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = not PRODUCTION
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',') if PRODUCTION else []
 
 
 # Application definition
 
 INSTALLED_APPS = [
     'menu_app',
-    'django.contrib.admin',
+    # Sin autodiscover al arrancar: los módulos admin.py se cargan junto
+    # con el URLconf (restaurante/urls.py), en el primer request o warm-up.
+    'django.contrib.admin.apps.SimpleAdminConfig',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -43,6 +50,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'menu_app.middleware.MetricsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -64,11 +72,27 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'menu_app.context_processors.assets',
             ],
         },
     },
 ]
 
+if PRODUCTION:
+    # Loader cacheado explícito (requiere APP_DIRS = False) y tags del
+    # proyecto como builtins para no resolver {% load %} en cada template.
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+    TEMPLATES[0]['OPTIONS']['builtins'] = [
+        'menu_app.templatetags.navbar_link',
+        'menu_app.templatetags.to_validity_class',
+    ]
+
 
 WSGI_APPLICATION = 'restaurante.wsgi.application'
 
@@ -83,6 +107,24 @@ DATABASES = {
     }
 }
 
+# Cache
+# El coalescing de páginas, el rate limit, los contadores de stock y la
+# versión del catálogo viven en el cache: con varios workers tiene que ser
+# uno compartido (Redis, DJANGO_CACHE_URL). Sin DJANGO_CACHE_URL se usa
+# LocMem, que solo alcanza a un proceso: cada worker coalesce, limita y
+# cuenta por su lado.
+if os.environ.get('DJANGO_CACHE_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['DJANGO_CACHE_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    }
+
 # -------------------------------------------------------
 # Custom User Model
 # -------------------------------------------------------
@@ -123,8 +165,60 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.0/howto/static-files/
 
 STATIC_URL = 'static/'
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# Servir Bootstrap desde menu_app/static/vendor (ver `manage.py vendor_assets`)
+VENDOR_ASSETS = os.environ.get('DJANGO_VENDOR_ASSETS') == '1'
+
+# Imágenes subidas: direccionadas por contenido (una copia por foto),
+# servidas por MediaView con Range, ETag y cache inmutable.
+MEDIA_ROOT = BASE_DIR / 'media'
+MEDIA_URL = '/media/'
+
+STORAGES = {
+    'default': {'BACKEND': 'menu_app.media_storage.ContentAddressedStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+if PRODUCTION:
+    # Nombres con hash + variantes .gz/.br generadas por collectstatic,
+    # servidas por StaticAssetsMiddleware con cache inmutable.
+    STORAGES['staticfiles'] = {'BACKEND': 'menu_app.storage.CompressedManifestStaticFilesStorage'}
+    MIDDLEWARE.insert(1, 'menu_app.middleware.StaticAssetsMiddleware')
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Cache de páginas del menú con coalescing (segundos frescos / extra stale).
+# Desactivado fuera de producción para ver siempre los datos actuales.
+PAGE_CACHE_TTL = 30 if PRODUCTION else 0
+PAGE_CACHE_STALE = 300
+
+# Segundos que vive la versión del catálogo usada como ETag por la API
+CATALOG_VERSION_TTL = 60
+
+# Segundos que vive cada contador de stock del cache antes de recargarse
+STOCK_CACHE_TTL = 300
+
+# Detrás del balanceador, la IP del cliente viene en X-Forwarded-For
+TRUST_X_FORWARDED_FOR = os.environ.get('DJANGO_TRUST_X_FORWARDED_FOR') == '1'
+
+# Runner de tests: clona la BD por proceso con --parallel y acelera los hashers
+TEST_RUNNER = 'menu_app.test.runner.ParallelTestRunner'
+
+# Antigüedad a partir de la cual archive_cold_rows mueve pedidos,
+# calificaciones y notificaciones a las tablas de archivo
+ARCHIVE_AFTER_DAYS = int(os.environ.get('DJANGO_ARCHIVE_AFTER_DAYS', 365))
+
+# Directorio de los workers de este despliegue para agregar las métricas de
+# /metrics. En producción es obligatorio: cada servicio necesita el suyo.
+METRICS_DIR = os.environ.get('DJANGO_METRICS_DIR') or BASE_DIR / '.metrics'
+if PRODUCTION and not os.environ.get('DJANGO_METRICS_DIR'):
+    raise ImproperlyConfigured('DJANGO_METRICS_DIR es obligatorio en producción')
+
+# Acceso a /metrics: IPs permitidas (separadas por comas) o un token enviado
+# como "Authorization: Bearer <token>".
+METRICS_ALLOWED_IPS = os.environ.get('DJANGO_METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+METRICS_TOKEN = os.environ.get('DJANGO_METRICS_TOKEN')
@@ -18,7 +18,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+# INSTALLED_APPS usa SimpleAdminConfig para no registrar el admin al arrancar.
+admin.autodiscover()
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("accounts/", include("django.contrib.auth.urls")),
     path("", include("menu_app.urls")),
 ]